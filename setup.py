@@ -31,6 +31,7 @@ setup(
     python_requires=">=3.9",
     install_requires=[],
     extras_require={
+        "numpy": ["numpy>=1.22"],
         "dev": [
             "pytest>=8.0.0",
             "pytest-cov>=4.1.0",
@@ -41,4 +42,4 @@ setup(
             "mypy>=1.8.0",
         ],
     },
-)
\ No newline at end of file
+)
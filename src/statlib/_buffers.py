@@ -0,0 +1,73 @@
+"""
+Helpers for accepting buffer-protocol inputs without copying.
+
+Lists and tuples are used as they are. Objects that export the buffer
+protocol are wrapped in a flat ``memoryview`` so functions can index and
+iterate them directly, producing one Python number at a time instead of
+materializing a list of boxed values.
+"""
+
+import array
+import mmap
+from typing import Sequence, Union
+
+Number = Union[int, float]
+
+# Buffers whose contents are raw bytes: read as native float64 values
+_RAW_BYTE_TYPES = (bytes, bytearray, mmap.mmap)
+
+# Native single-item formats that memoryview.cast accepts and that hold numbers
+_NUMERIC_FORMATS = frozenset("bBhHiIlLqQfd")
+
+Buffer = Union[bytes, bytearray, memoryview, array.array, mmap.mmap]
+NumericData = Union[Sequence[Number], Buffer]
+
+
+def as_values(data: NumericData) -> Sequence[Number]:
+    """
+    Return ``data`` as an indexable sequence of numbers, without copying.
+
+    Parameters
+    ----------
+    data : Sequence[Union[int, float]] or buffer
+        A list/tuple of numbers, an ``array.array``, a ``memoryview`` of a
+        numeric format, or raw bytes (``bytes``, ``bytearray``, ``mmap``)
+        holding native float64 values
+
+    Returns
+    -------
+    Sequence[Union[int, float]]
+        ``data`` itself, or a flat memoryview over its buffer
+
+    Raises
+    ------
+    ValueError
+        If a buffer is not contiguous, or raw bytes are not a whole number
+        of float64 values
+    TypeError
+        If a buffer's format is not numeric
+    """
+    if isinstance(data, (list, tuple)):
+        return data
+
+    try:
+        view = memoryview(data)
+    except TypeError:
+        # Not a buffer: any other sequence is used as it is
+        return data
+
+    if isinstance(data, _RAW_BYTE_TYPES):
+        if view.nbytes % 8:
+            raise ValueError("Raw byte buffers must hold whole float64 values")
+        return view.cast("B").cast("d")
+
+    if not view.c_contiguous:
+        raise ValueError("Buffer inputs must be C-contiguous")
+
+    fmt = view.format.lstrip("@")
+    if fmt not in _NUMERIC_FORMATS:
+        raise TypeError(f"Unsupported buffer format: {view.format!r}")
+
+    if view.ndim != 1 or fmt != view.format:
+        view = view.cast("B").cast(fmt)
+    return view
@@ -0,0 +1,141 @@
+"""
+Optional NumPy acceleration backend.
+
+The library is dependency-free. When NumPy is installed, the core
+functions hand large inputs to vectorized NumPy kernels instead of
+looping in Python:
+
+- NumPy arrays and other numeric buffers are always dispatched, since
+  they can be viewed as arrays without copying.
+- Lists and tuples are converted only by functions whose pure-Python
+  path loops in Python (``variance``, ``stdev``, ``median``), and only
+  when they hold at least ``LIST_THRESHOLD`` values. ``mean`` and
+  ``data_range`` already run at C speed on lists.
+- ``normal_pdf`` and ``normal_cdf`` evaluate element-wise when ``x`` is
+  a NumPy array.
+- ``random_normal`` uses NumPy's generator only when the backend is
+  forced to ``"numpy"``, because it produces a different (but still
+  reproducible) stream for a given seed.
+
+Results agree with the pure-Python path to within a relative tolerance
+of 1e-12 on typical data. The two paths add values in a different
+order: NumPy uses pairwise summation, which is usually the more accurate
+of the two. Order statistics (median) are identical.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+_BACKENDS = ("auto", "python", "numpy")
+
+# Lists at least this long are converted to arrays by loop-heavy functions
+LIST_THRESHOLD = 4096
+
+_backend = "auto"
+
+
+def numpy_available() -> bool:
+    """Return True if NumPy could be imported."""
+    return np is not None
+
+
+def get_backend() -> str:
+    """
+    Return the active backend name.
+
+    Returns
+    -------
+    str
+        ``"auto"`` (default), ``"python"`` or ``"numpy"``
+    """
+    return _backend
+
+
+def set_backend(name: str) -> None:
+    """
+    Select how functions choose between NumPy and pure Python.
+
+    Parameters
+    ----------
+    name : str
+        ``"auto"``: dispatch arrays, buffers and large lists to NumPy when
+        it is installed; ``"python"``: always use the pure-Python code;
+        ``"numpy"``: convert every input to an array
+
+    Raises
+    ------
+    ValueError
+        If the name is unknown
+    ImportError
+        If ``"numpy"`` is requested but NumPy is not installed
+
+    Examples
+    --------
+    >>> set_backend("python")
+    >>> get_backend()
+    'python'
+    >>> set_backend("auto")
+    """
+    global _backend
+
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown backend: {name!r}")
+
+    if name == "numpy" and np is None:
+        raise ImportError("The numpy backend requires NumPy to be installed")
+
+    _backend = name
+
+
+@contextmanager
+def use_backend(name: str) -> Iterator[None]:
+    """
+    Temporarily select a backend within a ``with`` block.
+
+    Parameters
+    ----------
+    name : str
+        Backend name, as for ``set_backend``
+    """
+    previous = _backend
+    set_backend(name)
+    try:
+        yield
+    finally:
+        set_backend(previous)
+
+
+def _as_array(data: Sequence[Any], convert_lists: bool) -> Optional[Any]:
+    """
+    Return ``data`` as a 1-D ndarray if NumPy should handle it, else None.
+
+    ``data`` is the output of ``_buffers.as_values``: a list, a tuple or a
+    flat memoryview. Memoryviews are wrapped without copying. Lists are
+    copied into a float64 array only when forced or when ``convert_lists``
+    is set and the list is long enough to amortize the conversion.
+    """
+    if np is None or _backend == "python":
+        return None
+
+    if isinstance(data, memoryview):
+        return np.asarray(data)
+
+    if _backend == "numpy" or (convert_lists and len(data) >= LIST_THRESHOLD):
+        return np.asarray(data, dtype=np.float64)
+
+    return None
+
+
+def _is_array(x: Any) -> bool:
+    """Return True if ``x`` is an ndarray the NumPy backend should evaluate."""
+    return np is not None and _backend != "python" and isinstance(x, np.ndarray)
+
+
+def _forced() -> bool:
+    """Return True if the backend is forced to NumPy."""
+    return _backend == "numpy"
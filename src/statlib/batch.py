@@ -0,0 +1,177 @@
+"""
+Summary statistics of many small datasets in one call.
+
+Calling ``describe`` (or ``mean``, ``variance``...) once per series pays for
+argument validation, backend dispatch and nested calls every time, which
+dominates when each series holds only a handful of values. The functions
+here validate once, compute every statistic of a series in one inlined
+pass over it, and return the results column-wise in typed arrays.
+
+Series can be given as a sequence of sequences, or in a ragged layout: one
+flat sequence of values plus offsets marking where each series starts.
+"""
+
+import math
+from array import array
+from typing import Dict, Iterable, Iterator, Sequence, Union
+
+from ._buffers import NumericData, as_values
+
+Number = Union[int, float]
+
+# Keys of the result, in the same order as ``describe``
+_STATS = (
+    "mean",
+    "variance",
+    "pvariance",
+    "stdev",
+    "pstdev",
+    "min",
+    "max",
+    "range",
+    "median",
+)
+
+
+def batch_describe(series: Iterable[NumericData]) -> Dict[str, array]:
+    """
+    Compute summary statistics of each of many datasets.
+
+    Parameters
+    ----------
+    series : Iterable[Sequence[Union[int, float]] or buffer]
+        Datasets to summarize, each as accepted by ``describe``
+
+    Returns
+    -------
+    Dict[str, array.array]
+        One array per statistic, with one entry per series: ``count``
+        (typecode ``"q"``), and ``mean``, ``variance``, ``pvariance``,
+        ``stdev``, ``pstdev``, ``min``, ``max``, ``range`` and ``median``
+        (typecode ``"d"``). Entry ``i`` equals ``describe(series[i])``
+        computed by the pure-Python backend; sample statistics are NaN for
+        series with one value.
+
+    Raises
+    ------
+    ValueError
+        If any series is empty
+
+    Examples
+    --------
+    >>> result = batch_describe([[1, 2, 3, 4], [10, 20]])
+    >>> list(result["mean"])
+    [2.5, 15.0]
+    >>> list(result["median"])
+    [2.5, 15.0]
+
+    Notes
+    -----
+    Time Complexity: O(Σ nᵢ log nᵢ), from sorting each series for its median
+    Space Complexity: O(number of series)
+    """
+    return _describe_each(
+        s if isinstance(s, (list, tuple)) else as_values(s) for s in series
+    )
+
+
+def batch_describe_ragged(
+    values: NumericData, offsets: Sequence[int]
+) -> Dict[str, array]:
+    """
+    Compute summary statistics of datasets stored back to back.
+
+    Parameters
+    ----------
+    values : Sequence[Union[int, float]] or buffer
+        Values of every series, concatenated
+    offsets : Sequence[int]
+        ``m + 1`` increasing positions: series ``i`` is
+        ``values[offsets[i]:offsets[i + 1]]``, the first offset is 0 and
+        the last is ``len(values)``
+
+    Returns
+    -------
+    Dict[str, array.array]
+        Columnar results as returned by ``batch_describe``
+
+    Raises
+    ------
+    ValueError
+        If the offsets do not start at 0, end at ``len(values)`` and
+        strictly increase (a repeated offset would be an empty series)
+
+    Examples
+    --------
+    >>> result = batch_describe_ragged([1, 2, 3, 4, 10, 20], [0, 4, 6])
+    >>> list(result["count"]), list(result["max"])
+    ([4, 2], [4.0, 20.0])
+
+    Notes
+    -----
+    The ragged layout avoids building one object per series; with a
+    buffer of values each series is a zero-copy slice.
+    Time Complexity: O(Σ nᵢ log nᵢ)
+    Space Complexity: O(number of series)
+    """
+    values = as_values(values)
+
+    if not offsets or offsets[0] != 0 or offsets[-1] != len(values):
+        raise ValueError("Offsets must start at 0 and end at len(values)")
+
+    for i in range(1, len(offsets)):
+        if offsets[i] <= offsets[i - 1]:
+            raise ValueError(f"Offsets must strictly increase (series {i - 1})")
+
+    return _describe_each(
+        values[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)
+    )
+
+
+def _describe_each(series: Iterator[Sequence[Number]]) -> Dict[str, array]:
+    """Summarize each series with the same arithmetic as the scalar functions."""
+    counts = array("q")
+    columns = {name: array("d") for name in _STATS}
+    means = columns["mean"].append
+    svars = columns["variance"].append
+    pvars = columns["pvariance"].append
+    sstds = columns["stdev"].append
+    pstds = columns["pstdev"].append
+    mins = columns["min"].append
+    maxs = columns["max"].append
+    ranges = columns["range"].append
+    medians = columns["median"].append
+    nan = math.nan
+
+    for i, data in enumerate(series):
+        n = len(data)
+        if not n:
+            raise ValueError(f"Cannot compute summary of empty dataset (series {i})")
+
+        # Same summation order as mean() and variance(), so results match
+        # them exactly
+        data_mean = sum(data) / n
+        squared = sum([(x - data_mean) ** 2 for x in data])
+        pvar = squared / n
+        svar = squared / (n - 1) if n > 1 else nan
+
+        lowest = min(data)
+        highest = max(data)
+        ordered = sorted(data)
+        mid = n // 2
+
+        counts.append(n)
+        means(data_mean)
+        svars(svar)
+        pvars(pvar)
+        sstds(svar**0.5)
+        pstds(pvar**0.5)
+        mins(lowest)
+        maxs(highest)
+        ranges(highest - lowest)
+        if n % 2 == 1:
+            medians(ordered[mid])
+        else:
+            medians((ordered[mid - 1] + ordered[mid]) / 2.0)
+
+    return {"count": counts, **columns}
@@ -0,0 +1,411 @@
+"""
+An immutable dataset that caches the expensive state behind its statistics.
+
+The free functions in ``statlib.descriptive`` start from scratch on every
+call: ``median`` selects again, ``quantiles`` partitions again and
+``variance`` recomputes the mean. ``Dataset`` copies the values once into a
+compact float64 array and computes derived state only when a query first
+needs it, then keeps it:
+
+- the sorted values, which turn every order statistic (median, quantiles,
+  k-th smallest, rank of a value) into an index or a binary search
+- the sum and the sum of squared deviations from the mean
+- the minimum and maximum
+- histograms, per bin count and range
+
+Cached state is reported by ``cache_info`` and can be dropped with
+``clear_cache``; it is recomputed on demand afterwards.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from . import backend as _backend
+from ._buffers import NumericData, as_values
+from .descriptive import (
+    _QUANTILE_METHODS,
+    _interpolate,
+    _quantile_position,
+    _sum_squared_deviations,
+)
+from .streaming import _bin_counts, _default_range
+
+
+class Dataset:
+    """
+    Immutable numeric dataset with lazily computed, memoized statistics.
+
+    Parameters
+    ----------
+    data : Sequence[Union[int, float]] or buffer
+        Input values, as accepted by ``statlib.descriptive.describe``. They
+        are copied into a float64 array, so later changes to ``data`` do not
+        affect the dataset; integers beyond 2**53 lose precision.
+
+    Raises
+    ------
+    ValueError
+        If data is empty
+
+    Examples
+    --------
+    >>> ds = Dataset([4, 1, 3, 2, 5])
+    >>> ds.median(), ds.quantiles([0.25, 0.75])
+    (3.0, [2.0, 4.0])
+    >>> ds.rank(3.5)
+    3
+    >>> ds.cache_info()["sorted"]
+    40
+
+    Notes
+    -----
+    Results equal the corresponding free functions applied to the same
+    float64 values on the pure-Python backend; with NumPy they agree up to
+    rounding.
+    Space Complexity: O(n) for the values, plus O(n) once sorted
+    """
+
+    __slots__ = ("_values", "_n", "_sorted", "_sum", "_m2", "_min", "_max", "_hists")
+
+    def __init__(self, data: NumericData) -> None:
+        values = as_values(data)
+        if not len(values):
+            raise ValueError("Cannot create Dataset from empty data")
+
+        if isinstance(values, memoryview) and values.format == "d":
+            self._values = array("d", values.tobytes())
+        else:
+            self._values = array("d", values)
+        self._n = len(self._values)
+        self._reset()
+
+    def _reset(self) -> None:
+        """Forget every derived value."""
+        self._sorted: Optional[array] = None
+        self._sum: Optional[float] = None
+        self._m2: Optional[float] = None
+        self._min: Optional[float] = None
+        self._max: Optional[float] = None
+        self._hists: Dict[Tuple[int, float, float], Tuple[array, array]] = {}
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._values)
+
+    def __getitem__(self, index: int) -> float:
+        return self._values[index]
+
+    def __repr__(self) -> str:
+        return f"Dataset(n={self._n})"
+
+    @property
+    def values(self) -> memoryview:
+        """Read-only float64 view of the values, in their original order."""
+        return memoryview(self._values).toreadonly()
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the values themselves, excluding cached state."""
+        return self._n * self._values.itemsize
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Return the bytes held by each cached view.
+
+        Returns
+        -------
+        Dict[str, int]
+            Bytes per computed view: ``sorted`` for the sorted copy,
+            ``histograms`` for all cached histogram counts and edges, and
+            ``moments`` for the cached sum, deviations and extremes.
+            Views not computed yet are absent.
+        """
+        info: Dict[str, int] = {}
+        if self._sorted is not None:
+            info["sorted"] = len(self._sorted) * self._sorted.itemsize
+        if self._hists:
+            info["histograms"] = sum(
+                len(counts) * counts.itemsize + len(edges) * edges.itemsize
+                for counts, edges in self._hists.values()
+            )
+        scalars = (self._sum, self._m2, self._min, self._max)
+        cached = sum(x is not None for x in scalars)
+        if cached:
+            info["moments"] = cached * self._values.itemsize
+        return info
+
+    def clear_cache(self) -> None:
+        """Release all cached views; they are recomputed when next needed."""
+        self._reset()
+
+    def sorted_values(self) -> memoryview:
+        """
+        Return the values in ascending order, as a read-only view.
+
+        Notes
+        -----
+        Time Complexity: O(n log n) on first use, O(1) afterwards
+        Space Complexity: O(n), kept until ``clear_cache``
+        """
+        return memoryview(self._sorted_array()).toreadonly()
+
+    def mean(self) -> float:
+        """Return the arithmetic mean (O(n) on first use, then O(1))."""
+        return self._total() / self._n
+
+    def variance(self, sample: bool = True) -> float:
+        """
+        Return the variance.
+
+        Parameters
+        ----------
+        sample : bool, default=True
+            If True, divide by n-1; if False, divide by n
+
+        Raises
+        ------
+        ValueError
+            If sample variance requested with < 2 values
+        """
+        if sample and self._n < 2:
+            raise ValueError("Sample variance requires at least 2 data points")
+
+        m2 = self._deviations()
+        return m2 / (self._n - 1) if sample else m2 / self._n
+
+    def stdev(self, sample: bool = True) -> float:
+        """Return the standard deviation, the square root of ``variance``."""
+        return self.variance(sample) ** 0.5
+
+    def min(self) -> float:
+        """Return the smallest value (O(n) on first use, then O(1))."""
+        if self._min is None:
+            self._extremes()
+        return self._min
+
+    def max(self) -> float:
+        """Return the largest value (O(n) on first use, then O(1))."""
+        if self._max is None:
+            self._extremes()
+        return self._max
+
+    def data_range(self) -> float:
+        """Return the difference between the largest and smallest value."""
+        return self.max() - self.min()
+
+    def median(self) -> float:
+        """
+        Return the median.
+
+        Notes
+        -----
+        Time Complexity: O(n log n) on first order-statistic query, O(1)
+        afterwards
+        """
+        ordered = self._sorted_array()
+        mid = self._n // 2
+        if self._n % 2 == 1:
+            return ordered[mid]
+        return (ordered[mid - 1] + ordered[mid]) / 2.0
+
+    def select(self, k: int) -> float:
+        """
+        Return the k-th smallest value (0-based), as ``descriptive.select``.
+
+        Raises
+        ------
+        ValueError
+            If k is out of range
+        """
+        if not 0 <= k < self._n:
+            raise ValueError(f"k must be between 0 and {self._n - 1}")
+
+        return self._sorted_array()[k]
+
+    def quantiles(self, probs: Sequence[float], method: str = "linear") -> List[float]:
+        """
+        Return several quantiles, as ``descriptive.quantiles``.
+
+        Parameters
+        ----------
+        probs : Sequence[float]
+            Probabilities in [0, 1]
+        method : str, default="linear"
+            Any method accepted by ``descriptive.quantiles``
+
+        Raises
+        ------
+        ValueError
+            If a probability is outside [0, 1] or the method is unknown
+
+        Notes
+        -----
+        Time Complexity: O(m) for m probabilities once sorted
+        """
+        if method not in _QUANTILE_METHODS:
+            raise ValueError(f"Unknown quantile method: {method!r}")
+
+        for p in probs:
+            if not 0.0 <= p <= 1.0:
+                raise ValueError("Probabilities must be between 0 and 1")
+
+        ordered = self._sorted_array()
+        result = []
+        for p in probs:
+            lo, hi, frac = _quantile_position(self._n, p, method)
+            result.append(_interpolate(ordered[lo], ordered[hi], frac))
+        return result
+
+    def rank(self, x: float) -> int:
+        """
+        Return the number of values less than or equal to x.
+
+        Notes
+        -----
+        Time Complexity: O(log n) once sorted
+        """
+        return bisect_right(self._sorted_array(), x)
+
+    def count_between(self, low: float, high: float) -> int:
+        """
+        Return the number of values in the closed interval [low, high].
+
+        Notes
+        -----
+        Time Complexity: O(log n) once sorted
+        """
+        if high < low:
+            return 0
+
+        ordered = self._sorted_array()
+        return bisect_right(ordered, high) - bisect_left(ordered, low)
+
+    def histogram(
+        self, bins: int = 10, value_range: Optional[Tuple[float, float]] = None
+    ) -> Tuple[List[int], List[float]]:
+        """
+        Count values in equal-width bins, as ``parallel.histogram``.
+
+        Parameters
+        ----------
+        bins : int, default=10
+            Number of equal-width bins (must be positive)
+        value_range : Tuple[float, float], optional
+            Lower and upper edges; defaults to the minimum and maximum
+
+        Returns
+        -------
+        Tuple[List[int], List[float]]
+            ``bins`` counts and the ``bins + 1`` edges, as new lists
+
+        Raises
+        ------
+        ValueError
+            If bins is not positive or the range is not increasing
+
+        Notes
+        -----
+        Each distinct (bins, range) is computed once and cached.
+        Time Complexity: O(n) on first use, O(bins) afterwards
+        """
+        if bins <= 0:
+            raise ValueError("Number of bins must be positive")
+
+        if value_range is None:
+            low, high = _default_range(self.min(), self.max())
+        else:
+            low, high = float(value_range[0]), float(value_range[1])
+            if not low < high:
+                raise ValueError("Histogram range must be increasing")
+
+        key = (bins, low, high)
+        cached = self._hists.get(key)
+        if cached is None:
+            counts = array("q", _bin_counts(self._values_view(), low, high, bins))
+            width = (high - low) / bins
+            edges = array("d", [low + i * width for i in range(bins)] + [high])
+            cached = self._hists[key] = (counts, edges)
+
+        return cached[0].tolist(), cached[1].tolist()
+
+    def describe(self) -> Dict[str, float]:
+        """
+        Return the summary of ``descriptive.describe`` from cached state.
+
+        Sample statistics are NaN when the dataset has a single value.
+        """
+        n = self._n
+        pvar = self.variance(sample=False)
+        svar = self.variance(sample=True) if n > 1 else float("nan")
+        return {
+            "count": n,
+            "mean": self.mean(),
+            "variance": svar,
+            "pvariance": pvar,
+            "stdev": svar**0.5,
+            "pstdev": pvar**0.5,
+            "min": self.min(),
+            "max": self.max(),
+            "range": self.data_range(),
+            "median": self.median(),
+        }
+
+    def _values_view(self) -> memoryview:
+        """Flat view of the values for the backend-dispatching helpers."""
+        return memoryview(self._values)
+
+    def _sorted_array(self) -> array:
+        """The sorted copy of the values, computed on first use."""
+        if self._sorted is None:
+            if _backend._as_array(self._values_view(), convert_lists=False) is None:
+                ordered = array("d", sorted(self._values))
+            else:
+                ordered = array("d", self._values)
+                # Sorts the copy in place through a zero-copy view
+                values = _backend._as_array(memoryview(ordered), convert_lists=False)
+                values.sort()
+                del values
+            self._sorted = ordered
+            self._min = ordered[0]
+            self._max = ordered[-1]
+        return self._sorted
+
+    def _total(self) -> float:
+        """The sum of the values, computed on first use."""
+        if self._sum is None:
+            values = _backend._as_array(self._values_view(), convert_lists=False)
+            if values is not None:
+                self._sum = float(values.sum())
+            else:
+                self._sum = sum(self._values)
+        return self._sum
+
+    def _deviations(self) -> float:
+        """The sum of squared deviations from the mean, computed on first use."""
+        if self._m2 is None:
+            center = self.mean()
+            values = _backend._as_array(self._values_view(), convert_lists=False)
+            if values is not None:
+                deviations = values - center
+                self._m2 = float(deviations @ deviations)
+            else:
+                self._m2 = _sum_squared_deviations(self._values, center)
+        return self._m2
+
+    def _extremes(self) -> None:
+        """Compute the minimum and maximum, reusing the sorted copy if any."""
+        if self._sorted is not None:
+            self._min = self._sorted[0]
+            self._max = self._sorted[-1]
+            return
+
+        values = _backend._as_array(self._values_view(), convert_lists=False)
+        if values is not None:
+            self._min = float(values.min())
+            self._max = float(values.max())
+        else:
+            self._min = min(self._values)
+            self._max = max(self._values)
@@ -2,13 +2,58 @@
 Descriptive statistics functions.
 
 This module provides basic descriptive statistics calculations
-including mean, median, mode, variance, and standard deviation.
-"""
+including mean, median, mode, variance, standard deviation, skewness
+and kurtosis.
 
-from typing import List, Union
+Every function accepts a list of numbers or any buffer-protocol object
+holding numbers: ``array.array``, a ``memoryview`` of a numeric format, or
+raw ``bytes``/``bytearray``/``mmap`` contents read as native float64.
+Buffers are processed in place, without first converting them to a list.
 
+When NumPy is installed, ``mean``, ``median``, ``variance``, ``stdev``
+and ``data_range`` run on vectorized kernels for arrays, buffers and
+large lists; see ``statlib.backend``.
+"""
 
-def mean(data: List[Union[int, float]]) -> float:
+import math
+import sys
+from collections import Counter
+from itertools import islice
+from operator import itemgetter, mul
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    MutableSequence,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from . import backend as _backend
+from ._buffers import NumericData, as_values
+
+# Partitions at or below this size are finished with a sort
+_SELECT_CUTOFF = 2048
+
+# Deviations materialized per block when summing higher central moments
+_MOMENT_BLOCK = 4096
+
+# Quantile methods: the 0-based position of quantile p is a + (n + b) * p
+_QUANTILE_METHODS = {
+    "linear": (0.0, -1.0),
+    "lower": (0.0, -1.0),
+    "higher": (0.0, -1.0),
+    "nearest": (0.0, -1.0),
+    "midpoint": (0.0, -1.0),
+    "hazen": (-0.5, 0.0),
+    "weibull": (-1.0, 1.0),
+    "median_unbiased": (-2.0 / 3.0, 1.0 / 3.0),
+}
+
+
+def mean(data: NumericData) -> float:
     """
     Calculate the arithmetic mean (average) of a dataset.
 
@@ -16,8 +61,8 @@ def mean(data: List[Union[int, float]]) -> float:
 
     Parameters
     ----------
-    data : List[Union[int, float]]
-        A list of numeric values
+    data : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
 
     Returns
     -------
@@ -44,13 +89,18 @@ def mean(data: List[Union[int, float]]) -> float:
     Time Complexity: O(n) where n is the length of data
     Space Complexity: O(1)
     """
+    data = as_values(data)
     if not data:
         raise ValueError("Cannot compute mean of empty dataset")
 
+    array = _backend._as_array(data, convert_lists=False)
+    if array is not None:
+        return float(array.mean())
+
     return sum(data) / len(data)
 
 
-def median(data: List[Union[int, float]]) -> float:
+def median(data: NumericData, in_place: bool = False) -> float:
     """
     Calculate the median (middle value) of a dataset.
 
@@ -59,8 +109,12 @@ def median(data: List[Union[int, float]]) -> float:
 
     Parameters
     ----------
-    data : List[Union[int, float]]
-        A list of numeric values
+    data : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
+    in_place : bool, default=False
+        If True, reorder ``data`` itself instead of working on a copy.
+        ``data`` must then be a mutable sequence; its contents are kept
+        but their order is changed.
 
     Returns
     -------
@@ -82,26 +136,189 @@ def median(data: List[Union[int, float]]) -> float:
 
     Notes
     -----
-    Time Complexity: O(n log n) due to sorting
-    Space Complexity: O(n) for the sorted copy
+    Uses selection (see ``select``) rather than a full sort.
+    Time Complexity: O(n) expected, O(n log n) worst case
+    Space Complexity: O(n) for partition copies, O(1) extra when in_place
     """
+    data = as_values(data)
     if not data:
         raise ValueError("Cannot compute median of empty dataset")
 
-    sorted_data = sorted(data)
-    n = len(sorted_data)
+    n = len(data)
+    mid = n // 2
+
+    if in_place and isinstance(data, memoryview) and not data.readonly:
+        array = _backend._as_array(data, convert_lists=False)
+        if array is not None:
+            # Partitions the caller's buffer through a zero-copy view
+            array.partition(mid)
+            if n % 2 == 1:
+                return float(array[mid])
+            return (float(array[:mid].max()) + float(array[mid])) / 2.0
+
+    if not in_place:
+        array = _backend._as_array(data, convert_lists=True)
+        if array is not None:
+            return float(_backend.np.median(array))
+
+    if in_place:
+        upper = _nth_element(data, mid)
+        if n % 2 == 1:
+            return float(upper)
+        # Everything left of position mid is <= upper after partitioning
+        lower = max(islice(data, mid))
+        return (lower + upper) / 2.0
 
     if n % 2 == 1:
         # Odd length: return middle element
-        return float(sorted_data[n // 2])
-    else:
-        # Even length: return average of two middle elements
-        mid1 = sorted_data[n // 2 - 1]
-        mid2 = sorted_data[n // 2]
-        return (mid1 + mid2) / 2.0
+        return float(_select_ranks(data, [mid])[mid])
+
+    # Even length: return average of two middle elements
+    ranks = _select_ranks(data, [mid - 1, mid])
+    return (ranks[mid - 1] + ranks[mid]) / 2.0
+
+
+def select(data: NumericData, k: int, in_place: bool = False) -> float:
+    """
+    Return the k-th smallest value of a dataset (0-based).
+
+    ``select(data, k)`` equals ``sorted(data)[k]`` without sorting. With
+    ``in_place=True`` it behaves like C++ ``nth_element``: ``data`` is
+    partially reordered so that ``data[k]`` holds the result, every value
+    before it is <= the result and every value after it is >= the result.
+
+    Parameters
+    ----------
+    data : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
+    k : int
+        Rank of the value to return, with 0 <= k < len(data)
+    in_place : bool, default=False
+        If True, partition ``data`` itself instead of working on a copy.
+        ``data`` must then be a mutable sequence.
+
+    Returns
+    -------
+    float
+        The k-th smallest value
+
+    Raises
+    ------
+    ValueError
+        If the input list is empty or k is out of range
+
+    Examples
+    --------
+    >>> select([9, 1, 8, 2, 7], 0)
+    1.0
+
+    >>> select([9, 1, 8, 2, 7], 3)
+    8.0
+
+    Notes
+    -----
+    Introselect: quickselect with median-of-three pivots, falling back to
+    sorting when the partitions stop shrinking, so the worst case is
+    bounded by O(n log n).
+    Time Complexity: O(n) expected, O(n log n) worst case
+    Space Complexity: O(n) for partition copies, O(1) extra when in_place
+    """
+    data = as_values(data)
+    if not data:
+        raise ValueError("Cannot select from empty dataset")
+
+    n = len(data)
+    if not 0 <= k < n:
+        raise ValueError(f"k must be between 0 and {n - 1}")
+
+    if in_place:
+        return float(_nth_element(data, k))
 
+    return float(_select_ranks(data, [k])[k])
 
-def variance(data: List[Union[int, float]], sample: bool = True) -> float:
+
+def quantiles(
+    data: NumericData, probs: Sequence[float], method: str = "linear"
+) -> List[float]:
+    """
+    Calculate several quantiles (percentiles) of a dataset at once.
+
+    All order statistics needed for the requested probabilities are found
+    by one multi-rank selection over the data, so asking for p50, p90 and
+    p99 together costs about the same as asking for one of them.
+
+    Parameters
+    ----------
+    data : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
+    probs : Sequence[float]
+        Probabilities in [0, 1], e.g. ``[0.5, 0.9, 0.99]``
+    method : str, default="linear"
+        How to estimate a quantile that falls between two data points:
+
+        - ``"linear"``: interpolate at position (n-1)p (NumPy default,
+          Hyndman & Fan type 7)
+        - ``"lower"`` / ``"higher"``: the data point below / above
+        - ``"nearest"``: the closest data point (ties to the even index)
+        - ``"midpoint"``: average of the points below and above
+        - ``"hazen"``: interpolate at position np + 1/2 (type 5)
+        - ``"weibull"``: interpolate at position (n+1)p (type 6, as in
+          ``statistics.quantiles``)
+        - ``"median_unbiased"``: interpolate at position (n+1/3)p + 1/3
+          (type 8)
+
+        Positions are 1-based as in Hyndman & Fan.
+
+    Returns
+    -------
+    List[float]
+        One quantile per probability, in the order given
+
+    Raises
+    ------
+    ValueError
+        If the input list is empty, a probability is outside [0, 1] or
+        the method is unknown
+
+    Examples
+    --------
+    >>> quantiles([1, 2, 3, 4, 5], [0.25, 0.5, 0.75])
+    [2.0, 3.0, 4.0]
+
+    >>> quantiles([1, 2, 3, 4], [0.5], method="lower")
+    [2.0]
+
+    Notes
+    -----
+    For p=0.5 every interpolating method and "midpoint" return exactly
+    ``median(data)``.
+    Time Complexity: O(n log m) expected for m distinct probabilities
+    Space Complexity: O(n) for partition copies
+    """
+    data = as_values(data)
+    if not data:
+        raise ValueError("Cannot compute quantiles of empty dataset")
+
+    if method not in _QUANTILE_METHODS:
+        raise ValueError(f"Unknown quantile method: {method!r}")
+
+    for p in probs:
+        if not 0.0 <= p <= 1.0:
+            raise ValueError("Probabilities must be between 0 and 1")
+
+    n = len(data)
+    positions = [_quantile_position(n, p, method) for p in probs]
+
+    ranks = set()
+    for lo, hi, _ in positions:
+        ranks.add(lo)
+        ranks.add(hi)
+    values = _select_ranks(data, list(ranks)) if ranks else {}
+
+    return [_interpolate(values[lo], values[hi], frac) for lo, hi, frac in positions]
+
+
+def variance(data: NumericData, sample: bool = True) -> float:
     """
     Calculate the variance of a dataset.
 
@@ -109,8 +326,8 @@ def variance(data: List[Union[int, float]], sample: bool = True) -> float:
 
     Parameters
     ----------
-    data : List[Union[int, float]]
-        A list of numeric values
+    data : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
     sample : bool, default=True
         If True, calculate sample variance (divide by n-1)
         If False, calculate population variance (divide by n)
@@ -140,15 +357,19 @@ def variance(data: List[Union[int, float]], sample: bool = True) -> float:
     Time Complexity: O(n)
     Space Complexity: O(1)
     """
+    data = as_values(data)
     if not data:
         raise ValueError("Cannot compute variance of empty dataset")
 
     if sample and len(data) < 2:
         raise ValueError("Sample variance requires at least 2 data points")
 
+    array = _backend._as_array(data, convert_lists=True)
+    if array is not None:
+        return float(array.var(ddof=1 if sample else 0))
+
     data_mean = mean(data)
-    squared_diffs = [(x - data_mean) ** 2 for x in data]
-    sum_squared_diffs = sum(squared_diffs)
+    sum_squared_diffs = _sum_squared_deviations(data, data_mean)
 
     if sample:
         return sum_squared_diffs / (len(data) - 1)
@@ -156,7 +377,7 @@ def variance(data: List[Union[int, float]], sample: bool = True) -> float:
         return sum_squared_diffs / len(data)
 
 
-def stdev(data: List[Union[int, float]], sample: bool = True) -> float:
+def stdev(data: NumericData, sample: bool = True) -> float:
     """
     Calculate the standard deviation of a dataset.
 
@@ -164,8 +385,8 @@ def stdev(data: List[Union[int, float]], sample: bool = True) -> float:
 
     Parameters
     ----------
-    data : List[Union[int, float]]
-        A list of numeric values
+    data : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
     sample : bool, default=True
         If True, calculate sample standard deviation
         If False, calculate population standard deviation
@@ -190,20 +411,124 @@ def stdev(data: List[Union[int, float]], sample: bool = True) -> float:
     Time Complexity: O(n)
     Space Complexity: O(1)
     """
+    data = as_values(data)
     if not data:
         raise ValueError("Cannot compute standard deviation of empty dataset")
 
     return variance(data, sample=sample) ** 0.5
 
 
-def data_range(data: List[Union[int, float]]) -> float:
+def skewness(data: NumericData, sample: bool = True) -> float:
+    """
+    Calculate the skewness (asymmetry) of a dataset.
+
+    Parameters
+    ----------
+    data : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
+    sample : bool, default=True
+        If True, calculate the bias-corrected sample skewness G1
+        If False, calculate the population skewness g1
+
+    Returns
+    -------
+    float
+        Positive for a longer right tail, negative for a longer left tail
+
+    Raises
+    ------
+    ValueError
+        If the input is empty, all values are equal, or sample skewness
+        requested with < 3 values
+
+    Examples
+    --------
+    >>> skewness([1, 2, 3, 4, 10], sample=False)
+    1.1384199576606164
+
+    Notes
+    -----
+    Population skewness: g1 = m3 / m2^(3/2), with m_k = Σ(x - x̄)^k / n
+    Sample skewness: G1 = g1 · √(n(n-1)) / (n-2)
+    Computed from the same central moments that ``RunningStats``
+    maintains; ``RunningStats.skewness`` merges them per block, so the two
+    agree up to rounding.
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+    data = as_values(data)
+    if not data:
+        raise ValueError("Cannot compute skewness of empty dataset")
+
+    if sample and len(data) < 3:
+        raise ValueError("Sample skewness requires at least 3 data points")
+
+    n = len(data)
+    m2, m3, _ = _data_central_moments(data)
+    return _skewness(n, m2, m3, sample)
+
+
+def kurtosis(data: NumericData, sample: bool = True, excess: bool = True) -> float:
+    """
+    Calculate the kurtosis (tail weight) of a dataset.
+
+    Parameters
+    ----------
+    data : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
+    sample : bool, default=True
+        If True, calculate the bias-corrected sample excess kurtosis G2
+        If False, calculate the population excess kurtosis g2
+    excess : bool, default=True
+        If True, subtract 3 so that a normal distribution scores 0
+
+    Returns
+    -------
+    float
+        The kurtosis of the dataset
+
+    Raises
+    ------
+    ValueError
+        If the input is empty, all values are equal, or sample kurtosis
+        requested with < 4 values
+
+    Examples
+    --------
+    >>> kurtosis([1, 2, 3, 4, 5], sample=False)
+    -1.3
+
+    >>> kurtosis([1, 2, 3, 4, 5], sample=False, excess=False)
+    1.7
+
+    Notes
+    -----
+    Population excess kurtosis: g2 = m4 / m2² - 3
+    Sample excess kurtosis: G2 = ((n+1)·g2 + 6) · (n-1) / ((n-2)(n-3))
+    Agrees with ``RunningStats.kurtosis`` up to rounding.
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+    data = as_values(data)
+    if not data:
+        raise ValueError("Cannot compute kurtosis of empty dataset")
+
+    if sample and len(data) < 4:
+        raise ValueError("Sample kurtosis requires at least 4 data points")
+
+    n = len(data)
+    m2, _, m4 = _data_central_moments(data)
+    return _kurtosis(n, m2, m4, sample, excess)
+
+
+def data_range(data: NumericData) -> float:
     """
     Calculate the range (max - min) of a dataset.
 
     Parameters
     ----------
-    data : List[Union[int, float]]
-        A list of numeric values
+    data : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
 
     Returns
     -------
@@ -228,7 +553,392 @@ def data_range(data: List[Union[int, float]]) -> float:
     Time Complexity: O(n)
     Space Complexity: O(1)
     """
+    data = as_values(data)
     if not data:
         raise ValueError("Cannot compute range of empty dataset")
 
+    array = _backend._as_array(data, convert_lists=False)
+    if array is not None:
+        # Python scalars: subtracting in a small integer dtype would wrap
+        return float(array.max().item() - array.min().item())
+
     return float(max(data) - min(data))
+
+
+def mode(data: Union[Iterable[Hashable], NumericData]) -> Hashable:
+    """
+    Return the most frequent value in a dataset.
+
+    Parameters
+    ----------
+    data : Iterable[Hashable] or buffer
+        Values to count: numbers, strings or any hashable categories. May
+        be a generator or other single-pass stream.
+
+    Returns
+    -------
+    Hashable
+        The most common value, unchanged. Ties go to the value seen first.
+
+    Raises
+    ------
+    ValueError
+        If the input is empty
+
+    Examples
+    --------
+    >>> mode([1, 2, 2, 3, 3, 3])
+    3
+
+    >>> mode(["red", "blue", "red"])
+    'red'
+
+    Notes
+    -----
+    Counts every distinct value in one hashing pass. Values that compare
+    equal (such as 1 and 1.0) are counted together.
+    Time Complexity: O(n)
+    Space Complexity: O(distinct values)
+    """
+    counts = Counter(as_values(data))
+    if not counts:
+        raise ValueError("Cannot compute mode of empty dataset")
+
+    return max(counts.items(), key=itemgetter(1))[0]
+
+
+def multimode(data: Union[Iterable[Hashable], NumericData]) -> List[Hashable]:
+    """
+    Return every value that is most frequent in a dataset.
+
+    Parameters
+    ----------
+    data : Iterable[Hashable] or buffer
+        Values to count: numbers, strings or any hashable categories. May
+        be a generator or other single-pass stream.
+
+    Returns
+    -------
+    List[Hashable]
+        The values sharing the highest count, in order of first
+        appearance. Empty if the input is empty.
+
+    Examples
+    --------
+    >>> multimode([1, 1, 2, 2, 3])
+    [1, 2]
+
+    >>> multimode([])
+    []
+
+    Notes
+    -----
+    Time Complexity: O(n)
+    Space Complexity: O(distinct values)
+    """
+    counts = Counter(as_values(data))
+    if not counts:
+        return []
+
+    highest = max(counts.values())
+    return [value for value, count in counts.items() if count == highest]
+
+
+def describe(data: NumericData) -> Dict[str, float]:
+    """
+    Calculate a complete statistical summary of a dataset in one call.
+
+    Equivalent to calling ``mean``, ``median``, ``variance``, ``stdev`` and
+    ``data_range`` on the same data, but the work is shared: a single
+    selection step provides the median, and a single pass over the
+    deviations provides both the sample and the population variance.
+
+    Parameters
+    ----------
+    data : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
+
+    Returns
+    -------
+    Dict[str, float]
+        Mapping with keys ``count``, ``mean``, ``variance``, ``pvariance``,
+        ``stdev``, ``pstdev``, ``min``, ``max``, ``range`` and ``median``.
+        ``variance`` and ``stdev`` are the sample statistics and are NaN
+        when the dataset has a single value.
+
+    Raises
+    ------
+    ValueError
+        If the input list is empty
+
+    Examples
+    --------
+    >>> summary = describe([2, 4, 4, 4, 5, 5, 7, 9])
+    >>> summary["mean"], summary["median"], summary["range"]
+    (5.0, 4.5, 7.0)
+
+    >>> describe([1, 2, 3, 4, 5])["variance"]
+    2.5
+
+    Notes
+    -----
+    Results are identical to the individual functions.
+    Time Complexity: O(n) expected
+    Space Complexity: O(n) for the selection step
+    """
+    data = as_values(data)
+    if not data:
+        raise ValueError("Cannot compute summary of empty dataset")
+
+    n = len(data)
+
+    # Follow the same backend choices as the individual functions, so the
+    # summary stays identical to calling them one by one
+    mean_array = _backend._as_array(data, convert_lists=False)
+    array = mean_array
+    if array is None:
+        array = _backend._as_array(data, convert_lists=True)
+
+    if mean_array is not None:
+        data_mean = float(mean_array.mean())
+    else:
+        data_mean = sum(data) / n
+
+    if array is not None:
+        pvar = float(array.var())
+        svar = float(array.var(ddof=1)) if n > 1 else math.nan
+        lowest = array.min().item()
+        highest = array.max().item()
+        data_median = float(_backend.np.median(array))
+    else:
+        sum_squared_diffs = _sum_squared_deviations(data, data_mean)
+        pvar = sum_squared_diffs / n
+        svar = sum_squared_diffs / (n - 1) if n > 1 else math.nan
+
+        lowest = min(data)
+        highest = max(data)
+
+        mid = n // 2
+        if n % 2 == 1:
+            data_median = float(_select_ranks(data, [mid])[mid])
+        else:
+            ranks = _select_ranks(data, [mid - 1, mid])
+            data_median = (ranks[mid - 1] + ranks[mid]) / 2.0
+
+    return {
+        "count": n,
+        "mean": data_mean,
+        "variance": svar,
+        "pvariance": pvar,
+        "stdev": svar**0.5,
+        "pstdev": pvar**0.5,
+        "min": float(lowest),
+        "max": float(highest),
+        "range": float(highest - lowest),
+        "median": data_median,
+    }
+
+
+def _sum_squared_deviations(data: Sequence[Union[int, float]], center: float) -> float:
+    """Return Σ(x - center)² without materializing the deviations."""
+    return sum((x - center) ** 2 for x in data)
+
+
+def _central_moments(
+    data: Sequence[Union[int, float]], center: float
+) -> Tuple[float, float, float]:
+    """
+    Return Σd², Σd³ and Σd⁴ for the deviations d = x - center.
+
+    Deviations are materialized one block at a time so the sums run in C;
+    Σd² is summed per block, so it equals ``_sum_squared_deviations`` only
+    up to rounding.
+    """
+    m2 = m3 = m4 = 0.0
+    for start in range(0, len(data), _MOMENT_BLOCK):
+        deviations = [x - center for x in data[start : start + _MOMENT_BLOCK]]
+        squares = list(map(mul, deviations, deviations))
+        m2 += sum(squares)
+        m3 += sum(map(mul, squares, deviations))
+        m4 += sum(map(mul, squares, squares))
+    return m2, m3, m4
+
+
+def _data_central_moments(
+    data: Sequence[Union[int, float]]
+) -> Tuple[float, float, float]:
+    """Central moment sums M2, M3, M4 of a whole dataset, on either backend."""
+    array = _backend._as_array(data, convert_lists=True)
+    if array is not None:
+        deviations = array - array.mean()
+        squares = deviations * deviations
+        return (
+            float(squares.sum()),
+            float((squares * deviations).sum()),
+            float((squares * squares).sum()),
+        )
+
+    return _central_moments(data, sum(data) / len(data))
+
+
+def _skewness(n: int, m2: float, m3: float, sample: bool) -> float:
+    """Skewness from the count and the central moment sums M2 and M3."""
+    if m2 <= 0.0:
+        raise ValueError("Cannot compute skewness of constant data")
+
+    g1 = math.sqrt(n) * m3 / m2**1.5
+    if sample:
+        return g1 * math.sqrt(n * (n - 1)) / (n - 2)
+    return g1
+
+
+def _kurtosis(n: int, m2: float, m4: float, sample: bool, excess: bool) -> float:
+    """Kurtosis from the count and the central moment sums M2 and M4."""
+    if m2 <= 0.0:
+        raise ValueError("Cannot compute kurtosis of constant data")
+
+    g2 = n * m4 / (m2 * m2) - 3.0
+    if sample:
+        g2 = ((n + 1) * g2 + 6.0) * (n - 1) / ((n - 2) * (n - 3))
+    return g2 if excess else g2 + 3.0
+
+
+def _quantile_position(n: int, p: float, method: str) -> Tuple[int, int, float]:
+    """Return (lower rank, upper rank, fraction) locating quantile p."""
+    a, b = _QUANTILE_METHODS[method]
+    h = a + (n + b) * p
+
+    # Absorb rounding error so exact positions (whole and half ranks, such
+    # as the median) are not pushed to a neighbouring rank
+    snapped = round(2.0 * h) / 2.0
+    if abs(h - snapped) <= 4 * n * sys.float_info.epsilon:
+        h = snapped
+    h = min(max(h, 0.0), n - 1.0)
+
+    lo = math.floor(h)
+    hi = math.ceil(h)
+    if method == "lower":
+        return lo, lo, 0.0
+    if method == "higher":
+        return hi, hi, 0.0
+    if method == "nearest":
+        index = round(h)
+        return index, index, 0.0
+    if method == "midpoint":
+        return lo, hi, 0.5
+    return lo, hi, h - lo
+
+
+def _interpolate(
+    lower: Union[int, float], upper: Union[int, float], frac: float
+) -> float:
+    """Linear interpolation between neighbouring order statistics."""
+    if frac == 0.0 or lower == upper:
+        return float(lower)
+    if frac == 0.5:
+        # Same arithmetic as median(), so p=0.5 agrees exactly
+        return (lower + upper) / 2.0
+    return lower + (upper - lower) * frac
+
+
+def _median_of_three(a: Sequence, lo: int, hi: int) -> Union[int, float]:
+    """Return the median of the first, middle and last values of a[lo:hi+1]."""
+    x, y, z = a[lo], a[(lo + hi) // 2], a[hi]
+    if x < y:
+        if y < z:
+            return y
+        return z if x < z else x
+    if x < z:
+        return x
+    return z if y < z else y
+
+
+def _select_ranks(
+    data: Sequence[Union[int, float]], ranks: List[int]
+) -> Dict[int, Union[int, float]]:
+    """
+    Return {rank: value} for several 0-based ranks of an unsorted sequence.
+
+    Three-way quickselect on copies: each step partitions the current
+    values around a pivot with list comprehensions and only descends into
+    the sides that still contain requested ranks. ``data`` is not modified.
+    A step budget of about 2·log2(n) partitions guards against bad pivots;
+    once exhausted, the remaining values are sorted.
+    """
+    found: Dict[int, Union[int, float]] = {}
+    budget = 2 * len(data).bit_length()
+    # (values, requested ranks within values, offset of values[0], budget)
+    pending = [(data, sorted(set(ranks)), 0, budget)]
+
+    while pending:
+        values, wanted, offset, budget = pending.pop()
+        n = len(values)
+
+        if n <= _SELECT_CUTOFF or budget == 0:
+            ordered = sorted(values)
+            for r in wanted:
+                found[offset + r] = ordered[r]
+            continue
+
+        pivot = _median_of_three(values, 0, n - 1)
+        lows = [x for x in values if x < pivot]
+        n_low = len(lows)
+
+        if wanted[-1] < n_low:
+            # Every requested rank lies below the pivot
+            pending.append((lows, wanted, offset, budget - 1))
+            continue
+
+        highs = [x for x in values if x > pivot]
+        n_high_start = n - len(highs)
+
+        low_ranks = [r for r in wanted if r < n_low]
+        high_ranks = [r - n_high_start for r in wanted if r >= n_high_start]
+        for r in wanted:
+            if n_low <= r < n_high_start:
+                found[offset + r] = pivot
+
+        if low_ranks:
+            pending.append((lows, low_ranks, offset, budget - 1))
+        if high_ranks:
+            pending.append((highs, high_ranks, offset + n_high_start, budget - 1))
+
+    return found
+
+
+def _nth_element(data: MutableSequence[Union[int, float]], k: int) -> Union[int, float]:
+    """
+    Partition ``data`` in place around its k-th smallest value and return it.
+
+    Hoare partitioning with median-of-three pivots. Only O(1) extra memory
+    is used except in the sort fallback, which is taken for small ranges
+    and once the step budget of about 2·log2(n) partitions runs out.
+    """
+    lo, hi = 0, len(data) - 1
+    budget = 2 * len(data).bit_length()
+
+    while hi - lo >= _SELECT_CUTOFF and budget > 0:
+        budget -= 1
+        pivot = _median_of_three(data, lo, hi)
+        i, j = lo, hi
+        while i <= j:
+            while data[i] < pivot:
+                i += 1
+            while data[j] > pivot:
+                j -= 1
+            if i <= j:
+                data[i], data[j] = data[j], data[i]
+                i += 1
+                j -= 1
+
+        # Now data[lo:j+1] <= pivot, data[j+1:i] == pivot, data[i:hi+1] >= pivot
+        if k <= j:
+            hi = j
+        elif k >= i:
+            lo = i
+        else:
+            return data[k]
+
+    for index, value in enumerate(sorted(data[lo : hi + 1]), lo):
+        data[index] = value
+    return data[k]
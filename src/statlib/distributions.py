@@ -3,11 +3,37 @@ Probability distribution functions.
 
 This module provides functions for working with probability distributions,
 including PDF, CDF, and random sampling.
+
+When NumPy is installed, ``normal_pdf`` and ``normal_cdf`` evaluate
+element-wise on NumPy arrays, and ``random_normal`` can use NumPy's
+generator; see ``statlib.backend``.
+
+``Normal`` is a frozen distribution object that validates its parameters
+and computes its constants once, and adds log-densities, the survival
+function and the inverse CDF (also available as ``normal_ppf``).
+
+``normal_pdf_batch`` and ``normal_cdf_batch`` evaluate many points in one
+call: lists, ``array.array`` and other buffers go in, a float64 array comes
+out (or an ``out=`` buffer is filled). Parameters are validated and the
+constants computed once per batch rather than once per point.
 """
 
 import math
 import random
-from typing import List, Optional
+from array import array
+from numbers import Real
+from typing import Any, List, Optional, Tuple, Union
+
+from . import backend as _backend
+from ._buffers import Buffer, NumericData, as_values
+
+_SQRT_2 = math.sqrt(2.0)
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+_LOG_SQRT_2PI = 0.5 * math.log(2.0 * math.pi)
+
+# A single point, or a batch of them, and the matching result
+Points = Union[float, NumericData]
+Evaluated = Union[float, Buffer]
 
 
 def normal_pdf(x: float, mu: float = 0.0, sigma: float = 1.0) -> float:
@@ -19,8 +45,8 @@ def normal_pdf(x: float, mu: float = 0.0, sigma: float = 1.0) -> float:
 
     Parameters
     ----------
-    x : float
-        The value at which to evaluate the PDF
+    x : float or numpy.ndarray
+        The value(s) at which to evaluate the PDF
     mu : float, default=0.0
         Mean of the distribution
     sigma : float, default=1.0
@@ -28,7 +54,7 @@ def normal_pdf(x: float, mu: float = 0.0, sigma: float = 1.0) -> float:
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         The probability density at x
 
     Raises
@@ -55,6 +81,9 @@ def normal_pdf(x: float, mu: float = 0.0, sigma: float = 1.0) -> float:
     coefficient = 1.0 / (sigma * math.sqrt(2 * math.pi))
     exponent = -0.5 * ((x - mu) / sigma) ** 2
 
+    if _backend._is_array(x):
+        return coefficient * _backend.np.exp(exponent)
+
     return coefficient * math.exp(exponent)
 
 
@@ -66,8 +95,8 @@ def normal_cdf(x: float, mu: float = 0.0, sigma: float = 1.0) -> float:
 
     Parameters
     ----------
-    x : float
-        The value at which to evaluate the CDF
+    x : float or numpy.ndarray
+        The value(s) at which to evaluate the CDF
     mu : float, default=0.0
         Mean of the distribution
     sigma : float, default=1.0
@@ -75,7 +104,7 @@ def normal_cdf(x: float, mu: float = 0.0, sigma: float = 1.0) -> float:
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         The cumulative probability up to x (between 0 and 1)
 
     Raises
@@ -102,18 +131,316 @@ def normal_cdf(x: float, mu: float = 0.0, sigma: float = 1.0) -> float:
     # Standardize: convert to standard normal
     z = (x - mu) / sigma
 
+    if _backend._is_array(x):
+        # NumPy has no erf ufunc: map math.erf over the standardized values
+        erf = _backend.np.frompyfunc(math.erf, 1, 1)
+        return 0.5 * (1.0 + erf(z / math.sqrt(2)).astype(float))
+
     # Use error function: CDF(z) = 0.5 * (1 + erf(z / sqrt(2)))
     return 0.5 * (1.0 + math.erf(z / math.sqrt(2)))
 
 
+def normal_pdf_batch(
+    x: NumericData,
+    mu: float = 0.0,
+    sigma: float = 1.0,
+    out: Optional[Buffer] = None,
+) -> Buffer:
+    """
+    Evaluate the normal PDF at every value of a sequence or buffer.
+
+    Parameters
+    ----------
+    x : Sequence[Union[int, float]] or buffer
+        Points at which to evaluate the PDF
+    mu : float, default=0.0
+        Mean of the distribution
+    sigma : float, default=1.0
+        Standard deviation of the distribution (must be positive)
+    out : buffer, optional
+        Writable, C-contiguous float64 buffer of the same length as x
+        (``array.array("d")``, a ``memoryview`` or an ndarray) to fill
+        instead of allocating a new array. It may be x itself.
+
+    Returns
+    -------
+    array.array or buffer
+        The densities, as a new ``array.array("d")``, or ``out``
+
+    Raises
+    ------
+    ValueError
+        If sigma is not positive, or out is read-only, not contiguous or
+        of the wrong length
+    TypeError
+        If out is not a float64 buffer
+
+    Examples
+    --------
+    >>> normal_pdf_batch([0, 1]).tolist()
+    [0.3989422804014327, 0.24197072451914337]
+
+    Notes
+    -----
+    Pure-Python results equal ``normal_pdf`` point by point. Buffers and
+    large lists are evaluated by NumPy when available.
+    Time Complexity: O(n)
+    Space Complexity: O(n) for the result, O(1) extra with out
+    """
+    if sigma <= 0:
+        raise ValueError("Sigma must be positive")
+
+    values = as_values(x)
+    target = _output_view(out, len(values))
+    coefficient = 1.0 / (sigma * _SQRT_2PI)
+
+    arr = _backend._as_array(values, convert_lists=True)
+    if arr is not None:
+        np = _backend.np
+        if target is None:
+            result = array("d", bytes(8 * len(values)))
+            dest = np.asarray(memoryview(result))
+        else:
+            result = out
+            dest = np.asarray(target)
+        np.subtract(arr, mu, out=dest)
+        np.divide(dest, sigma, out=dest)
+        np.square(dest, out=dest)
+        np.multiply(dest, -0.5, out=dest)
+        np.exp(dest, out=dest)
+        np.multiply(dest, coefficient, out=dest)
+        return result
+
+    exp = math.exp
+    densities = array(
+        "d", [coefficient * exp(-0.5 * ((v - mu) / sigma) ** 2) for v in values]
+    )
+    if target is None:
+        return densities
+    target[:] = densities
+    return out
+
+
+def normal_cdf_batch(
+    x: NumericData,
+    mu: float = 0.0,
+    sigma: float = 1.0,
+    out: Optional[Buffer] = None,
+) -> Buffer:
+    """
+    Evaluate the normal CDF at every value of a sequence or buffer.
+
+    Parameters
+    ----------
+    x : Sequence[Union[int, float]] or buffer
+        Points at which to evaluate the CDF
+    mu : float, default=0.0
+        Mean of the distribution
+    sigma : float, default=1.0
+        Standard deviation of the distribution (must be positive)
+    out : buffer, optional
+        Writable, C-contiguous float64 buffer of the same length as x to
+        fill instead of allocating a new array. It may be x itself.
+
+    Returns
+    -------
+    array.array or buffer
+        The cumulative probabilities, as a new ``array.array("d")``, or
+        ``out``
+
+    Raises
+    ------
+    ValueError
+        If sigma is not positive, or out is read-only, not contiguous or
+        of the wrong length
+    TypeError
+        If out is not a float64 buffer
+
+    Examples
+    --------
+    >>> normal_cdf_batch([0, 1]).tolist()
+    [0.5, 0.8413447460685429]
+
+    Notes
+    -----
+    Results equal ``normal_cdf`` point by point. NumPy has no erf ufunc, so
+    every backend maps ``math.erf`` over the values; the batch saves the
+    per-call validation and constant setup.
+    Time Complexity: O(n)
+    Space Complexity: O(n) for the result
+    """
+    if sigma <= 0:
+        raise ValueError("Sigma must be positive")
+
+    values = as_values(x)
+    target = _output_view(out, len(values))
+
+    erf = math.erf
+    probabilities = array(
+        "d", [0.5 * (1.0 + erf((v - mu) / sigma / _SQRT_2)) for v in values]
+    )
+    if target is None:
+        return probabilities
+    target[:] = probabilities
+    return out
+
+
+def normal_ppf(p: float, mu: float = 0.0, sigma: float = 1.0) -> float:
+    """
+    Calculate the percent point function (inverse CDF) of the normal distribution.
+
+    Returns the value x with ``normal_cdf(x, mu, sigma) == p``, for critical
+    values and inverse-transform sampling.
+
+    Parameters
+    ----------
+    p : float or numpy.ndarray
+        The probability or probabilities, in [0, 1]
+    mu : float, default=0.0
+        Mean of the distribution
+    sigma : float, default=1.0
+        Standard deviation of the distribution (must be positive)
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The quantile at p; -inf at 0 and inf at 1
+
+    Raises
+    ------
+    ValueError
+        If sigma is not positive or p is outside [0, 1]
+
+    Examples
+    --------
+    >>> normal_ppf(0.5)
+    0.0
+
+    >>> round(normal_ppf(0.975), 6)  # Two-sided 95% critical value
+    1.959964
+
+    >>> normal_ppf(0.8413447460685429, mu=10, sigma=2)
+    12.0
+
+    Notes
+    -----
+    Uses Wichura's rational approximation AS241, accurate to about 1e-16
+    relative over the whole range: one or two rational functions of
+    degree 7 and at most one log and one square root, instead of dozens of
+    ``normal_cdf`` evaluations for bisection.
+    Time Complexity: O(1)
+    """
+    if sigma <= 0:
+        raise ValueError("Sigma must be positive")
+
+    if _backend._is_array(p):
+        np = _backend.np
+        if not ((p >= 0.0) & (p <= 1.0)).all():
+            raise ValueError("Probabilities must be between 0 and 1")
+        ndtri = np.frompyfunc(_ndtri, 1, 1)
+        return mu + sigma * ndtri(p).astype(float)
+
+    if not 0.0 <= p <= 1.0:
+        raise ValueError("Probabilities must be between 0 and 1")
+
+    return mu + sigma * _ndtri(p)
+
+
+def normal_ppf_batch(
+    p: NumericData,
+    mu: float = 0.0,
+    sigma: float = 1.0,
+    out: Optional[Buffer] = None,
+) -> Buffer:
+    """
+    Evaluate the normal inverse CDF at every value of a sequence or buffer.
+
+    Parameters
+    ----------
+    p : Sequence[float] or buffer
+        Probabilities in [0, 1]
+    mu : float, default=0.0
+        Mean of the distribution
+    sigma : float, default=1.0
+        Standard deviation of the distribution (must be positive)
+    out : buffer, optional
+        Writable, C-contiguous float64 buffer of the same length as p to
+        fill instead of allocating a new array. It may be p itself.
+
+    Returns
+    -------
+    array.array or buffer
+        The quantiles, as a new ``array.array("d")``, or ``out``
+
+    Raises
+    ------
+    ValueError
+        If sigma is not positive, a probability is outside [0, 1], or out
+        is read-only, not contiguous or of the wrong length
+    TypeError
+        If out is not a float64 buffer
+
+    Examples
+    --------
+    >>> [round(x, 4) for x in normal_ppf_batch([0.025, 0.5, 0.975])]
+    [-1.96, 0.0, 1.96]
+
+    Notes
+    -----
+    Results equal ``normal_ppf`` point by point. Transforming a buffer of
+    uniform draws gives normal samples by inverse transform.
+    Time Complexity: O(n)
+    Space Complexity: O(n) for the result
+    """
+    if sigma <= 0:
+        raise ValueError("Sigma must be positive")
+
+    values = as_values(p)
+    target = _output_view(out, len(values))
+    if not all(0.0 <= v <= 1.0 for v in values):
+        raise ValueError("Probabilities must be between 0 and 1")
+
+    ndtri = _ndtri
+    return _fill(target, out, [mu + sigma * ndtri(v) for v in values])
+
+
+def _output_view(out: Optional[Buffer], n: int) -> Optional[memoryview]:
+    """Flat writable float64 view of an ``out=`` buffer of length n."""
+    if out is None:
+        return None
+
+    try:
+        view = memoryview(out)
+    except TypeError:
+        raise TypeError("Output must be a writable float64 buffer") from None
+
+    if view.readonly:
+        raise ValueError("Output buffer must be writable")
+
+    if not view.c_contiguous:
+        raise ValueError("Output buffer must be C-contiguous")
+
+    if view.format.lstrip("@") != "d":
+        raise TypeError(f"Output buffer must hold float64 values, not {view.format!r}")
+
+    if view.ndim != 1 or view.format != "d":
+        view = view.cast("B").cast("d")
+    if len(view) != n:
+        raise ValueError(f"Output buffer must hold {n} values, not {len(view)}")
+    return view
+
+
 def random_normal(
-    n: int, mu: float = 0.0, sigma: float = 1.0, seed: Optional[int] = None
+    n: int,
+    mu: float = 0.0,
+    sigma: float = 1.0,
+    seed: Optional[int] = None,
+    method: str = "box-muller",
+    rng: Optional[random.Random] = None,
 ) -> List[float]:
     """
     Generate random samples from a normal distribution.
 
-    Uses the Box-Muller transform to generate normally distributed random numbers.
-
     Parameters
     ----------
     n : int
@@ -123,7 +450,17 @@ def random_normal(
     sigma : float, default=1.0
         Standard deviation of the distribution (must be positive)
     seed : int, optional
-        Random seed for reproducibility
+        Random seed for reproducibility. The global ``random`` state is
+        not touched.
+    method : str, default="box-muller"
+        Generation method: ``"box-muller"`` (the Box-Muller transform),
+        ``"polar"`` (Marsaglia's polar method, which avoids the sine and
+        cosine) or ``"ziggurat"`` (Marsaglia and Tsang's ziggurat, the
+        fastest)
+    rng : random.Random, optional
+        Generator to draw from, advancing its state; see ``statlib.rng``
+        for independent generators per thread or process. Without seed
+        or rng, the module-level ``random`` functions are used.
 
     Returns
     -------
@@ -133,7 +470,8 @@ def random_normal(
     Raises
     ------
     ValueError
-        If n is not positive or sigma is not positive
+        If n is not positive, sigma is not positive, the method is unknown
+        or both seed and rng are given
 
     Examples
     --------
@@ -147,9 +485,28 @@ def random_normal(
     >>> abs(statistics.mean(samples) - 5) < 0.1
     True
 
+    >>> samples = random_normal(10000, mu=5, sigma=2, seed=42, method="ziggurat")
+    >>> abs(statistics.mean(samples) - 5) < 0.1
+    True
+
+    >>> import random
+    >>> rng = random.Random(42)
+    >>> random_normal(3, rng=rng) == random_normal(3, seed=42)
+    True
+
     Notes
     -----
-    Uses Box-Muller transform for generation.
+    Each method is reproducible per seed, and the default Box-Muller output
+    for a given seed is unchanged from earlier versions; the methods give
+    different streams from the same seed. A seed draws from a private
+    ``random.Random(seed)``, which yields the stream that seeding the
+    global generator used to, so concurrent seeded calls do not interfere.
+    The ziggurat accepts about 99% of
+    draws with one uniform, one table lookup and one comparison, drawing
+    the layer and sign bits for all samples in one call. With the backend
+    forced to ``"numpy"``, samples come from NumPy's default generator
+    whatever the method (seeded from rng if given), which is reproducible
+    per seed but yields a different stream.
     Time Complexity: O(n)
     Space Complexity: O(n)
     """
@@ -159,25 +516,508 @@ def random_normal(
     if sigma <= 0:
         raise ValueError("Sigma must be positive")
 
-    # Set seed for reproducibility
-    if seed is not None:
-        random.seed(seed)
+    sampler = _SAMPLERS.get(method)
+    if sampler is None:
+        raise ValueError(f"Unknown generation method: {method!r}")
+
+    if seed is not None and rng is not None:
+        raise ValueError("Specify either seed or rng, not both")
+
+    if _backend._forced():
+        if rng is not None:
+            seed = rng.getrandbits(128)
+        generator = _backend.np.random.default_rng(seed)
+        return (generator.standard_normal(n) * sigma + mu).tolist()
+
+    if rng is None:
+        # Seeded calls get their own generator; unseeded ones share the global
+        rng = random if seed is None else random.Random(seed)
+
+    return sampler(n, mu, sigma, rng)
+
+
+def _box_muller(n: int, mu: float, sigma: float, rng: Any) -> List[float]:
+    """Box-Muller transform: two samples per pair of uniforms."""
+    rand = rng.random
+    log = math.log
+    sqrt = math.sqrt
+    cos = math.cos
+    sin = math.sin
+    two_pi = 2.0 * math.pi
+
+    samples = [0.0] * (n + n % 2)
+    for i in range(0, n, 2):
+        radius = sqrt(-2.0 * log(rand()))
+        angle = two_pi * rand()
+        samples[i] = radius * cos(angle) * sigma + mu
+        samples[i + 1] = radius * sin(angle) * sigma + mu
+
+    del samples[n:]
+    return samples
+
+
+def _polar(n: int, mu: float, sigma: float, rng: Any) -> List[float]:
+    """Marsaglia's polar method: two samples per point inside the unit disc."""
+    rand = rng.random
+    log = math.log
+    sqrt = math.sqrt
+
+    samples = [0.0] * (n + n % 2)
+    i = 0
+    while i < n:
+        u = 2.0 * rand() - 1.0
+        v = 2.0 * rand() - 1.0
+        s = u * u + v * v
+        if 0.0 < s < 1.0:
+            factor = sqrt(-2.0 * log(s) / s) * sigma
+            samples[i] = u * factor + mu
+            samples[i + 1] = v * factor + mu
+            i += 2
+
+    del samples[n:]
+    return samples
+
+
+def _ziggurat(n: int, mu: float, sigma: float, rng: Any) -> List[float]:
+    """Ziggurat method with one random byte and one uniform per sample."""
+    rand = rng.random
+    slow = _ziggurat_slow
+    # Byte j selects layer j & 127 and the sign j & 128; tables scaled by sigma
+    widths = [sigma * w for w in _ZIG_WIDTHS]
+    edges = [sigma * e for e in _ZIG_EDGES]
+
+    samples = [mu] * n
+    i = 0
+    for j in rng.randbytes(n):
+        x = rand() * widths[j]
+        edge = edges[j]
+        if -edge < x < edge:
+            samples[i] += x
+        else:
+            # About 1% of draws fall outside their layer's rectangle core
+            samples[i] += sigma * slow(rng, j, abs(x) / sigma)
+        i += 1
+    return samples
+
+
+def _ziggurat_slow(rng: Any, j: int, x: float) -> float:
+    """Standard sample for a draw x outside the rectangle core of layer j."""
+    x_table = _ZIG_X
+    f_table = _ZIG_F
+    rand = rng.random
+    while True:
+        layer = j & 127
+        if layer == 0:
+            # Base layer: sample the tail beyond R (Marsaglia, 1964)
+            while True:
+                a = -math.log(1.0 - rand()) / _ZIG_R
+                b = -math.log(1.0 - rand())
+                if b + b > a * a:
+                    break
+            x = _ZIG_R + a
+            break
+
+        # Wedge: accept if a uniform height in the layer is under the curve
+        low = f_table[layer]
+        if low + rand() * (f_table[layer + 1] - low) < math.exp(-0.5 * x * x):
+            break
+
+        j = rng.getrandbits(8)
+        layer = j & 127
+        x = rand() * x_table[layer]
+        if x < x_table[layer + 1]:
+            break
+
+    return -x if j & 128 else x
+
+
+def _ziggurat_tables() -> List[float]:
+    """
+    Layer edges x[0..128] of the 128-layer ziggurat for the normal density.
+
+    Every layer has area ``_ZIG_V`` under f(x) = exp(-x²/2): layer 0 is the
+    base strip of width x[0] = V/f(R) including the tail beyond x[1] = R,
+    and layer i spans x[i+1] <= x < x[i] in height f(x[i]) to f(x[i+1]).
+    Constants from Marsaglia and Tsang (2000).
+    """
+    x = [0.0] * 129
+    x[0] = _ZIG_V / math.exp(-0.5 * _ZIG_R * _ZIG_R)
+    x[1] = _ZIG_R
+    for i in range(1, 127):
+        x[i + 1] = math.sqrt(
+            -2.0 * math.log(_ZIG_V / x[i] + math.exp(-0.5 * x[i] ** 2))
+        )
+    return x
+
+
+_ZIG_R = 3.442619855899
+_ZIG_V = 9.91256303526217e-3
+_ZIG_X = _ziggurat_tables()
+_ZIG_F = [math.exp(-0.5 * x * x) for x in _ZIG_X]
+_ZIG_WIDTHS = [_ZIG_X[j & 127] if j < 128 else -_ZIG_X[j & 127] for j in range(256)]
+_ZIG_EDGES = [_ZIG_X[(j & 127) + 1] for j in range(256)]
 
-    samples = []
+_SAMPLERS = {"box-muller": _box_muller, "polar": _polar, "ziggurat": _ziggurat}
 
-    # Box-Muller transform generates pairs, so we generate n/2 pairs
-    for _ in range((n + 1) // 2):
-        # Generate two uniform random numbers
-        u1 = random.random()
-        u2 = random.random()
 
-        # Box-Muller transform
-        z0 = math.sqrt(-2.0 * math.log(u1)) * math.cos(2.0 * math.pi * u2)
-        z1 = math.sqrt(-2.0 * math.log(u1)) * math.sin(2.0 * math.pi * u2)
+class Normal:
+    """
+    Frozen normal distribution N(mu, sigma²) with precomputed constants.
 
-        # Transform to N(mu, sigma²)
-        samples.append(z0 * sigma + mu)
-        if len(samples) < n:
-            samples.append(z1 * sigma + mu)
+    The parameters are validated once, and the normalizing coefficient and
+    its logarithm are computed once, so repeated evaluation skips the
+    checks and setup done by each call to the free functions.
 
-    return samples[:n]  # Return exactly n samples
+    Parameters
+    ----------
+    mu : float, default=0.0
+        Mean of the distribution
+    sigma : float, default=1.0
+        Standard deviation of the distribution (must be positive)
+
+    Raises
+    ------
+    ValueError
+        If sigma is not positive or a parameter is not finite
+
+    Examples
+    --------
+    >>> dist = Normal(0, 1)
+    >>> dist.pdf(0)
+    0.3989422804014327
+    >>> dist.cdf([0, 1]).tolist()
+    [0.5, 0.8413447460685429]
+    >>> dist.pdf(40), round(dist.logpdf(40), 6)
+    (0.0, -800.918939)
+
+    Notes
+    -----
+    Every method accepts a number, returning a float, or a sequence or
+    buffer of values, returning an ``array.array("d")`` (or filling
+    ``out``, as ``normal_pdf_batch`` does). ``logpdf`` and ``logcdf`` stay
+    finite far into the tails, where the densities underflow to 0.0, so
+    log-likelihoods can be summed over many points. The CDF and survival
+    function use ``math.erfc``, which keeps full relative precision in
+    the tails where ``normal_cdf`` rounds to 0.0 or 1.0. Instances are
+    immutable, hashable and compare equal when their parameters are equal.
+    """
+
+    __slots__ = ("_mu", "_sigma", "_coefficient", "_log_norm")
+
+    def __init__(self, mu: float = 0.0, sigma: float = 1.0) -> None:
+        if sigma <= 0:
+            raise ValueError("Sigma must be positive")
+
+        if not (math.isfinite(mu) and math.isfinite(sigma)):
+            raise ValueError("Distribution parameters must be finite")
+
+        set_slot = object.__setattr__
+        set_slot(self, "_mu", float(mu))
+        set_slot(self, "_sigma", float(sigma))
+        set_slot(self, "_coefficient", 1.0 / (sigma * _SQRT_2PI))
+        set_slot(self, "_log_norm", -math.log(sigma) - _LOG_SQRT_2PI)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Normal distributions are immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Normal distributions are immutable")
+
+    def __repr__(self) -> str:
+        return f"Normal(mu={self._mu!r}, sigma={self._sigma!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Normal):
+            return NotImplemented
+        return (self._mu, self._sigma) == (other._mu, other._sigma)
+
+    def __hash__(self) -> int:
+        return hash((Normal, self._mu, self._sigma))
+
+    def __reduce__(self) -> Tuple[type, Tuple[float, float]]:
+        return (Normal, (self._mu, self._sigma))
+
+    @property
+    def mu(self) -> float:
+        """Mean of the distribution."""
+        return self._mu
+
+    @property
+    def sigma(self) -> float:
+        """Standard deviation of the distribution."""
+        return self._sigma
+
+    @property
+    def variance(self) -> float:
+        """Variance of the distribution, sigma²."""
+        return self._sigma * self._sigma
+
+    def pdf(self, x: Points, out: Optional[Buffer] = None) -> Evaluated:
+        """
+        Evaluate the probability density at x.
+
+        Parameters
+        ----------
+        x : float, Sequence[float] or buffer
+            Point or points at which to evaluate
+        out : buffer, optional
+            Writable float64 buffer to fill for batch input
+
+        Returns
+        -------
+        float or array.array
+            The density, or the densities as ``array.array("d")`` (``out``
+            if given)
+
+        Notes
+        -----
+        Time Complexity: O(1) per point
+        """
+        if isinstance(x, Real):
+            return self._coefficient * math.exp(
+                -0.5 * ((x - self._mu) / self._sigma) ** 2
+            )
+        return normal_pdf_batch(x, self._mu, self._sigma, out)
+
+    def logpdf(self, x: Points, out: Optional[Buffer] = None) -> Evaluated:
+        """
+        Evaluate the logarithm of the probability density at x.
+
+        Computed directly as ``log_norm - z²/2``, so it is finite wherever x
+        is, unlike ``math.log(pdf(x))``. Arguments and return as ``pdf``.
+        """
+        mu = self._mu
+        sigma = self._sigma
+        log_norm = self._log_norm
+        if isinstance(x, Real):
+            return log_norm - 0.5 * ((x - mu) / sigma) ** 2
+
+        values = as_values(x)
+        target = _output_view(out, len(values))
+        arr = _backend._as_array(values, convert_lists=True)
+        if arr is not None:
+            np = _backend.np
+            if target is None:
+                result = array("d", bytes(8 * len(values)))
+                dest = np.asarray(memoryview(result))
+            else:
+                result = out
+                dest = np.asarray(target)
+            np.subtract(arr, mu, out=dest)
+            np.divide(dest, sigma, out=dest)
+            np.square(dest, out=dest)
+            np.multiply(dest, -0.5, out=dest)
+            np.add(dest, log_norm, out=dest)
+            return result
+
+        return _fill(
+            target, out, [log_norm - 0.5 * ((v - mu) / sigma) ** 2 for v in values]
+        )
+
+    def cdf(self, x: Points, out: Optional[Buffer] = None) -> Evaluated:
+        """
+        Evaluate the cumulative distribution function at x.
+
+        Arguments and return as ``pdf``.
+        """
+        mu = self._mu
+        scale = self._sigma * _SQRT_2
+        if isinstance(x, Real):
+            return 0.5 * math.erfc((mu - x) / scale)
+
+        values = as_values(x)
+        target = _output_view(out, len(values))
+        erfc = math.erfc
+        return _fill(target, out, [0.5 * erfc((mu - v) / scale) for v in values])
+
+    def logcdf(self, x: Points, out: Optional[Buffer] = None) -> Evaluated:
+        """
+        Evaluate the logarithm of the cumulative distribution function at x.
+
+        Stays finite in the lower tail, where the CDF underflows to 0.0,
+        and accurate near 0 in the upper tail. Arguments and return as
+        ``pdf``.
+        """
+        mu = self._mu
+        sigma = self._sigma
+        if isinstance(x, Real):
+            return _log_ndtr((x - mu) / sigma)
+
+        values = as_values(x)
+        target = _output_view(out, len(values))
+        return _fill(target, out, [_log_ndtr((v - mu) / sigma) for v in values])
+
+    def sf(self, x: Points, out: Optional[Buffer] = None) -> Evaluated:
+        """
+        Evaluate the survival function, 1 - CDF, at x.
+
+        Computed from ``math.erfc`` rather than by subtraction, so small
+        upper-tail probabilities keep their precision. Arguments and return
+        as ``pdf``.
+        """
+        mu = self._mu
+        scale = self._sigma * _SQRT_2
+        if isinstance(x, Real):
+            return 0.5 * math.erfc((x - mu) / scale)
+
+        values = as_values(x)
+        target = _output_view(out, len(values))
+        erfc = math.erfc
+        return _fill(target, out, [0.5 * erfc((v - mu) / scale) for v in values])
+
+    def ppf(self, p: Points, out: Optional[Buffer] = None) -> Evaluated:
+        """
+        Evaluate the percent point function (inverse CDF) at p.
+
+        Parameters
+        ----------
+        p : float, Sequence[float] or buffer
+            Probability or probabilities in [0, 1]; 0 and 1 map to -inf and
+            inf
+        out : buffer, optional
+            Writable float64 buffer to fill for batch input
+
+        Returns
+        -------
+        float or array.array
+            The quantile, or the quantiles as ``array.array("d")`` (``out``
+            if given)
+
+        Raises
+        ------
+        ValueError
+            If a probability is outside [0, 1]
+
+        Notes
+        -----
+        As ``normal_ppf`` and ``normal_ppf_batch``.
+        Time Complexity: O(1) per point
+        """
+        mu = self._mu
+        sigma = self._sigma
+        if isinstance(p, Real):
+            if not 0.0 <= p <= 1.0:
+                raise ValueError("Probabilities must be between 0 and 1")
+            return mu + sigma * _ndtri(p)
+
+        return normal_ppf_batch(p, mu, sigma, out)
+
+    def sample(
+        self,
+        n: int,
+        seed: Optional[int] = None,
+        method: str = "box-muller",
+        rng: Optional[random.Random] = None,
+    ) -> List[float]:
+        """
+        Draw n random values, as ``random_normal(n, mu, sigma, ...)``.
+
+        Raises
+        ------
+        ValueError
+            If n is not positive, the method is unknown or both seed and
+            rng are given
+        """
+        return random_normal(n, self._mu, self._sigma, seed, method, rng)
+
+
+def _fill(
+    target: Optional[memoryview], out: Optional[Buffer], results: List[float]
+) -> Buffer:
+    """Return results as a float64 array, or copy them into ``out``."""
+    result = array("d", results)
+    if target is None:
+        return result
+    target[:] = result
+    return out
+
+
+def _log_ndtr(z: float) -> float:
+    """Logarithm of the standard normal CDF at z, finite in both tails."""
+    if z > 0.0:
+        return math.log1p(-0.5 * math.erfc(z / _SQRT_2))
+
+    if z > -30.0:
+        return math.log(0.5 * math.erfc(-z / _SQRT_2))
+
+    # Asymptotic series Φ(z) ~ φ(z)/|z| · (1 - 1/z² + 3/z⁴ - ...), whose
+    # omitted terms are below 1e-14 relative for z < -30
+    w = 1.0 / (z * z)
+    series = 1.0 + w * (-1.0 + w * (3.0 + w * (-15.0 + w * (105.0 - 945.0 * w))))
+    return -0.5 * z * z - math.log(-z) - _LOG_SQRT_2PI + math.log(series)
+
+
+def _ndtri(p: float) -> float:
+    """
+    Inverse of the standard normal CDF, by Wichura's algorithm AS241.
+
+    Wichura, M.J. (1988). "Algorithm AS241: The Percentage Points of the
+    Normal Distribution". Applied Statistics 37(3), 477-484. Returns -inf
+    and inf at 0 and 1; p is assumed to lie in [0, 1].
+    """
+    q = p - 0.5
+    # fmt: off
+    if abs(q) <= 0.425:
+        r = 0.180625 - q * q
+        num = (((((((2509.0809287301226727 * r +
+                     33430.575583588128105) * r +
+                     67265.770927008700853) * r +
+                     45921.953931549871457) * r +
+                     13731.693765509461125) * r +
+                     1971.5909503065514427) * r +
+                     133.14166789178437745) * r +
+                     3.387132872796366608) * q
+        den = (((((((5226.495278852854561 * r +
+                     28729.085735721942674) * r +
+                     39307.89580009271061) * r +
+                     21213.794301586595867) * r +
+                     5394.1960214247511077) * r +
+                     687.1870074920579083) * r +
+                     42.313330701600911252) * r +
+                     1.0)
+        return num / den
+
+    if p <= 0.0 or p >= 1.0:
+        return -math.inf if q < 0.0 else math.inf
+
+    r = math.sqrt(-math.log(p if q < 0.0 else 1.0 - p))
+    if r <= 5.0:
+        r -= 1.6
+        num = (((((((7.7454501427834140764e-4 * r +
+                     2.27238449892691845833e-2) * r +
+                     2.4178072517745061177e-1) * r +
+                     1.27045825245236838258) * r +
+                     3.64784832476320460504) * r +
+                     5.7694972214606914055) * r +
+                     4.6303378461565452959) * r +
+                     1.42343711074968357734)
+        den = (((((((1.05075007164441684324e-9 * r +
+                     5.475938084995344946e-4) * r +
+                     1.51986665636164571966e-2) * r +
+                     1.4810397642748007459e-1) * r +
+                     6.8976733498510000455e-1) * r +
+                     1.6763848301838038494) * r +
+                     2.05319162663775882187) * r +
+                     1.0)
+    else:
+        r -= 5.0
+        num = (((((((2.01033439929228813265e-7 * r +
+                     2.71155556874348757815e-5) * r +
+                     1.2426609473880784386e-3) * r +
+                     2.6532189526576123093e-2) * r +
+                     2.9656057182850489123e-1) * r +
+                     1.7848265399172913358) * r +
+                     5.4637849111641143699) * r +
+                     6.6579046435011037772)
+        den = (((((((2.04426310338993978564e-15 * r +
+                     1.4215117583164458887e-7) * r +
+                     1.8463183175100546818e-5) * r +
+                     7.8686913114561329059e-4) * r +
+                     1.48753612908506148525e-2) * r +
+                     1.3692988092273580531e-1) * r +
+                     5.9983220655588793769e-1) * r +
+                     1.0)
+    # fmt: on
+
+    x = num / den
+    return -x if q < 0.0 else x
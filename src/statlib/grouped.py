@@ -0,0 +1,489 @@
+"""
+Group-by statistics over (key, value) records in a single pass.
+
+Records are folded into per-group running moments without keeping the
+values themselves. Group state is stored column-wise in typed arrays (one
+slot per group in each of count, mean, M2, M3, M4, min and max), which
+costs about 56 bytes per group plus the key lookup, so hundreds of
+thousands of groups fit comfortably in memory. Accumulators built on
+separate shards can be merged.
+"""
+
+import math
+import random
+from array import array
+from itertools import islice, zip_longest
+from operator import itemgetter
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Union
+
+from .sketches import QuantileSketch
+from .streaming import RunningStats, _block_moments
+
+Number = Union[int, float]
+
+# Records bucketed by key per block in GroupedStats.extend
+_CHUNK_SIZE = 16384
+
+# Blocks averaging at least this many records per group are bucketed
+_BULK_SIZE = 32
+
+_MISSING = object()
+
+
+class GroupedStats:
+    """
+    Mergeable per-key accumulator for mean, variance, range and quantiles.
+
+    Parameters
+    ----------
+    sketch_k : int, optional
+        If given, also keep a ``QuantileSketch`` with this ``k`` per group,
+        so quantiles (including the median) can be estimated
+    seed : int, optional
+        Seed for the sketches' compaction coin flips, which all groups
+        draw from one shared generator
+
+    Examples
+    --------
+    >>> stats = GroupedStats()
+    >>> stats.extend(["a", "b", "a", "b"], [1, 10, 3, 30])
+    >>> stats.group("a").mean()
+    2.0
+    >>> stats.describe()["b"]["max"]
+    30.0
+
+    Notes
+    -----
+    Records are added with Welford's update; ``merge`` uses the pairwise
+    update of Chan, Golub and LeVeque, extended to the third and fourth
+    central moments by Pébay so ``group(key).skewness()`` and
+    ``kurtosis()`` are available.
+    Space Complexity: O(groups), or O(groups × sketch_k) with sketches
+    """
+
+    __slots__ = (
+        "_index",
+        "_counts",
+        "_means",
+        "_m2s",
+        "_m3s",
+        "_m4s",
+        "_mins",
+        "_maxs",
+        "_sketch_k",
+        "_rng",
+        "_sketches",
+    )
+
+    def __init__(
+        self, sketch_k: Optional[int] = None, seed: Optional[int] = None
+    ) -> None:
+        if sketch_k is not None and sketch_k < 8:
+            raise ValueError("k must be at least 8")
+
+        self._index: Dict[Hashable, int] = {}
+        self._counts = array("q")
+        self._means = array("d")
+        self._m2s = array("d")
+        self._m3s = array("d")
+        self._m4s = array("d")
+        self._mins = array("d")
+        self._maxs = array("d")
+        self._sketch_k = sketch_k
+        # One generator for every group's sketch: a random.Random per
+        # group would cost about 2.5 KB before any value is buffered
+        self._rng = random.Random(seed) if sketch_k is not None else None
+        self._sketches: List[QuantileSketch] = []
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._index
+
+    def __repr__(self) -> str:
+        return f"GroupedStats(groups={len(self._index)})"
+
+    def keys(self) -> List[Hashable]:
+        """Return the group keys in order of first appearance."""
+        return list(self._index)
+
+    def count(self, key: Hashable) -> int:
+        """
+        Return the number of values accumulated for a group.
+
+        Raises
+        ------
+        KeyError
+            If the group has no values
+        """
+        return self._counts[self._index[key]]
+
+    def push(self, key: Hashable, x: Number) -> None:
+        """
+        Add a single record.
+
+        Parameters
+        ----------
+        key : Hashable
+            Group the value belongs to
+        x : Union[int, float]
+            The value to add
+
+        Notes
+        -----
+        Time Complexity: O(1), or O(log k) amortized with sketches
+        """
+        i = self._index.get(key)
+        if i is None:
+            i = self._add_group(key, 1, float(x), 0.0, 0.0, 0.0, x, x)
+            if self._sketch_k is not None:
+                self._sketches[i].add(x)
+            return
+
+        if self._sketch_k is not None:
+            self._sketches[i].add(x)
+
+        n = self._counts[i] + 1
+        old_mean = self._means[i]
+        delta = x - old_mean
+        delta_n = delta / n
+        term = delta * delta_n * (n - 1)
+        m2 = self._m2s[i]
+        self._m4s[i] += (
+            term * delta_n * delta_n * (n * n - 3 * n + 3)
+            + 6.0 * delta_n * delta_n * m2
+            - 4.0 * delta_n * self._m3s[i]
+        )
+        self._m3s[i] += term * delta_n * (n - 2) - 3.0 * delta_n * m2
+        new_mean = old_mean + delta_n
+        self._m2s[i] = m2 + delta * (x - new_mean)
+        self._means[i] = new_mean
+        self._counts[i] = n
+        if x < self._mins[i]:
+            self._mins[i] = x
+        elif x > self._maxs[i]:
+            self._maxs[i] = x
+
+    def extend(self, keys: Iterable[Hashable], values: Iterable[Number]) -> None:
+        """
+        Add records from parallel iterables of keys and values.
+
+        Parameters
+        ----------
+        keys : Iterable[Hashable]
+            Group of each record; may be a generator
+        values : Iterable[Union[int, float]]
+            Value of each record; may be a generator
+
+        Raises
+        ------
+        ValueError
+            If keys and values have different lengths. Blocks of records
+            read before the mismatch was found have already been added.
+
+        Notes
+        -----
+        Records are read a block at a time. When the block's groups hold
+        many records each, they are bucketed by key, summarized with two
+        passes and folded in with the pairwise update; otherwise records
+        are added one by one.
+        Time Complexity: O(n)
+        Space Complexity: O(block size)
+        """
+        index = self._index
+        counts = self._counts
+        means = self._means
+        m2s = self._m2s
+        m3s = self._m3s
+        m4s = self._m4s
+        mins = self._mins
+        maxs = self._maxs
+        sketches = self._sketches if self._sketch_k is not None else None
+
+        records = zip_longest(keys, values, fillvalue=_MISSING)
+        while True:
+            block = list(islice(records, _CHUNK_SIZE))
+            if not block:
+                return
+
+            if _MISSING in block[-1]:
+                raise ValueError("keys and values must have the same length")
+
+            if len(set(map(itemgetter(0), block))) * _BULK_SIZE > len(block):
+                # Mostly small groups: push() inlined with local names, since
+                # per-value call overhead dominates
+                for key, x in block:
+                    i = index.get(key)
+                    if i is None:
+                        i = self._add_group(key, 1, float(x), 0.0, 0.0, 0.0, x, x)
+                    else:
+                        n = counts[i] + 1
+                        old_mean = means[i]
+                        delta = x - old_mean
+                        delta_n = delta / n
+                        term = delta * delta_n * (n - 1)
+                        m2 = m2s[i]
+                        m4s[i] += (
+                            term * delta_n * delta_n * (n * n - 3 * n + 3)
+                            + 6.0 * delta_n * delta_n * m2
+                            - 4.0 * delta_n * m3s[i]
+                        )
+                        m3s[i] += term * delta_n * (n - 2) - 3.0 * delta_n * m2
+                        new_mean = old_mean + delta_n
+                        m2s[i] = m2 + delta * (x - new_mean)
+                        means[i] = new_mean
+                        counts[i] = n
+                        if x < mins[i]:
+                            mins[i] = x
+                        elif x > maxs[i]:
+                            maxs[i] = x
+
+                    if sketches is not None:
+                        sketches[i].add(x)
+                continue
+
+            buckets: Dict[Hashable, List[Number]] = {}
+            for key, x in block:
+                bucket = buckets.get(key)
+                if bucket is None:
+                    buckets[key] = [x]
+                else:
+                    bucket.append(x)
+
+            for key, bucket in buckets.items():
+                i = self._combine(key, *_block_moments(bucket))
+                if sketches is not None:
+                    sketches[i].extend(bucket)
+
+    def merge(self, other: "GroupedStats") -> None:
+        """
+        Fold the state of another accumulator into this one.
+
+        Parameters
+        ----------
+        other : GroupedStats
+            Accumulator to merge in; it is left unchanged
+
+        Raises
+        ------
+        TypeError
+            If other is not a GroupedStats instance
+        ValueError
+            If the accumulators keep sketches with a different k
+
+        Notes
+        -----
+        Time Complexity: O(groups in other)
+        """
+        if not isinstance(other, GroupedStats):
+            raise TypeError("Can only merge with another GroupedStats")
+
+        if other._sketch_k != self._sketch_k:
+            raise ValueError("Cannot merge GroupedStats with different sketch_k")
+
+        for key, j in other._index.items():
+            self._combine(
+                key,
+                other._counts[j],
+                other._means[j],
+                other._m2s[j],
+                other._m3s[j],
+                other._m4s[j],
+                other._mins[j],
+                other._maxs[j],
+            )
+            if self._sketch_k is not None:
+                self._sketches[self._index[key]].merge(other._sketches[j])
+
+    def group(self, key: Hashable) -> RunningStats:
+        """
+        Return a ``RunningStats`` holding the state of one group.
+
+        The returned accumulator is a copy: it answers ``mean``,
+        ``variance``, ``stdev``, ``skewness``, ``kurtosis``, ``min``,
+        ``max`` and ``data_range`` for the group, and can be extended
+        without affecting this object.
+
+        Raises
+        ------
+        KeyError
+            If the group has no values
+        """
+        i = self._index[key]
+        stats = RunningStats()
+        stats._combine(
+            self._counts[i],
+            self._means[i],
+            self._m2s[i],
+            self._m3s[i],
+            self._m4s[i],
+            self._mins[i],
+            self._maxs[i],
+        )
+        return stats
+
+    def sketch(self, key: Hashable) -> QuantileSketch:
+        """
+        Return the quantile sketch of one group (not a copy).
+
+        Raises
+        ------
+        KeyError
+            If the group has no values
+        ValueError
+            If the accumulator was created without sketch_k
+        """
+        if self._sketch_k is None:
+            raise ValueError("Quantiles require GroupedStats(sketch_k=...)")
+
+        return self._sketches[self._index[key]]
+
+    def describe(self) -> Dict[Hashable, Dict[str, float]]:
+        """
+        Return summary statistics for every group.
+
+        Returns
+        -------
+        Dict[Hashable, Dict[str, float]]
+            For each key, ``count``, ``mean``, ``variance``, ``pvariance``,
+            ``stdev``, ``pstdev``, ``min``, ``max`` and ``range`` as in
+            ``describe``, plus an estimated ``median`` when sketches are
+            kept. Sample statistics are NaN for groups with one value.
+
+        Notes
+        -----
+        Time Complexity: O(groups)
+        """
+        summaries: Dict[Hashable, Dict[str, float]] = {}
+        for key, i in self._index.items():
+            n = self._counts[i]
+            m2 = self._m2s[i]
+            pvar = m2 / n
+            svar = m2 / (n - 1) if n > 1 else math.nan
+            summary = {
+                "count": n,
+                "mean": self._means[i],
+                "variance": svar,
+                "pvariance": pvar,
+                "stdev": svar**0.5,
+                "pstdev": pvar**0.5,
+                "min": self._mins[i],
+                "max": self._maxs[i],
+                "range": self._maxs[i] - self._mins[i],
+            }
+            if self._sketch_k is not None:
+                summary["median"] = self._sketches[i].quantile(0.5)
+            summaries[key] = summary
+        return summaries
+
+    def _add_group(
+        self,
+        key: Hashable,
+        n: int,
+        mean: float,
+        m2: float,
+        m3: float,
+        m4: float,
+        lo: Number,
+        hi: Number,
+    ) -> int:
+        """Append a new group slot initialized with summarized values."""
+        i = self._index[key] = len(self._counts)
+        self._counts.append(n)
+        self._means.append(mean)
+        self._m2s.append(m2)
+        self._m3s.append(m3)
+        self._m4s.append(m4)
+        self._mins.append(lo)
+        self._maxs.append(hi)
+        if self._sketch_k is not None:
+            self._sketches.append(QuantileSketch(k=self._sketch_k, rng=self._rng))
+        return i
+
+    def _combine(
+        self,
+        key: Hashable,
+        n_b: int,
+        mean_b: float,
+        m2_b: float,
+        m3_b: float,
+        m4_b: float,
+        lo: Any,
+        hi: Any,
+    ) -> int:
+        """Pairwise (Chan et al., Pébay) update of one group; returns its slot."""
+        i = self._index.get(key)
+        if i is None:
+            return self._add_group(key, n_b, mean_b, m2_b, m3_b, m4_b, lo, hi)
+
+        n_a = self._counts[i]
+        n = n_a + n_b
+        m2_a = self._m2s[i]
+        m3_a = self._m3s[i]
+        delta = mean_b - self._means[i]
+        delta_n = delta / n
+        term = delta * delta_n * n_a * n_b
+        self._m4s[i] += (
+            m4_b
+            + term * delta_n * delta_n * (n_a * n_a - n_a * n_b + n_b * n_b)
+            + 6.0 * delta_n * delta_n * (n_a * n_a * m2_b + n_b * n_b * m2_a)
+            + 4.0 * delta_n * (n_a * m3_b - n_b * m3_a)
+        )
+        self._m3s[i] += (
+            m3_b
+            + term * delta_n * (n_a - n_b)
+            + 3.0 * delta_n * (n_a * m2_b - n_b * m2_a)
+        )
+        self._means[i] += delta * n_b / n
+        self._m2s[i] += m2_b + delta * delta * n_a * n_b / n
+        self._counts[i] = n
+        if lo < self._mins[i]:
+            self._mins[i] = lo
+        if hi > self._maxs[i]:
+            self._maxs[i] = hi
+        return i
+
+
+def grouped_describe(
+    keys: Iterable[Hashable],
+    values: Iterable[Number],
+    sketch_k: Optional[int] = None,
+) -> Dict[Hashable, Dict[str, float]]:
+    """
+    Compute summary statistics of values grouped by key in a single pass.
+
+    Parameters
+    ----------
+    keys : Iterable[Hashable]
+        Group of each record
+    values : Iterable[Union[int, float]]
+        Value of each record
+    sketch_k : int, optional
+        If given, also estimate each group's median with a
+        ``QuantileSketch`` of this ``k``
+
+    Returns
+    -------
+    Dict[Hashable, Dict[str, float]]
+        Summary per key, as returned by ``GroupedStats.describe``
+
+    Raises
+    ------
+    ValueError
+        If keys and values have different lengths
+
+    Examples
+    --------
+    >>> summary = grouped_describe(["x", "y", "x"], [1.0, 5.0, 3.0])
+    >>> summary["x"]["mean"], summary["y"]["count"]
+    (2.0, 1)
+
+    Notes
+    -----
+    Time Complexity: O(n)
+    Space Complexity: O(groups)
+    """
+    stats = GroupedStats(sketch_k=sketch_k)
+    stats.extend(keys, values)
+    return stats.describe()
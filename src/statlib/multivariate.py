@@ -0,0 +1,489 @@
+"""
+Covariance and correlation matrices of multi-column data.
+
+Rows are folded into running column means and a co-moment matrix
+C = Σ (x - x̄)(x - x̄)ᵀ, so tens of millions of rows can be summarized in
+one pass with O(d²) memory for d columns. Rows are read in blocks: each
+block is reduced with two passes (column means, then products of
+deviations) and merged into the running state with the multivariate form
+of the pairwise update of Chan, Golub and LeVeque, which keeps the
+result accurate even when the columns have large means. Accumulators
+built on separate shards can be merged, and ``cov`` / ``corr`` can spread
+the rows over several processes.
+
+Data is given as a sequence of rows (each a sequence of d numbers) or as
+a C-contiguous 2-D buffer of shape (rows, d), such as a NumPy array.
+"""
+
+import math
+from array import array
+from itertools import chain, islice
+from operator import mul
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from . import backend as _backend
+from ._buffers import NumericData, as_values
+from .parallel import _attached, _check_workers, _run_chunks, _shared_values
+
+Number = Union[int, float]
+Matrix = List[List[float]]
+
+# (rows, column means, co-moment matrix) of a block of rows
+CoMoments = Tuple[int, List[float], Matrix]
+
+# Rows reduced per block before merging into the running state
+_CHUNK_ROWS = 4096
+
+
+class CovarianceStats:
+    """
+    Mergeable accumulator for column means, covariances and correlations.
+
+    Parameters
+    ----------
+    dimension : int, optional
+        Number of columns. If omitted, it is taken from the first row.
+
+    Raises
+    ------
+    ValueError
+        If dimension is not positive
+
+    Examples
+    --------
+    >>> stats = CovarianceStats()
+    >>> stats.extend([[1, 2], [2, 4], [3, 7]])
+    >>> stats.mean()
+    [2.0, 4.333333333333333]
+    >>> stats.covariance()[0][1]
+    2.5
+    >>> round(stats.correlation()[0][1], 4)
+    0.9934
+
+    Notes
+    -----
+    The diagonal of ``covariance`` is the variance of each column, equal to
+    ``variance`` of that column up to rounding.
+    Time Complexity: O(d²) per row
+    Space Complexity: O(d²)
+    """
+
+    __slots__ = ("_d", "_n", "_means", "_comoments")
+
+    def __init__(self, dimension: Optional[int] = None) -> None:
+        if dimension is not None and dimension <= 0:
+            raise ValueError("Dimension must be positive")
+
+        self._d = dimension
+        self._n = 0
+        self._means: List[float] = []
+        self._comoments: Matrix = []
+        if dimension is not None:
+            self._reset(dimension)
+
+    def _reset(self, dimension: int) -> None:
+        """Set the dimension and zero the state."""
+        self._d = dimension
+        self._means = [0.0] * dimension
+        self._comoments = [[0.0] * dimension for _ in range(dimension)]
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __repr__(self) -> str:
+        return f"CovarianceStats(n={self._n}, dimension={self._d})"
+
+    @property
+    def count(self) -> int:
+        """Number of rows accumulated."""
+        return self._n
+
+    @property
+    def dimension(self) -> Optional[int]:
+        """Number of columns, or None before the first row."""
+        return self._d
+
+    def push(self, row: Sequence[Number]) -> None:
+        """
+        Add a single row.
+
+        Raises
+        ------
+        ValueError
+            If the row length does not match the dimension
+
+        Notes
+        -----
+        Multivariate Welford update.
+        Time Complexity: O(d²)
+        """
+        self._check_dimension(len(row))
+
+        n = self._n + 1
+        means = self._means
+        deltas = [x - m for x, m in zip(row, means)]
+        for i, delta in enumerate(deltas):
+            means[i] += delta / n
+        after = [x - m for x, m in zip(row, means)]
+        for delta, com_row in zip(deltas, self._comoments):
+            for j, a in enumerate(after):
+                com_row[j] += delta * a
+        self._n = n
+
+    def extend(self, rows: Union[Iterable[Sequence[Number]], NumericData]) -> None:
+        """
+        Add many rows.
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence[Union[int, float]]] or 2-D buffer
+            Rows to add; may be a generator
+
+        Raises
+        ------
+        ValueError
+            If a row length does not match the dimension. Blocks read
+            before the mismatch was found have already been added.
+
+        Notes
+        -----
+        Rows are reduced a block at a time with two passes and merged with
+        the pairwise update. Blocks run on NumPy when it is available.
+        Time Complexity: O(n · d²)
+        Space Complexity: O(block size · d)
+        """
+        flat = _flat_buffer(rows)
+        if flat is not None:
+            values, d = flat
+            self._check_dimension(d)
+            step = _CHUNK_ROWS * d
+            for start in range(0, len(values), step):
+                self._combine(*_block_comoments(values[start : start + step], d))
+            return
+
+        rows = iter(rows)
+        while True:
+            block = list(islice(rows, _CHUNK_ROWS))
+            if not block:
+                return
+
+            d = len(block[0])
+            self._check_dimension(d)
+            if any(len(row) != d for row in block):
+                raise ValueError(f"All rows must have {d} values")
+            values = list(chain.from_iterable(block))
+            self._combine(*_block_comoments(values, d))
+
+    def merge(self, other: "CovarianceStats") -> None:
+        """
+        Fold the state of another accumulator into this one.
+
+        Parameters
+        ----------
+        other : CovarianceStats
+            Accumulator to merge in; it is left unchanged
+
+        Raises
+        ------
+        TypeError
+            If other is not a CovarianceStats instance
+        ValueError
+            If the dimensions differ
+
+        Notes
+        -----
+        Time Complexity: O(d²)
+        """
+        if not isinstance(other, CovarianceStats):
+            raise TypeError("Can only merge with another CovarianceStats")
+
+        if other._n:
+            self._check_dimension(other._d)
+            self._combine(other._n, other._means, other._comoments)
+
+    def mean(self) -> List[float]:
+        """
+        Return the mean of each column.
+
+        Raises
+        ------
+        ValueError
+            If no rows have been accumulated
+        """
+        if not self._n:
+            raise ValueError("Cannot compute mean of empty dataset")
+        return list(self._means)
+
+    def covariance(self, sample: bool = True) -> Matrix:
+        """
+        Return the covariance matrix.
+
+        Parameters
+        ----------
+        sample : bool, default=True
+            If True, divide the co-moments by n-1; if False, by n
+
+        Returns
+        -------
+        List[List[float]]
+            Symmetric d × d matrix; entry [i][j] is the covariance of
+            columns i and j
+
+        Raises
+        ------
+        ValueError
+            If no rows have been accumulated, or sample covariance
+            requested with < 2 rows
+        """
+        if not self._n:
+            raise ValueError("Cannot compute covariance of empty dataset")
+
+        if sample and self._n < 2:
+            raise ValueError("Sample covariance requires at least 2 rows")
+
+        divisor = self._n - 1 if sample else self._n
+        return [[c / divisor for c in row] for row in self._comoments]
+
+    def correlation(self) -> Matrix:
+        """
+        Return the Pearson correlation matrix.
+
+        Returns
+        -------
+        List[List[float]]
+            Symmetric d × d matrix with ones on the diagonal. A constant
+            column (zero variance) or a column containing NaN has NaN
+            throughout its row and column, diagonal included.
+
+        Raises
+        ------
+        ValueError
+            If no rows have been accumulated
+        """
+        if not self._n:
+            raise ValueError("Cannot compute correlation of empty dataset")
+
+        com = self._comoments
+        scales = [math.sqrt(com[i][i]) for i in range(self._d)]
+        result = []
+        for i, row in enumerate(com):
+            out = []
+            for j, c in enumerate(row):
+                denominator = scales[i] * scales[j]
+                if not denominator > 0:
+                    # Constant column, or NaN in the data
+                    out.append(math.nan)
+                elif i == j:
+                    out.append(1.0)
+                else:
+                    # Rounding can push |r| just past 1; NaN passes through
+                    r = c / denominator
+                    out.append(r if r != r else max(-1.0, min(1.0, r)))
+            result.append(out)
+        return result
+
+    def _check_dimension(self, d: int) -> None:
+        """Adopt the first row's dimension, then require every row to match."""
+        if self._d is None:
+            if d <= 0:
+                raise ValueError("Rows must have at least one value")
+            self._reset(d)
+        elif d != self._d:
+            raise ValueError(f"Row has {d} values, expected {self._d}")
+
+    def _combine(self, n_b: int, means_b: List[float], com_b: Matrix) -> None:
+        """Pairwise update with a summarized block of rows."""
+        n_a = self._n
+        if not n_a:
+            self._n = n_b
+            self._means = list(means_b)
+            self._comoments = [list(row) for row in com_b]
+            return
+
+        n = n_a + n_b
+        deltas = [b - a for a, b in zip(self._means, means_b)]
+        scale = n_a * n_b / n
+        for i, delta in enumerate(deltas):
+            self._means[i] += delta * n_b / n
+            row = self._comoments[i]
+            row_b = com_b[i]
+            weighted = delta * scale
+            for j, other in enumerate(deltas):
+                row[j] += row_b[j] + weighted * other
+        self._n = n
+
+
+def cov(
+    data: Union[Iterable[Sequence[Number]], NumericData],
+    sample: bool = True,
+    workers: Optional[int] = 1,
+) -> Matrix:
+    """
+    Compute the covariance matrix of the columns of a dataset.
+
+    Parameters
+    ----------
+    data : Iterable[Sequence[Union[int, float]]] or 2-D buffer
+        Rows of d values each, or a buffer of shape (rows, d). Rows may
+        come from a generator; with several workers they are collected
+        into a list first.
+    sample : bool, default=True
+        If True, divide by n-1; if False, divide by n
+    workers : int, optional, default=1
+        Number of worker processes; None uses ``os.cpu_count()``. With more
+        than one worker the rows are copied once into shared memory as
+        float64 and summarized in contiguous chunks.
+
+    Returns
+    -------
+    List[List[float]]
+        Symmetric d × d covariance matrix
+
+    Raises
+    ------
+    ValueError
+        If data is empty, rows have different lengths, workers is not
+        positive, or sample covariance requested with < 2 rows
+
+    Examples
+    --------
+    >>> cov([[1, 2], [2, 4], [3, 7]])
+    [[1.0, 2.5], [2.5, 6.333333333333333]]
+
+    Notes
+    -----
+    Time Complexity: O(n · d² / workers) per process
+    Space Complexity: O(d²), plus O(n · d) shared memory with workers
+    """
+    return _accumulate(data, workers, "covariance").covariance(sample)
+
+
+def corr(
+    data: Union[Iterable[Sequence[Number]], NumericData],
+    workers: Optional[int] = 1,
+) -> Matrix:
+    """
+    Compute the Pearson correlation matrix of the columns of a dataset.
+
+    Parameters
+    ----------
+    data : Iterable[Sequence[Union[int, float]]] or 2-D buffer
+        Rows of d values each, or a buffer of shape (rows, d), as in
+        ``cov``
+    workers : int, optional, default=1
+        Number of worker processes, as in ``cov``
+
+    Returns
+    -------
+    List[List[float]]
+        Symmetric d × d correlation matrix with ones on the diagonal, except
+        that a constant column or one containing NaN is NaN throughout its
+        row and column, diagonal included
+
+    Raises
+    ------
+    ValueError
+        If data is empty, rows have different lengths or workers is not
+        positive
+
+    Examples
+    --------
+    >>> matrix = corr([[1, 3], [2, 2], [3, 1]])
+    >>> matrix[0][0], round(matrix[0][1], 12)
+    (1.0, -1.0)
+
+    Notes
+    -----
+    Time Complexity: O(n · d² / workers) per process
+    Space Complexity: O(d²), plus O(n · d) shared memory with workers
+    """
+    return _accumulate(data, workers, "correlation").correlation()
+
+
+def _accumulate(
+    data: Union[Iterable[Sequence[Number]], NumericData],
+    workers: Optional[int],
+    name: str,
+) -> CovarianceStats:
+    """Summarize all rows, in this process or in a pool of workers."""
+    workers = _check_workers(workers)
+    stats = CovarianceStats()
+
+    flat = _flat_buffer(data)
+    if flat is None:
+        if workers == 1:
+            stats.extend(data)
+            if not stats.count:
+                raise ValueError(f"Cannot compute {name} of empty dataset")
+            return stats
+
+        if not isinstance(data, (list, tuple)):
+            data = list(data)
+        if not data:
+            raise ValueError(f"Cannot compute {name} of empty dataset")
+        d = len(data[0])
+        if any(len(row) != d for row in data):
+            raise ValueError(f"All rows must have {d} values")
+        flat = array("d", chain.from_iterable(data)), d
+
+    if not len(flat[0]):
+        raise ValueError(f"Cannot compute {name} of empty dataset")
+
+    if workers == 1:
+        stats.extend(data)
+        return stats
+
+    values, d = flat
+    with _shared_values(values) as block:
+        partials = _run_chunks(_chunk_comoments, block, len(values) // d, workers, (d,))
+    stats._check_dimension(d)
+    for partial in partials:
+        stats._combine(*partial)
+    return stats
+
+
+def _flat_buffer(data) -> Optional[Tuple[Sequence[Number], int]]:
+    """(flat values, columns) for a 2-D buffer, or None for row sequences."""
+    if isinstance(data, (list, tuple)):
+        return None
+
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return None
+
+    if view.ndim != 2:
+        raise ValueError("Buffer inputs must be 2-D, with one row per record")
+
+    return as_values(data), view.shape[1]
+
+
+def _block_comoments(values: Sequence[Number], d: int) -> CoMoments:
+    """Row count, column means and co-moments of a flat row-major block."""
+    n = len(values) // d
+    block = _backend._as_array(values, convert_lists=True)
+    if block is not None:
+        block = block.astype(_backend.np.float64, copy=False).reshape(n, d)
+        means = block.mean(axis=0)
+        deviations = block - means
+        return n, means.tolist(), (deviations.T @ deviations).tolist()
+
+    columns = [values[j::d] for j in range(d)]
+    means = [sum(column) / n for column in columns]
+    deviations = [[x - m for x in column] for column, m in zip(columns, means)]
+    com = [[0.0] * d for _ in range(d)]
+    for i, dev_i in enumerate(deviations):
+        row = com[i]
+        for j in range(i, d):
+            row[j] = com[j][i] = sum(map(mul, dev_i, deviations[j]))
+    return n, means, com
+
+
+def _chunk_comoments(name: str, start: int, stop: int, mode: str, d: int) -> CoMoments:
+    """Worker: summarize rows [start, stop) of a shared block."""
+    stats = CovarianceStats(d)
+    with _attached(name, start * d, stop * d) as values, _backend.use_backend(mode):
+        step = _CHUNK_ROWS * d
+        for offset in range(0, len(values), step):
+            stats._combine(*_block_comoments(values[offset : offset + step], d))
+    return stats._n, stats._means, stats._comoments
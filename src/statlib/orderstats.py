@@ -0,0 +1,495 @@
+"""
+A mutable container for order statistics of a changing population.
+
+``median`` and ``quantiles`` work on a fixed dataset and start over on
+every call, so asking for the median after each update of a changing
+population costs a full pass every time. ``OrderStatistics`` keeps the
+values sorted as they are added and removed, and answers rank, select,
+median and quantile queries in O(log n), with the running mean and
+variance kept in sync.
+"""
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+from operator import gt
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+from ._buffers import NumericData, as_values
+from .descriptive import _QUANTILE_METHODS, _interpolate, _quantile_position
+from .streaming import _block_moments
+
+Number = Union[int, float]
+
+# Target number of values per block; blocks split at twice this size and
+# merge with a neighbour below a quarter of it
+_LOAD = 512
+
+
+class OrderStatistics:
+    """
+    Sorted multiset of numbers with O(log n) updates and rank queries.
+
+    Parameters
+    ----------
+    data : Iterable[Union[int, float]], optional
+        Initial values, in any order
+
+    Raises
+    ------
+    ValueError
+        If a value is NaN
+
+    Examples
+    --------
+    >>> stats = OrderStatistics([5, 1, 4])
+    >>> stats.add(2)
+    >>> stats.median()
+    3.0
+    >>> stats.remove(5)
+    >>> stats.median(), stats.rank(2), stats.select(0)
+    (2.0, 2, 1.0)
+
+    Notes
+    -----
+    Values are kept in sorted blocks of a few hundred values (a two-level
+    B-tree). A binary search over the block maxima finds the block holding
+    a value, and a Fenwick tree over the block sizes turns ranks into
+    block positions and back. Updates insert into or delete from one short
+    block, a single memmove in C.
+    The mean and variance are updated with Welford's formulas, run in
+    reverse for removals, and recomputed exactly after every n removals so
+    rounding errors cannot build up.
+    Time Complexity: O(log n) per update or query
+    Space Complexity: O(n)
+    """
+
+    __slots__ = ("_blocks", "_maxes", "_tree", "_n", "_mean", "_m2", "_removed")
+
+    def __init__(self, data: Optional[Iterable[Number]] = None) -> None:
+        self._load(sorted(data) if data is not None else [])
+
+    @classmethod
+    def from_sorted(cls, values: NumericData) -> "OrderStatistics":
+        """
+        Build a container from values already in ascending order.
+
+        Parameters
+        ----------
+        values : Sequence[Union[int, float]] or buffer
+            Sorted values, e.g. a sorted ``array.array`` or memory-mapped
+            column
+
+        Returns
+        -------
+        OrderStatistics
+            A container holding the values
+
+        Raises
+        ------
+        ValueError
+            If the values are not in ascending order or include NaN
+
+        Notes
+        -----
+        Skips the sort of the constructor.
+        Time Complexity: O(n)
+        """
+        values = as_values(values)
+        if any(map(gt, values[:-1], values[1:])):
+            raise ValueError("Values must be sorted in ascending order")
+
+        stats = cls.__new__(cls)
+        stats._load(values)
+        return stats
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __iter__(self) -> Iterator[Number]:
+        """Iterate over the values in ascending order."""
+        return chain.from_iterable(self._blocks)
+
+    def __contains__(self, x: Number) -> bool:
+        i = bisect_left(self._maxes, x)
+        if i == len(self._maxes):
+            return False
+        block = self._blocks[i]
+        j = bisect_left(block, x)
+        return block[j] == x
+
+    def __repr__(self) -> str:
+        return f"OrderStatistics(n={self._n})"
+
+    @property
+    def count(self) -> int:
+        """Number of values held."""
+        return self._n
+
+    def add(self, x: Number) -> None:
+        """
+        Insert a value.
+
+        Raises
+        ------
+        ValueError
+            If x is NaN
+
+        Notes
+        -----
+        Time Complexity: O(log n)
+        """
+        if x != x:
+            raise ValueError("Cannot add NaN to OrderStatistics")
+
+        maxes = self._maxes
+        if not maxes:
+            self._blocks.append([x])
+            maxes.append(x)
+            self._rebuild_tree()
+        else:
+            i = bisect_left(maxes, x)
+            if i == len(maxes):
+                i -= 1
+                maxes[i] = x
+            block = self._blocks[i]
+            insort(block, x)
+            if len(block) > 2 * _LOAD:
+                self._split(i)
+            else:
+                self._tree_add(i, 1)
+
+        n = self._n + 1
+        delta = x - self._mean
+        self._mean += delta / n
+        self._m2 += delta * (x - self._mean)
+        self._n = n
+
+    def update(self, values: Iterable[Number]) -> None:
+        """
+        Insert many values.
+
+        Notes
+        -----
+        Large batches (relative to the current size) are merged by
+        rebuilding from one sort; small batches are added one at a time.
+        Time Complexity: O(m log n) for m values, or O((n + m) log(n + m))
+        """
+        values = list(values)
+        if len(values) * 8 < self._n:
+            for x in values:
+                self.add(x)
+            return
+
+        values.extend(self)
+        values.sort()
+        self._load(values)
+
+    def remove(self, x: Number) -> None:
+        """
+        Remove one occurrence of a value.
+
+        Raises
+        ------
+        ValueError
+            If x is not present
+
+        Notes
+        -----
+        Time Complexity: O(log n)
+        """
+        maxes = self._maxes
+        i = bisect_left(maxes, x)
+        if i < len(maxes):
+            block = self._blocks[i]
+            j = bisect_left(block, x)
+            if block[j] == x:
+                del block[j]
+                self._removed_value(x)
+                if not block or (len(block) < _LOAD // 4 and len(maxes) > 1):
+                    self._merge(i)
+                else:
+                    maxes[i] = block[-1]
+                    self._tree_add(i, -1)
+                return
+
+        raise ValueError(f"Value not found in OrderStatistics: {x!r}")
+
+    def rank(self, x: Number) -> int:
+        """
+        Return the number of values less than or equal to x.
+
+        Notes
+        -----
+        Time Complexity: O(log n)
+        """
+        i = bisect_right(self._maxes, x)
+        if i == len(self._maxes):
+            return self._n
+        return self._prefix(i) + bisect_right(self._blocks[i], x)
+
+    def select(self, k: int) -> float:
+        """
+        Return the k-th smallest value (0-based), as ``descriptive.select``.
+
+        Raises
+        ------
+        ValueError
+            If k is out of range
+
+        Notes
+        -----
+        Time Complexity: O(log n)
+        """
+        if not 0 <= k < self._n:
+            raise ValueError(f"k must be between 0 and {self._n - 1}")
+
+        return float(self._at(k))
+
+    def median(self) -> float:
+        """
+        Return the median, as ``descriptive.median``.
+
+        Raises
+        ------
+        ValueError
+            If the container is empty
+        """
+        n = self._n
+        if not n:
+            raise ValueError("Cannot compute median of empty dataset")
+
+        mid = n // 2
+        if n % 2 == 1:
+            return float(self._at(mid))
+        return (self._at(mid - 1) + self._at(mid)) / 2.0
+
+    def quantiles(self, probs: Sequence[float], method: str = "linear") -> List[float]:
+        """
+        Return several quantiles, as ``descriptive.quantiles``.
+
+        Parameters
+        ----------
+        probs : Sequence[float]
+            Probabilities in [0, 1]
+        method : str, default="linear"
+            Any method accepted by ``descriptive.quantiles``
+
+        Raises
+        ------
+        ValueError
+            If the container is empty, a probability is outside [0, 1] or
+            the method is unknown
+
+        Notes
+        -----
+        Time Complexity: O(m log n) for m probabilities
+        """
+        if not self._n:
+            raise ValueError("Cannot compute quantiles of empty dataset")
+
+        if method not in _QUANTILE_METHODS:
+            raise ValueError(f"Unknown quantile method: {method!r}")
+
+        for p in probs:
+            if not 0.0 <= p <= 1.0:
+                raise ValueError("Probabilities must be between 0 and 1")
+
+        result = []
+        for p in probs:
+            lo, hi, frac = _quantile_position(self._n, p, method)
+            result.append(_interpolate(self._at(lo), self._at(hi), frac))
+        return result
+
+    def min(self) -> float:
+        """
+        Return the smallest value.
+
+        Raises
+        ------
+        ValueError
+            If the container is empty
+        """
+        if not self._n:
+            raise ValueError("Cannot compute minimum of empty dataset")
+        return float(self._blocks[0][0])
+
+    def max(self) -> float:
+        """
+        Return the largest value.
+
+        Raises
+        ------
+        ValueError
+            If the container is empty
+        """
+        if not self._n:
+            raise ValueError("Cannot compute maximum of empty dataset")
+        return float(self._maxes[-1])
+
+    def mean(self) -> float:
+        """
+        Return the mean of the values held.
+
+        Raises
+        ------
+        ValueError
+            If the container is empty
+        """
+        if not self._n:
+            raise ValueError("Cannot compute mean of empty dataset")
+        return self._mean
+
+    def variance(self, sample: bool = True) -> float:
+        """
+        Return the variance of the values held.
+
+        Parameters
+        ----------
+        sample : bool, default=True
+            If True, divide by n-1; if False, divide by n
+
+        Raises
+        ------
+        ValueError
+            If the container is empty or sample variance requested with
+            < 2 values
+        """
+        if not self._n:
+            raise ValueError("Cannot compute variance of empty dataset")
+
+        if sample and self._n < 2:
+            raise ValueError("Sample variance requires at least 2 data points")
+
+        m2 = max(self._m2, 0.0)
+        return m2 / (self._n - 1) if sample else m2 / self._n
+
+    def stdev(self, sample: bool = True) -> float:
+        """Return the standard deviation, the square root of ``variance``."""
+        return math.sqrt(self.variance(sample))
+
+    def _load(self, ordered: Sequence[Number]) -> None:
+        """Replace the contents with sorted values, in blocks of _LOAD."""
+        if any(map(math.isnan, ordered)):
+            raise ValueError("Cannot add NaN to OrderStatistics")
+
+        self._blocks: List[List[Number]] = [
+            list(ordered[i : i + _LOAD]) for i in range(0, len(ordered), _LOAD)
+        ]
+        self._maxes: List[Number] = [block[-1] for block in self._blocks]
+        self._rebuild_tree()
+        self._n = len(ordered)
+        self._combine_blocks()
+
+    def _removed_value(self, x: Number) -> None:
+        """Reverse Welford update for a removed value."""
+        n = self._n - 1
+        self._n = n
+        self._removed += 1
+        if self._removed >= n:
+            # Also resets the moments exactly when the container empties
+            self._combine_blocks()
+            return
+
+        delta = x - self._mean
+        self._mean -= delta / n
+        self._m2 -= delta * (x - self._mean)
+
+    def _combine_blocks(self) -> None:
+        """Exact mean and M2 from per-block two-pass moments."""
+        n = 0
+        center = 0.0
+        m2 = 0.0
+        for block in self._blocks:
+            if not block:
+                continue
+            n_b, mean_b, m2_b = _block_moments(block)[:3]
+            total = n + n_b
+            delta = mean_b - center
+            center += delta * n_b / total
+            m2 += m2_b + delta * delta * n * n_b / total
+            n = total
+        self._mean = center
+        self._m2 = m2
+        self._removed = 0
+
+    def _split(self, i: int) -> None:
+        """Split an oversized block into two halves."""
+        block = self._blocks[i]
+        half = len(block) // 2
+        self._blocks.insert(i + 1, block[half:])
+        del block[half:]
+        self._maxes.insert(i, block[-1])
+        self._rebuild_tree()
+
+    def _merge(self, i: int) -> None:
+        """Fold a short (possibly empty) block into a neighbour."""
+        blocks = self._blocks
+        maxes = self._maxes
+        block = blocks[i]
+        if len(blocks) == 1:
+            if block:
+                maxes[0] = block[-1]
+            else:
+                del blocks[0]
+                del maxes[0]
+            self._rebuild_tree()
+            return
+
+        if i + 1 < len(blocks):
+            blocks[i + 1][:0] = block
+            merged = i
+        else:
+            blocks[i - 1].extend(block)
+            merged = i - 1
+            maxes[merged] = blocks[merged][-1]
+        del blocks[i]
+        del maxes[i]
+
+        if len(blocks[merged]) > 2 * _LOAD:
+            self._split(merged)
+        else:
+            self._rebuild_tree()
+
+    def _rebuild_tree(self) -> None:
+        """Build the Fenwick tree over block sizes in O(blocks)."""
+        tree = [0]
+        tree.extend(map(len, self._blocks))
+        size = len(tree)
+        for i in range(1, size):
+            j = i + (i & -i)
+            if j < size:
+                tree[j] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, i: int, delta: int) -> None:
+        """Add delta to the size of block i."""
+        tree = self._tree
+        size = len(tree)
+        i += 1
+        while i < size:
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, i: int) -> int:
+        """Total size of the blocks before block i."""
+        tree = self._tree
+        total = 0
+        while i:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _at(self, k: int) -> Number:
+        """The value at 0-based position k of the sorted order."""
+        tree = self._tree
+        size = len(tree)
+        pos = 0
+        step = 1 << (size - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < size and tree[nxt] <= k:
+                pos = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return self._blocks[pos][k]
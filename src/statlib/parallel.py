@@ -0,0 +1,290 @@
+"""
+Multi-process reductions for very large datasets.
+
+The input is copied once into a shared-memory block of float64 values.
+Worker processes attach to the block by name and summarize a contiguous
+chunk each, so the data itself is never pickled. The partial results
+(count, mean, central moment sums, min, max, histogram counts) are
+combined exactly in the parent.
+
+Order statistics such as the median cannot be combined from per-chunk
+summaries; use ``statlib.descriptive.median`` or a mergeable
+``statlib.sketches.QuantileSketch`` for those.
+"""
+
+import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from . import backend as _backend
+from ._buffers import NumericData, as_values
+from .streaming import (
+    Moments,
+    RunningStats,
+    _bin_counts,
+    _block_moments,
+    _default_range,
+)
+
+# Values copied into shared memory per step when the input is a list
+_COPY_BLOCK = 1 << 16
+
+_DOUBLE_SIZE = 8
+
+# Fewest values per worker when the worker count is chosen automatically:
+# starting a process costs about as much as reducing this many in-process
+_MIN_CHUNK = 1 << 18
+
+
+def summarize(data: NumericData, workers: Optional[int] = None) -> Dict[str, float]:
+    """
+    Compute moment-based summary statistics using several processes.
+
+    Parameters
+    ----------
+    data : Sequence[Union[int, float]] or buffer
+        Input data, as accepted by ``statlib.descriptive.describe``
+    workers : int, optional
+        Number of worker processes. None uses ``os.cpu_count()``, but at
+        most one per 2**18 values. With one worker, as for small inputs by
+        default, the data is summarized in the calling process.
+
+    Returns
+    -------
+    Dict[str, float]
+        Keys ``count``, ``mean``, ``variance``, ``pvariance``, ``stdev``,
+        ``pstdev``, ``min``, ``max`` and ``range``, with the same meaning as
+        in ``describe``. Sample statistics are NaN when there is one value.
+
+    Raises
+    ------
+    ValueError
+        If data is empty or workers is not positive
+
+    Examples
+    --------
+    >>> summary = summarize([2, 4, 4, 4, 5, 5, 7, 9], workers=2)
+    >>> summary["mean"], summary["pstdev"]
+    (5.0, 2.0)
+
+    Notes
+    -----
+    Each chunk is reduced with the two-pass algorithm, and the partial
+    results are merged with the pairwise update of Chan, Golub and LeVeque,
+    so the result matches ``describe`` up to rounding. Values are stored as
+    float64 in shared memory; integers beyond 2**53 lose precision.
+    Time Complexity: O(n / workers) per process, plus O(n) to copy the input
+    Space Complexity: O(n) shared memory
+    """
+    data = as_values(data)
+    workers = _check_workers(workers, len(data))
+
+    if len(data) == 0:
+        raise ValueError("Cannot compute summary of empty dataset")
+
+    stats = RunningStats()
+    if workers == 1:
+        stats._combine(*_block_moments(data))
+    else:
+        with _shared_values(data) as name:
+            for partial in _run_chunks(_chunk_moments, name, len(data), workers, ()):
+                stats._combine(*partial)
+
+    n = stats.count
+    pvar = stats.variance(sample=False)
+    svar = stats.variance(sample=True) if n > 1 else math.nan
+
+    return {
+        "count": n,
+        "mean": stats.mean(),
+        "variance": svar,
+        "pvariance": pvar,
+        "stdev": svar**0.5,
+        "pstdev": pvar**0.5,
+        "min": float(stats.min()),
+        "max": float(stats.max()),
+        "range": float(stats.data_range()),
+    }
+
+
+def histogram(
+    data: NumericData,
+    bins: int = 10,
+    value_range: Optional[Tuple[float, float]] = None,
+    workers: Optional[int] = None,
+) -> Tuple[List[int], List[float]]:
+    """
+    Count values in equal-width bins using several processes.
+
+    Parameters
+    ----------
+    data : Sequence[Union[int, float]] or buffer
+        Input data
+    bins : int, default=10
+        Number of equal-width bins (must be positive)
+    value_range : Tuple[float, float], optional
+        Lower and upper edges. Defaults to the data's minimum and maximum,
+        found with an extra parallel pass over the extremes only. Values
+        outside are ignored.
+    workers : int, optional
+        Number of worker processes. None uses ``os.cpu_count()``, but at
+        most one per 2**18 values.
+
+    Returns
+    -------
+    Tuple[List[int], List[float]]
+        ``bins`` counts and the ``bins + 1`` bin edges. Every bin is
+        half-open except the last, which includes the upper edge.
+
+    Raises
+    ------
+    ValueError
+        If data is empty, bins or workers is not positive, or the range is
+        not increasing
+
+    Examples
+    --------
+    >>> histogram([1, 2, 2, 3, 4], bins=3, workers=1)
+    ([1, 2, 2], [1.0, 2.0, 3.0, 4.0])
+
+    Notes
+    -----
+    Counts are integers, so merging per-chunk histograms is exact.
+    Time Complexity: O(n / workers) per process
+    Space Complexity: O(n) shared memory, O(bins) per process
+    """
+    data = as_values(data)
+    workers = _check_workers(workers, len(data))
+
+    if len(data) == 0:
+        raise ValueError("Cannot compute histogram of empty dataset")
+
+    if bins <= 0:
+        raise ValueError("Number of bins must be positive")
+
+    if value_range is not None:
+        low, high = float(value_range[0]), float(value_range[1])
+        if not low < high:
+            raise ValueError("Histogram range must be increasing")
+
+    if workers == 1:
+        if value_range is None:
+            low, high = _default_range(*_extremes(data))
+        counts = _bin_counts(data, low, high, bins)
+    else:
+        with _shared_values(data) as name:
+            if value_range is None:
+                partials = _run_chunks(_chunk_extremes, name, len(data), workers, ())
+                low, high = _default_range(
+                    min(p[0] for p in partials), max(p[1] for p in partials)
+                )
+
+            counts = [0] * bins
+            args = (low, high, bins)
+            for partial in _run_chunks(
+                _chunk_histogram, name, len(data), workers, args
+            ):
+                for i, c in enumerate(partial):
+                    counts[i] += c
+
+    width = (high - low) / bins
+    edges = [low + i * width for i in range(bins)] + [high]
+    return counts, edges
+
+
+def _check_workers(workers: Optional[int], size: Optional[int] = None) -> int:
+    """
+    Validate a worker count, defaulting to the number of CPUs.
+
+    Given the number of values, the default is also capped at one worker
+    per ``_MIN_CHUNK`` values; an explicit count is used as given.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+        if size is not None:
+            workers = max(1, min(workers, size // _MIN_CHUNK))
+        return workers
+    if workers <= 0:
+        raise ValueError("Number of workers must be positive")
+    return workers
+
+
+def _run_chunks(func, name: str, n: int, workers: int, args: tuple) -> List:
+    """Apply func to ``workers`` contiguous chunks of a shared block."""
+    workers = min(workers, n)
+    bounds = [(n * i // workers, n * (i + 1) // workers) for i in range(workers)]
+    mode = _backend.get_backend()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(func, name, start, stop, mode, *args) for start, stop in bounds
+        ]
+        return [future.result() for future in futures]
+
+
+@contextmanager
+def _shared_values(data: Sequence[float]) -> Iterator[str]:
+    """Copy values into a float64 shared-memory block and yield its name."""
+    n = len(data)
+    block = shared_memory.SharedMemory(create=True, size=n * _DOUBLE_SIZE)
+    try:
+        target = block.buf.cast("d")
+        try:
+            if isinstance(data, memoryview) and data.format == "d":
+                target[:] = data
+            else:
+                for start in range(0, n, _COPY_BLOCK):
+                    chunk = array("d", data[start : start + _COPY_BLOCK])
+                    target[start : start + len(chunk)] = chunk
+        finally:
+            target.release()
+        yield block.name
+    finally:
+        block.close()
+        block.unlink()
+
+
+@contextmanager
+def _attached(name: str, start: int, stop: int) -> Iterator[memoryview]:
+    """View values [start, stop) of a shared block created by the parent."""
+    block = shared_memory.SharedMemory(name=name)
+    view = block.buf.cast("d")
+    values = view[start:stop]
+    try:
+        yield values
+    finally:
+        values.release()
+        view.release()
+        block.close()
+
+
+def _chunk_moments(name: str, start: int, stop: int, mode: str) -> Moments:
+    """Worker: summarize one chunk of a shared block."""
+    with _attached(name, start, stop) as values, _backend.use_backend(mode):
+        return _block_moments(values)
+
+
+def _chunk_extremes(name: str, start: int, stop: int, mode: str) -> Tuple[float, float]:
+    """Worker: minimum and maximum of one chunk of a shared block."""
+    with _attached(name, start, stop) as values, _backend.use_backend(mode):
+        return _extremes(values)
+
+
+def _chunk_histogram(
+    name: str, start: int, stop: int, mode: str, low: float, high: float, bins: int
+) -> List[int]:
+    """Worker: bin one chunk of a shared block."""
+    with _attached(name, start, stop) as values, _backend.use_backend(mode):
+        return _bin_counts(values, low, high, bins)
+
+
+def _extremes(values: Sequence[float]) -> Tuple[float, float]:
+    """Minimum and maximum of a non-empty block."""
+    array_values = _backend._as_array(values, convert_lists=False)
+    if array_values is not None:
+        return float(array_values.min()), float(array_values.max())
+    return min(values), max(values)
@@ -0,0 +1,505 @@
+"""
+Statistics over data stored in files, without loading it into memory.
+
+Binary files of fixed-width little-endian numbers are memory-mapped and
+scanned sequentially in fixed-size chunks. Each chunk is summarized and
+merged into a streaming accumulator, and its pages are released once it
+has been processed, so resident memory stays bounded by the chunk size
+regardless of the file size.
+
+Delimited text files (CSV) are parsed a block of rows at a time, and the
+selected numeric columns are fed into one accumulator per column.
+"""
+
+import csv
+import math
+import mmap
+import os
+import sys
+from array import array
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .sketches import QuantileSketch
+from .streaming import RunningStats, _block_moments
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Supported file dtypes and their native array/memoryview format codes
+_DTYPES = {"float64": "d", "int64": "q", "float32": "f", "int32": "i"}
+
+# Default number of values per chunk (8 MiB of float64)
+_CHUNK_VALUES = 1 << 20
+
+# Default number of CSV rows parsed per block
+_CHUNK_ROWS = 8192
+
+_ON_ERROR = ("skip", "nan", "raise")
+
+Column = Union[str, int]
+
+
+def describe_file(
+    path: PathLike, dtype: str = "float64", chunk_size: int = _CHUNK_VALUES
+) -> Dict[str, float]:
+    """
+    Compute moment-based summary statistics of a binary file of numbers.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        File of packed little-endian values with no header
+    dtype : str, default="float64"
+        ``"float64"``, ``"int64"``, ``"float32"`` or ``"int32"``
+    chunk_size : int, default=1048576
+        Values per chunk, rounded up to a whole number of memory pages
+
+    Returns
+    -------
+    Dict[str, float]
+        Keys ``count``, ``mean``, ``variance``, ``pvariance``, ``stdev``,
+        ``pstdev``, ``min``, ``max`` and ``range``, with the same meaning as
+        in ``describe``. Sample statistics are NaN when there is one value.
+
+    Raises
+    ------
+    ValueError
+        If the file is empty, its size is not a whole number of values, the
+        dtype is unknown or chunk_size is not positive
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from array import array
+    >>> with tempfile.TemporaryDirectory() as tmp:
+    ...     path = os.path.join(tmp, "values.bin")
+    ...     with open(path, "wb") as f:
+    ...         array("d", [2, 4, 4, 4, 5, 5, 7, 9]).tofile(f)
+    ...     describe_file(path)["pstdev"]
+    2.0
+
+    Notes
+    -----
+    Use ``file_sketch`` for medians and other quantiles, which cannot be
+    computed exactly in bounded memory.
+    Time Complexity: O(n)
+    Space Complexity: O(chunk_size)
+    """
+    stats = file_stats(path, dtype=dtype, chunk_size=chunk_size)
+    n = stats.count
+    if not n:
+        raise ValueError("Cannot compute summary of empty dataset")
+
+    pvar = stats.variance(sample=False)
+    svar = stats.variance(sample=True) if n > 1 else float("nan")
+
+    return {
+        "count": n,
+        "mean": stats.mean(),
+        "variance": svar,
+        "pvariance": pvar,
+        "stdev": svar**0.5,
+        "pstdev": pvar**0.5,
+        "min": float(stats.min()),
+        "max": float(stats.max()),
+        "range": float(stats.data_range()),
+    }
+
+
+def file_stats(
+    path: PathLike, dtype: str = "float64", chunk_size: int = _CHUNK_VALUES
+) -> RunningStats:
+    """
+    Accumulate the mean, variance and range of a binary file of numbers.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        File of packed little-endian values with no header
+    dtype : str, default="float64"
+        ``"float64"``, ``"int64"``, ``"float32"`` or ``"int32"``
+    chunk_size : int, default=1048576
+        Values per chunk, rounded up to a whole number of memory pages
+
+    Returns
+    -------
+    RunningStats
+        Accumulator holding every value of the file; it can be queried,
+        merged with accumulators of other files, or extended further
+
+    Raises
+    ------
+    ValueError
+        If the file size is not a whole number of values, the dtype is
+        unknown or chunk_size is not positive
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from array import array
+    >>> with tempfile.TemporaryDirectory() as tmp:
+    ...     path = os.path.join(tmp, "values.bin")
+    ...     with open(path, "wb") as f:
+    ...         array("d", [2, 4, 4, 4, 5, 5, 7, 9]).tofile(f)
+    ...     stats = file_stats(path)
+    >>> stats.mean(), stats.max()
+    (5.0, 9.0)
+
+    Notes
+    -----
+    Time Complexity: O(n)
+    Space Complexity: O(chunk_size)
+    """
+    stats = RunningStats()
+    for chunk in _file_chunks(path, dtype, chunk_size):
+        stats._combine(*_block_moments(chunk))
+    return stats
+
+
+def file_sketch(
+    path: PathLike,
+    dtype: str = "float64",
+    k: int = 200,
+    seed: Optional[int] = None,
+    chunk_size: int = _CHUNK_VALUES,
+) -> QuantileSketch:
+    """
+    Build a quantile sketch of a binary file of numbers.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        File of packed little-endian values with no header
+    dtype : str, default="float64"
+        ``"float64"``, ``"int64"``, ``"float32"`` or ``"int32"``
+    k : int, default=200
+        Accuracy parameter of the sketch, as for ``QuantileSketch``
+    seed : int, optional
+        Seed for the sketch's compaction coin flips
+    chunk_size : int, default=1048576
+        Values per chunk, rounded up to a whole number of memory pages
+
+    Returns
+    -------
+    QuantileSketch
+        Sketch of every value of the file
+
+    Raises
+    ------
+    ValueError
+        If the file size is not a whole number of values, the dtype is
+        unknown, chunk_size is not positive or k is less than 8
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from array import array
+    >>> with tempfile.TemporaryDirectory() as tmp:
+    ...     path = os.path.join(tmp, "values.bin")
+    ...     with open(path, "wb") as f:
+    ...         array("d", [2, 4, 4, 4, 5, 5, 7, 9]).tofile(f)
+    ...     sketch = file_sketch(path)
+    >>> sketch.quantile(0.5)
+    4.0
+
+    Notes
+    -----
+    Time Complexity: O(n log(n / k)) amortized
+    Space Complexity: O(k + chunk_size)
+    """
+    sketch = QuantileSketch(k=k, seed=seed)
+    for chunk in _file_chunks(path, dtype, chunk_size):
+        sketch.extend(chunk)
+    return sketch
+
+
+def describe_csv(
+    path: PathLike,
+    columns: Optional[Sequence[Column]] = None,
+    delimiter: str = ",",
+    header: bool = True,
+    on_error: str = "skip",
+    chunk_size: int = _CHUNK_ROWS,
+    encoding: str = "utf-8",
+) -> Dict[Column, Dict[str, float]]:
+    """
+    Compute summary statistics of numeric CSV columns in a single scan.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Delimited text file
+    columns : Sequence[Union[str, int]], optional
+        Column names (requires a header row) or 0-based indices. Defaults
+        to every column.
+    delimiter : str, default=","
+        Field separator
+    header : bool, default=True
+        Whether the first row holds column names
+    on_error : str, default="skip"
+        What to do with a cell that is empty, missing, not a number or not
+        finite (such as ``nan`` or ``inf``): ``"skip"`` leaves it out,
+        ``"nan"`` counts it as NaN (so the column's moments become NaN) and
+        ``"raise"`` raises ValueError
+    chunk_size : int, default=8192
+        Rows parsed per block
+    encoding : str, default="utf-8"
+        Text encoding of the file
+
+    Returns
+    -------
+    Dict[Union[str, int], Dict[str, float]]
+        For each requested column, keys ``count``, ``mean``, ``variance``,
+        ``pvariance``, ``stdev``, ``pstdev``, ``min``, ``max`` and
+        ``range`` as in ``describe_file``, plus ``invalid``, the number of
+        cells that were skipped or counted as NaN. Statistics of a column
+        with no valid values are NaN.
+
+    Raises
+    ------
+    ValueError
+        If a column name is not in the header, on_error is unknown,
+        chunk_size is not positive, or on_error is ``"raise"`` and a cell
+        is invalid
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as tmp:
+    ...     path = os.path.join(tmp, "scores.csv")
+    ...     with open(path, "w", encoding="utf-8") as f:
+    ...         _ = f.write("name,score\\na,2\\nb,4\\nc,n/a\\nd,9\\n")
+    ...     summary = describe_csv(path, columns=["score"])
+    >>> summary["score"]["mean"], summary["score"]["invalid"]
+    (5.0, 1)
+
+    Notes
+    -----
+    Time Complexity: O(rows × columns)
+    Space Complexity: O(chunk_size × columns)
+    """
+    summaries: Dict[Column, Dict[str, float]] = {}
+    for column, (stats, invalid) in csv_stats(
+        path,
+        columns=columns,
+        delimiter=delimiter,
+        header=header,
+        on_error=on_error,
+        chunk_size=chunk_size,
+        encoding=encoding,
+    ).items():
+        summaries[column] = _summary(stats, invalid)
+    return summaries
+
+
+def csv_stats(
+    path: PathLike,
+    columns: Optional[Sequence[Column]] = None,
+    delimiter: str = ",",
+    header: bool = True,
+    on_error: str = "skip",
+    chunk_size: int = _CHUNK_ROWS,
+    encoding: str = "utf-8",
+) -> Dict[Column, Tuple[RunningStats, int]]:
+    """
+    Accumulate numeric CSV columns into one ``RunningStats`` per column.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Delimited text file
+    columns : Sequence[Union[str, int]], optional
+        Column names (requires a header row) or 0-based indices. Defaults
+        to every column.
+    delimiter : str, default=","
+        Field separator
+    header : bool, default=True
+        Whether the first row holds column names
+    on_error : str, default="skip"
+        ``"skip"``, ``"nan"`` or ``"raise"``, as for ``describe_csv``
+    chunk_size : int, default=8192
+        Rows parsed per block
+    encoding : str, default="utf-8"
+        Text encoding of the file
+
+    Returns
+    -------
+    Dict[Union[str, int], Tuple[RunningStats, int]]
+        For each requested column, its accumulator and the number of
+        invalid cells. Accumulators can be merged across files.
+
+    Raises
+    ------
+    ValueError
+        As for ``describe_csv``
+
+    Notes
+    -----
+    Each block of rows is converted column by column with ``map(float,
+    ...)`` and checked to be finite; only blocks containing an invalid cell
+    fall back to checking cells one at a time.
+    Time Complexity: O(rows × columns)
+    Space Complexity: O(chunk_size × columns)
+    """
+    if on_error not in _ON_ERROR:
+        raise ValueError(f"Unknown on_error option: {on_error!r}")
+
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+
+    with open(path, newline="", encoding=encoding) as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        names = next(reader, []) if header else []
+        row = 1
+
+        first = None
+        if columns is None:
+            if not header:
+                first = next(reader, [])
+            columns = list(names) if header else list(range(len(first)))
+
+        indices = [_column_index(column, names, header) for column in columns]
+        stats = {column: RunningStats() for column in columns}
+        invalid = dict.fromkeys(columns, 0)
+
+        rows = iter(reader) if first is None else _prepend(first, reader)
+        while True:
+            block = list(islice(rows, chunk_size))
+            if not block:
+                break
+
+            for column, index in zip(columns, indices):
+                values, bad = _parse_cells(block, index, on_error, row, column)
+                if values:
+                    stats[column]._combine(*_block_moments(values))
+                invalid[column] += bad
+            row += len(block)
+
+    return {column: (stats[column], invalid[column]) for column in columns}
+
+
+def _summary(stats: RunningStats, invalid: int) -> Dict[str, float]:
+    """Summary of a column accumulator, NaN where it holds too few values."""
+    n = stats.count
+    nan = math.nan
+    pvar = stats.variance(sample=False) if n else nan
+    svar = stats.variance(sample=True) if n > 1 else nan
+
+    return {
+        "count": n,
+        "mean": stats.mean() if n else nan,
+        "variance": svar,
+        "pvariance": pvar,
+        "stdev": svar**0.5,
+        "pstdev": pvar**0.5,
+        "min": float(stats.min()) if n else nan,
+        "max": float(stats.max()) if n else nan,
+        "range": float(stats.data_range()) if n else nan,
+        "invalid": invalid,
+    }
+
+
+def _column_index(column: Column, names: List[str], header: bool) -> int:
+    """Resolve a column name or index to a 0-based index."""
+    if isinstance(column, int):
+        return column
+    if not header:
+        raise ValueError("Column names require a header row")
+    try:
+        return names.index(column)
+    except ValueError:
+        raise ValueError(f"Column not found in header: {column!r}") from None
+
+
+def _prepend(first: List[str], rows: Iterator[List[str]]) -> Iterator[List[str]]:
+    """Yield a row that was already read, then the remaining rows."""
+    yield first
+    yield from rows
+
+
+def _parse_cells(
+    block: List[List[str]], index: int, on_error: str, row: int, column: Column
+) -> Tuple[List[float], int]:
+    """Parse one column of a block starting at data row ``row`` (1-based)."""
+    try:
+        values = list(map(float, [cells[index] for cells in block]))
+    except (ValueError, IndexError):
+        pass
+    else:
+        if all(map(math.isfinite, values)):
+            return values, 0
+
+    values = []
+    bad = 0
+    for offset, cells in enumerate(block):
+        try:
+            x = float(cells[index])
+        except (ValueError, IndexError):
+            x = math.nan
+        if math.isfinite(x):
+            values.append(x)
+            continue
+
+        if on_error == "raise":
+            raise ValueError(
+                f"Invalid value in column {column!r} on row {row + offset}"
+            )
+        bad += 1
+        if on_error == "nan":
+            values.append(math.nan)
+    return values, bad
+
+
+def _file_chunks(path: PathLike, dtype: str, chunk_size: int) -> Iterator[memoryview]:
+    """
+    Yield consecutive chunks of a file as typed memoryviews.
+
+    Each view is released, and its pages dropped from the process, as soon
+    as the consumer asks for the next chunk; views must not be kept.
+    """
+    fmt = _DTYPES.get(dtype)
+    if fmt is None:
+        raise ValueError(f"Unknown dtype: {dtype!r}")
+
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+
+    itemsize = array(fmt).itemsize
+    step = -(-chunk_size * itemsize // mmap.PAGESIZE) * mmap.PAGESIZE
+    swap = sys.byteorder != "little"
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size % itemsize:
+            raise ValueError(f"File size is not a whole number of {dtype} values")
+        if not size:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            _advise(mapped, "MADV_SEQUENTIAL", 0, size)
+            raw = memoryview(mapped)
+            try:
+                for start in range(0, size, step):
+                    stop = min(start + step, size)
+                    if swap:
+                        values = array(fmt)
+                        values.frombytes(raw[start:stop])
+                        values.byteswap()
+                        chunk = memoryview(values)
+                    else:
+                        chunk = raw[start:stop].cast(fmt)
+
+                    try:
+                        yield chunk
+                    finally:
+                        chunk.release()
+                    _advise(mapped, "MADV_DONTNEED", start, stop - start)
+            finally:
+                raw.release()
+
+
+def _advise(mapped: mmap.mmap, name: str, start: int, length: int) -> None:
+    """Pass a paging hint to the kernel where the platform supports it."""
+    option = getattr(mmap, name, None)
+    if option is not None and hasattr(mapped, "madvise"):
+        mapped.madvise(option, start, length)
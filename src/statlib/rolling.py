@@ -0,0 +1,400 @@
+"""
+Sliding-window (rolling) statistics.
+
+This module provides lazy iterators that yield a statistic over the last
+``window`` values of a stream, updating incrementally instead of
+recomputing each window from scratch.
+"""
+
+import heapq
+import math
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Tuple, Union
+
+Number = Union[int, float]
+
+
+def rolling_mean(data: Iterable[Number], window: int) -> Iterator[float]:
+    """
+    Yield the mean of every full window of ``window`` consecutive values.
+
+    Parameters
+    ----------
+    data : Iterable[Union[int, float]]
+        Values to scan; may be a generator or other single-pass stream
+    window : int
+        Number of values per window (must be positive)
+
+    Yields
+    ------
+    float
+        Mean of each window, starting once ``window`` values have been seen
+
+    Raises
+    ------
+    ValueError
+        If window is not positive
+
+    Examples
+    --------
+    >>> list(rolling_mean([1, 2, 3, 4, 5], window=3))
+    [2.0, 3.0, 4.0]
+
+    Notes
+    -----
+    Keeps a running sum, recomputed exactly once per ``window`` updates so
+    rounding errors cannot accumulate over long streams.
+    Time Complexity: O(1) amortized per value
+    Space Complexity: O(window)
+    """
+    _check_window(window)
+    return _rolling_mean(data, window)
+
+
+def _rolling_mean(data: Iterable[Number], window: int) -> Iterator[float]:
+    """Generator behind rolling_mean (arguments already validated)."""
+    values: Deque[Number] = deque()
+    total = 0.0
+    since_refresh = 0
+
+    for x in data:
+        values.append(x)
+        if len(values) <= window:
+            if len(values) < window:
+                continue
+            total = sum(values)
+        else:
+            total += x - values.popleft()
+            since_refresh += 1
+            if since_refresh == window:
+                total = sum(values)
+                since_refresh = 0
+
+        yield total / window
+
+
+def rolling_variance(
+    data: Iterable[Number], window: int, sample: bool = True
+) -> Iterator[float]:
+    """
+    Yield the variance of every full window of ``window`` consecutive values.
+
+    Parameters
+    ----------
+    data : Iterable[Union[int, float]]
+        Values to scan; may be a generator or other single-pass stream
+    window : int
+        Number of values per window (must be positive)
+    sample : bool, default=True
+        If True, calculate sample variance (divide by window-1)
+        If False, calculate population variance (divide by window)
+
+    Yields
+    ------
+    float
+        Variance of each window, starting once ``window`` values have been seen
+
+    Raises
+    ------
+    ValueError
+        If window is not positive, or if sample variance requested with a
+        window of fewer than 2 values
+
+    Examples
+    --------
+    >>> list(rolling_variance([1, 2, 3, 4, 5, 6], window=5))
+    [2.5, 2.5]
+
+    Notes
+    -----
+    Slides Welford's update: replacing x_old by x_new changes the mean by
+    (x_new - x_old) / w and M2 by (x_new - x_old)(x_new - mean' + x_old - mean).
+    M2 is recomputed with two passes once per ``window`` updates to keep
+    rounding errors from accumulating.
+    Time Complexity: O(1) amortized per value
+    Space Complexity: O(window)
+    """
+    _check_window(window)
+    if sample and window < 2:
+        raise ValueError("Sample variance requires at least 2 data points")
+
+    return _rolling_variance(data, window, window - 1 if sample else window)
+
+
+def _rolling_variance(
+    data: Iterable[Number], window: int, divisor: int
+) -> Iterator[float]:
+    """Generator behind rolling_variance, dividing M2 by ``divisor``."""
+    values: Deque[Number] = deque()
+    window_mean = 0.0
+    m2 = 0.0
+    since_refresh = window
+
+    for x in data:
+        values.append(x)
+        if len(values) < window:
+            continue
+
+        if len(values) > window and since_refresh < window:
+            old = values.popleft()
+            new_mean = window_mean + (x - old) / window
+            m2 += (x - old) * (x - new_mean + old - window_mean)
+            window_mean = new_mean
+            since_refresh += 1
+        else:
+            if len(values) > window:
+                values.popleft()
+            window_mean = sum(values) / window
+            m2 = sum((v - window_mean) ** 2 for v in values)
+            since_refresh = 1
+
+        yield max(m2, 0.0) / divisor
+
+
+def rolling_stdev(
+    data: Iterable[Number], window: int, sample: bool = True
+) -> Iterator[float]:
+    """
+    Yield the standard deviation of every full window of consecutive values.
+
+    Parameters
+    ----------
+    data : Iterable[Union[int, float]]
+        Values to scan; may be a generator or other single-pass stream
+    window : int
+        Number of values per window (must be positive)
+    sample : bool, default=True
+        If True, calculate sample standard deviation
+        If False, calculate population standard deviation
+
+    Yields
+    ------
+    float
+        Standard deviation of each window
+
+    Raises
+    ------
+    ValueError
+        If window is not positive, or if sample stdev requested with a
+        window of fewer than 2 values
+
+    Examples
+    --------
+    >>> list(rolling_stdev([2, 4, 4, 4, 5, 5, 7, 9], window=8, sample=False))
+    [2.0]
+
+    Notes
+    -----
+    Time Complexity: O(1) amortized per value
+    Space Complexity: O(window)
+    """
+    return map(math.sqrt, rolling_variance(data, window, sample=sample))
+
+
+def rolling_min(data: Iterable[Number], window: int) -> Iterator[float]:
+    """
+    Yield the minimum of every full window of ``window`` consecutive values.
+
+    Parameters
+    ----------
+    data : Iterable[Union[int, float]]
+        Values to scan; may be a generator or other single-pass stream
+    window : int
+        Number of values per window (must be positive)
+
+    Yields
+    ------
+    float
+        Minimum of each window
+
+    Raises
+    ------
+    ValueError
+        If window is not positive
+
+    Examples
+    --------
+    >>> list(rolling_min([4, 2, 5, 1, 3], window=2))
+    [2.0, 2.0, 1.0, 1.0]
+
+    Notes
+    -----
+    Monotonic deque: each value is pushed and popped at most once.
+    Time Complexity: O(1) amortized per value
+    Space Complexity: O(window)
+    """
+    _check_window(window)
+    return _rolling_extreme(data, window, keep_smaller=True)
+
+
+def rolling_max(data: Iterable[Number], window: int) -> Iterator[float]:
+    """
+    Yield the maximum of every full window of ``window`` consecutive values.
+
+    Parameters
+    ----------
+    data : Iterable[Union[int, float]]
+        Values to scan; may be a generator or other single-pass stream
+    window : int
+        Number of values per window (must be positive)
+
+    Yields
+    ------
+    float
+        Maximum of each window
+
+    Raises
+    ------
+    ValueError
+        If window is not positive
+
+    Examples
+    --------
+    >>> list(rolling_max([4, 2, 5, 1, 3], window=2))
+    [4.0, 5.0, 5.0, 3.0]
+
+    Notes
+    -----
+    Monotonic deque: each value is pushed and popped at most once.
+    Time Complexity: O(1) amortized per value
+    Space Complexity: O(window)
+    """
+    _check_window(window)
+    return _rolling_extreme(data, window, keep_smaller=False)
+
+
+def _rolling_extreme(
+    data: Iterable[Number], window: int, keep_smaller: bool
+) -> Iterator[float]:
+    """Generator behind rolling_min (keep_smaller) and rolling_max."""
+    # (index, value) pairs with values monotonic from the front
+    candidates: Deque[Tuple[int, Number]] = deque()
+
+    for i, x in enumerate(data):
+        if keep_smaller:
+            while candidates and candidates[-1][1] >= x:
+                candidates.pop()
+        else:
+            while candidates and candidates[-1][1] <= x:
+                candidates.pop()
+        candidates.append((i, x))
+
+        if candidates[0][0] <= i - window:
+            candidates.popleft()
+        if i >= window - 1:
+            yield float(candidates[0][1])
+
+
+def rolling_median(data: Iterable[Number], window: int) -> Iterator[float]:
+    """
+    Yield the median of every full window of ``window`` consecutive values.
+
+    Parameters
+    ----------
+    data : Iterable[Union[int, float]]
+        Values to scan; may be a generator or other single-pass stream
+    window : int
+        Number of values per window (must be positive)
+
+    Yields
+    ------
+    float
+        Median of each window, identical to ``median`` on the window
+
+    Raises
+    ------
+    ValueError
+        If window is not positive
+
+    Examples
+    --------
+    >>> list(rolling_median([5, 1, 4, 2, 3], window=3))
+    [4.0, 2.0, 3.0]
+
+    Notes
+    -----
+    Two heaps hold the lower and upper halves of the window. Values
+    leaving the window are deleted lazily, when they reach a heap top.
+    Time Complexity: O(log window) amortized per value
+    Space Complexity: O(window)
+    """
+    _check_window(window)
+    return _rolling_median(data, window)
+
+
+def _rolling_median(data: Iterable[Number], window: int) -> Iterator[float]:
+    """Generator behind rolling_median (arguments already validated)."""
+    values: Deque[Number] = deque()
+    # Lower half as a max-heap of negated values, upper half as a min-heap
+    lower: List[Number] = []
+    upper: List[Number] = []
+    # Live (not yet deleted) sizes of each half
+    n_lower = n_upper = 0
+    # Values that left the window but are still stored in a heap
+    pending: Dict[Number, int] = {}
+
+    def prune(heap: List[Number], sign: int) -> None:
+        while heap and sign * heap[0] in pending:
+            value = sign * heapq.heappop(heap)
+            if pending[value] == 1:
+                del pending[value]
+            else:
+                pending[value] -= 1
+
+    for x in data:
+        values.append(x)
+        if not lower or x <= -lower[0]:
+            heapq.heappush(lower, -x)
+            n_lower += 1
+        else:
+            heapq.heappush(upper, x)
+            n_upper += 1
+
+        if len(values) > window:
+            old = values.popleft()
+            pending[old] = pending.get(old, 0) + 1
+            if old <= -lower[0]:
+                n_lower -= 1
+                if old == -lower[0]:
+                    prune(lower, -1)
+            else:
+                n_upper -= 1
+                if old == upper[0]:
+                    prune(upper, 1)
+
+        # Rebalance so the lower half has the extra value when odd
+        if n_lower > n_upper + 1:
+            heapq.heappush(upper, -heapq.heappop(lower))
+            n_lower -= 1
+            n_upper += 1
+            prune(lower, -1)
+        elif n_lower < n_upper:
+            heapq.heappush(lower, -heapq.heappop(upper))
+            n_lower += 1
+            n_upper -= 1
+            prune(upper, 1)
+
+        if len(lower) + len(upper) > 2 * window:
+            # Deleted values buried below the heap tops: rebuild from the
+            # window so memory stays O(window)
+            ordered = sorted(values)
+            n_lower = (len(ordered) + 1) // 2
+            n_upper = len(ordered) - n_lower
+            lower = [-v for v in ordered[:n_lower]]
+            upper = ordered[n_lower:]
+            heapq.heapify(lower)
+            pending.clear()
+
+        if len(values) < window:
+            continue
+
+        if window % 2 == 1:
+            yield float(-lower[0])
+        else:
+            yield (-lower[0] + upper[0]) / 2.0
+
+
+def _check_window(window: int) -> None:
+    """Validate a window size."""
+    if window <= 0:
+        raise ValueError("Window size must be positive")
@@ -0,0 +1,443 @@
+"""
+Streaming (online) statistics.
+
+This module provides accumulators that update descriptive statistics one
+value at a time in constant memory, so they can be used on unbounded
+streams and combined across shards.
+"""
+
+from itertools import islice
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from . import backend as _backend
+from .descriptive import _central_moments, _kurtosis, _skewness
+
+Number = Union[int, float]
+
+# (count, mean, M2, M3, M4, min, max) of a block of values, where M_k is
+# the sum of k-th powers of deviations from the mean
+Moments = Tuple[int, float, float, float, float, Number, Number]
+
+# Values consumed per block by RunningStats.extend
+_CHUNK_SIZE = 4096
+
+
+class RunningStats:
+    """
+    Mergeable accumulator for mean, variance, shape and range in O(1) memory.
+
+    Values are added with ``push`` or ``extend``, and partial results built
+    on separate shards are combined with ``merge``. Queries follow the same
+    semantics (including errors) as the functions in
+    ``statlib.descriptive``.
+
+    Parameters
+    ----------
+    data : Iterable[Union[int, float]], optional
+        Initial values to accumulate
+
+    Examples
+    --------
+    >>> stats = RunningStats([1, 2, 3])
+    >>> stats.push(4)
+    >>> stats.push(5)
+    >>> stats.mean()
+    3.0
+    >>> stats.variance(sample=True)
+    2.5
+
+    >>> left, right = RunningStats([1, 2]), RunningStats([3, 4, 5])
+    >>> left.merge(right)
+    >>> left.variance(sample=False)
+    2.0
+
+    Notes
+    -----
+    Single values use Welford's update. Blocks of values and merges use the
+    pairwise combination of Chan, Golub and LeVeque:
+    M2 = M2_a + M2_b + δ² · n_a · n_b / n, with δ = mean_b - mean_a.
+    The third and fourth central moment sums (for skewness and kurtosis)
+    are updated and merged with the matching formulas of Pébay (2008).
+    Space Complexity: O(1)
+    """
+
+    __slots__ = ("_n", "_mean", "_m2", "_m3", "_m4", "_min", "_max")
+
+    def __init__(self, data: Optional[Iterable[Number]] = None) -> None:
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._m3 = 0.0
+        self._m4 = 0.0
+        self._min: Number = 0.0
+        self._max: Number = 0.0
+
+        if data is not None:
+            self.extend(data)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __repr__(self) -> str:
+        if not self._n:
+            return "RunningStats(count=0)"
+        return (
+            f"RunningStats(count={self._n}, mean={self._mean!r}, "
+            f"min={self._min!r}, max={self._max!r})"
+        )
+
+    @property
+    def count(self) -> int:
+        """Number of values accumulated so far."""
+        return self._n
+
+    def push(self, x: Number) -> None:
+        """
+        Add a single value.
+
+        Parameters
+        ----------
+        x : Union[int, float]
+            The value to add
+
+        Notes
+        -----
+        Time Complexity: O(1)
+        """
+        n = self._n + 1
+        delta = x - self._mean
+        delta_n = delta / n
+        term = delta * delta_n * (n - 1)
+        m2 = self._m2
+        self._m4 += (
+            term * delta_n * delta_n * (n * n - 3 * n + 3)
+            + 6.0 * delta_n * delta_n * m2
+            - 4.0 * delta_n * self._m3
+        )
+        self._m3 += term * delta_n * (n - 2) - 3.0 * delta_n * m2
+        self._mean += delta_n
+        self._m2 += delta * (x - self._mean)
+        self._n = n
+
+        if n == 1:
+            self._min = self._max = x
+        elif x < self._min:
+            self._min = x
+        elif x > self._max:
+            self._max = x
+
+    def extend(self, data: Iterable[Number]) -> None:
+        """
+        Add every value from an iterable.
+
+        The iterable is consumed in fixed-size blocks: each block is
+        summarized with C-level builtins and then merged, which is both
+        faster and more accurate than pushing values one by one.
+
+        Parameters
+        ----------
+        data : Iterable[Union[int, float]]
+            Values to add; may be a generator or other single-pass stream
+
+        Notes
+        -----
+        Time Complexity: O(n)
+        Space Complexity: O(block size)
+        """
+        iterator = iter(data)
+        while True:
+            block = list(islice(iterator, _CHUNK_SIZE))
+            if not block:
+                return
+
+            self._combine(*_block_moments(block))
+
+    def merge(self, other: "RunningStats") -> None:
+        """
+        Fold the state of another accumulator into this one.
+
+        The result is the same as if every value pushed into ``other`` had
+        been pushed into this accumulator. ``other`` is left unchanged.
+
+        Parameters
+        ----------
+        other : RunningStats
+            Accumulator to merge in
+
+        Raises
+        ------
+        TypeError
+            If other is not a RunningStats instance
+
+        Notes
+        -----
+        Time Complexity: O(1)
+        """
+        if not isinstance(other, RunningStats):
+            raise TypeError("Can only merge with another RunningStats")
+
+        if other._n:
+            self._combine(
+                other._n,
+                other._mean,
+                other._m2,
+                other._m3,
+                other._m4,
+                other._min,
+                other._max,
+            )
+
+    def _combine(
+        self,
+        n_b: int,
+        mean_b: float,
+        m2_b: float,
+        m3_b: float,
+        m4_b: float,
+        min_b: Number,
+        max_b: Number,
+    ) -> None:
+        """Pairwise (Chan et al., Pébay) update with a summarized block."""
+        n_a = self._n
+        if not n_a:
+            self._n = n_b
+            self._mean = mean_b
+            self._m2 = m2_b
+            self._m3 = m3_b
+            self._m4 = m4_b
+            self._min = min_b
+            self._max = max_b
+            return
+
+        n = n_a + n_b
+        m2_a = self._m2
+        m3_a = self._m3
+        delta = mean_b - self._mean
+        delta_n = delta / n
+        term = delta * delta_n * n_a * n_b
+        self._m4 += (
+            m4_b
+            + term * delta_n * delta_n * (n_a * n_a - n_a * n_b + n_b * n_b)
+            + 6.0 * delta_n * delta_n * (n_a * n_a * m2_b + n_b * n_b * m2_a)
+            + 4.0 * delta_n * (n_a * m3_b - n_b * m3_a)
+        )
+        self._m3 += (
+            m3_b
+            + term * delta_n * (n_a - n_b)
+            + 3.0 * delta_n * (n_a * m2_b - n_b * m2_a)
+        )
+        self._mean += delta * n_b / n
+        self._m2 += m2_b + delta * delta * n_a * n_b / n
+        self._n = n
+
+        if min_b < self._min:
+            self._min = min_b
+        if max_b > self._max:
+            self._max = max_b
+
+    def mean(self) -> float:
+        """
+        Return the arithmetic mean of the accumulated values.
+
+        Raises
+        ------
+        ValueError
+            If no values have been accumulated
+        """
+        if not self._n:
+            raise ValueError("Cannot compute mean of empty dataset")
+
+        return float(self._mean)
+
+    def variance(self, sample: bool = True) -> float:
+        """
+        Return the variance of the accumulated values.
+
+        Parameters
+        ----------
+        sample : bool, default=True
+            If True, calculate sample variance (divide by n-1)
+            If False, calculate population variance (divide by n)
+
+        Raises
+        ------
+        ValueError
+            If no values have been accumulated or if sample variance
+            requested with < 2 values
+        """
+        if not self._n:
+            raise ValueError("Cannot compute variance of empty dataset")
+
+        if sample and self._n < 2:
+            raise ValueError("Sample variance requires at least 2 data points")
+
+        if sample:
+            return self._m2 / (self._n - 1)
+        else:
+            return self._m2 / self._n
+
+    def stdev(self, sample: bool = True) -> float:
+        """
+        Return the standard deviation of the accumulated values.
+
+        Parameters
+        ----------
+        sample : bool, default=True
+            If True, calculate sample standard deviation
+            If False, calculate population standard deviation
+
+        Raises
+        ------
+        ValueError
+            If no values have been accumulated or if sample stdev
+            requested with < 2 values
+        """
+        if not self._n:
+            raise ValueError("Cannot compute standard deviation of empty dataset")
+
+        return self.variance(sample=sample) ** 0.5
+
+    def skewness(self, sample: bool = True) -> float:
+        """
+        Return the skewness of the accumulated values.
+
+        Parameters
+        ----------
+        sample : bool, default=True
+            If True, calculate the bias-corrected sample skewness
+            If False, calculate the population skewness
+
+        Raises
+        ------
+        ValueError
+            If no values have been accumulated, all values are equal, or
+            sample skewness requested with < 3 values
+        """
+        if not self._n:
+            raise ValueError("Cannot compute skewness of empty dataset")
+
+        if sample and self._n < 3:
+            raise ValueError("Sample skewness requires at least 3 data points")
+
+        return _skewness(self._n, self._m2, self._m3, sample)
+
+    def kurtosis(self, sample: bool = True, excess: bool = True) -> float:
+        """
+        Return the kurtosis of the accumulated values.
+
+        Parameters
+        ----------
+        sample : bool, default=True
+            If True, calculate the bias-corrected sample kurtosis
+            If False, calculate the population kurtosis
+        excess : bool, default=True
+            If True, subtract 3 so that a normal distribution scores 0
+
+        Raises
+        ------
+        ValueError
+            If no values have been accumulated, all values are equal, or
+            sample kurtosis requested with < 4 values
+        """
+        if not self._n:
+            raise ValueError("Cannot compute kurtosis of empty dataset")
+
+        if sample and self._n < 4:
+            raise ValueError("Sample kurtosis requires at least 4 data points")
+
+        return _kurtosis(self._n, self._m2, self._m4, sample, excess)
+
+    def min(self) -> float:
+        """
+        Return the smallest accumulated value.
+
+        Raises
+        ------
+        ValueError
+            If no values have been accumulated
+        """
+        if not self._n:
+            raise ValueError("Cannot compute minimum of empty dataset")
+
+        return float(self._min)
+
+    def max(self) -> float:
+        """
+        Return the largest accumulated value.
+
+        Raises
+        ------
+        ValueError
+            If no values have been accumulated
+        """
+        if not self._n:
+            raise ValueError("Cannot compute maximum of empty dataset")
+
+        return float(self._max)
+
+    def data_range(self) -> float:
+        """
+        Return the range (max - min) of the accumulated values.
+
+        Raises
+        ------
+        ValueError
+            If no values have been accumulated
+        """
+        if not self._n:
+            raise ValueError("Cannot compute range of empty dataset")
+
+        return float(self._max - self._min)
+
+
+def _block_moments(values: Sequence[Number]) -> Moments:
+    """Count, mean, M2, M3, M4, min and max of a non-empty block, by two passes."""
+    n = len(values)
+    array = _backend._as_array(values, convert_lists=False)
+    if array is not None:
+        block_mean = float(array.mean())
+        deviations = array - block_mean
+        squares = deviations * deviations
+        return (
+            n,
+            block_mean,
+            float(squares.sum()),
+            float((squares * deviations).sum()),
+            float((squares * squares).sum()),
+            float(array.min()),
+            float(array.max()),
+        )
+
+    block_mean = sum(values) / n
+    m2, m3, m4 = _central_moments(values, block_mean)
+    return n, block_mean, m2, m3, m4, min(values), max(values)
+
+
+def _default_range(lowest: float, highest: float) -> Tuple[float, float]:
+    """Histogram edges spanning the data, widened when all values are equal."""
+    low, high = float(lowest), float(highest)
+    if low == high:
+        high = low + 1.0
+    return low, high
+
+
+def _bin_counts(
+    values: Sequence[float], low: float, high: float, bins: int
+) -> List[int]:
+    """Equal-width bin counts of the values within [low, high]."""
+    scale = bins / (high - low)
+    array_values = _backend._as_array(values, convert_lists=False)
+    if array_values is not None:
+        np = _backend.np
+        inside = array_values[(array_values >= low) & (array_values <= high)]
+        index = ((inside - low) * scale).astype(np.int64)
+        np.minimum(index, bins - 1, out=index)
+        return np.bincount(index, minlength=bins).tolist()
+
+    counts = [0] * bins
+    last = bins - 1
+    for x in values:
+        if low <= x <= high:
+            i = int((x - low) * scale)
+            counts[i if i < bins else last] += 1
+    return counts
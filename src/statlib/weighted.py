@@ -0,0 +1,522 @@
+"""
+Weighted descriptive statistics.
+
+Each value comes with a non-negative weight, typically a count of how many
+times it occurs in pre-aggregated (value, count) data. Results equal the
+unweighted functions in ``statlib.descriptive`` applied to the data with
+every value repeated ``weight`` times, but the repeated data is never built:
+moments are accumulated in one blocked pass and quantiles are found by one
+weighted selection. The variance and quantile functions also accept
+reliability weights (``weight_type="reliability"``), whose scale does not
+affect the result.
+
+Values and weights are given as parallel sequences or buffers of the same
+length. Zero weights are allowed and drop the value; negative weights are
+rejected.
+"""
+
+import math
+import sys
+from operator import mul
+from typing import Dict, List, Sequence, Tuple, Union
+
+from . import backend as _backend
+from ._buffers import NumericData, as_values
+from .descriptive import (
+    _QUANTILE_METHODS,
+    _SELECT_CUTOFF,
+    _interpolate,
+    _median_of_three,
+    _quantile_position,
+)
+
+Number = Union[int, float]
+
+# Values summarized per block before the block is merged into the running total
+_BLOCK_SIZE = 4096
+
+_WEIGHT_TYPES = ("frequency", "reliability")
+
+
+def weighted_mean(values: NumericData, weights: NumericData) -> float:
+    """
+    Calculate the weighted arithmetic mean.
+
+    Parameters
+    ----------
+    values : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
+    weights : Sequence[Union[int, float]] or buffer
+        Non-negative weight of each value
+
+    Returns
+    -------
+    float
+        Σ wᵢxᵢ / Σ wᵢ
+
+    Raises
+    ------
+    ValueError
+        If the input is empty, the lengths differ, a weight is negative or
+        the weights sum to zero
+
+    Examples
+    --------
+    >>> weighted_mean([1, 2, 3], [3, 1, 0])
+    1.25
+
+    Notes
+    -----
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+    return _weighted_moments(values, weights, "mean")[1]
+
+
+def weighted_variance(
+    values: NumericData,
+    weights: NumericData,
+    sample: bool = True,
+    weight_type: str = "frequency",
+) -> float:
+    """
+    Calculate the weighted variance.
+
+    Parameters
+    ----------
+    values : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
+    weights : Sequence[Union[int, float]] or buffer
+        Non-negative weight of each value
+    sample : bool, default=True
+        If True, calculate the unbiased sample variance
+        If False, calculate the population variance Σ wᵢ(xᵢ - x̄)² / V₁
+    weight_type : str, default="frequency"
+        Meaning of the weights for the sample variance:
+
+        - ``"frequency"``: weights are occurrence counts, so the result
+          equals ``variance`` of the expanded data (divide by V₁ - 1)
+        - ``"reliability"``: weights are relative importance and their
+          scale is irrelevant (divide by V₁ - V₂ / V₁)
+
+        where V₁ = Σ wᵢ and V₂ = Σ wᵢ².
+
+    Returns
+    -------
+    float
+        The weighted variance
+
+    Raises
+    ------
+    ValueError
+        If the input is empty, the lengths differ, a weight is negative,
+        the weights sum to zero, the weight type is unknown, or a sample
+        variance is requested with too little weight (total weight at most
+        1 for frequency weights, a single non-zero weight for reliability
+        weights)
+
+    Examples
+    --------
+    >>> weighted_variance([1, 2, 3], [1, 2, 1])
+    0.6666666666666666
+
+    >>> weighted_variance([1, 2, 3], [1, 2, 1], weight_type="reliability")
+    0.8
+
+    Notes
+    -----
+    Blocks of values are reduced with two passes and merged with the
+    weighted pairwise update of Chan, Golub and LeVeque.
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+    if weight_type not in _WEIGHT_TYPES:
+        raise ValueError(f"Unknown weight type: {weight_type!r}")
+
+    total, _, m2, squares = _weighted_moments(values, weights, "variance")
+
+    if not sample:
+        return m2 / total
+
+    if weight_type == "frequency":
+        if total <= 1:
+            raise ValueError("Sample variance requires a total weight above 1")
+        return m2 / (total - 1)
+
+    denominator = total - squares / total
+    if denominator <= 0:
+        raise ValueError("Sample variance requires at least 2 weighted data points")
+    return m2 / denominator
+
+
+def weighted_stdev(
+    values: NumericData,
+    weights: NumericData,
+    sample: bool = True,
+    weight_type: str = "frequency",
+) -> float:
+    """
+    Calculate the weighted standard deviation.
+
+    Parameters
+    ----------
+    values : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
+    weights : Sequence[Union[int, float]] or buffer
+        Non-negative weight of each value
+    sample : bool, default=True
+        If True, take the square root of the sample variance
+    weight_type : str, default="frequency"
+        ``"frequency"`` or ``"reliability"``, as in ``weighted_variance``
+
+    Returns
+    -------
+    float
+        The square root of ``weighted_variance``
+
+    Raises
+    ------
+    ValueError
+        As for ``weighted_variance``
+
+    Examples
+    --------
+    >>> weighted_stdev([2, 4, 5, 7, 9], [1, 3, 2, 1, 1], sample=False)
+    2.0
+
+    Notes
+    -----
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+    return math.sqrt(weighted_variance(values, weights, sample, weight_type))
+
+
+def weighted_median(
+    values: NumericData, weights: NumericData, weight_type: str = "frequency"
+) -> float:
+    """
+    Calculate the weighted median.
+
+    Parameters
+    ----------
+    values : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
+    weights : Sequence[Union[int, float]] or buffer
+        Non-negative weight of each value
+    weight_type : str, default="frequency"
+        Meaning of the weights, as for ``weighted_quantiles``
+
+    Returns
+    -------
+    float
+        For frequency weights, the median of the data with each value
+        repeated ``weight`` times; when the halves balance exactly, the
+        average of the two middle values
+
+    Raises
+    ------
+    ValueError
+        As ``weighted_quantiles``
+
+    Examples
+    --------
+    >>> weighted_median([1, 2, 3, 4], [1, 1, 1, 5])
+    4.0
+
+    >>> weighted_median([1, 2, 3, 4], [1, 1, 1, 1])
+    2.5
+
+    >>> weighted_median([1, 2, 3], [0.2, 0.3, 0.5], weight_type="reliability")
+    2.0
+
+    Notes
+    -----
+    Time Complexity: O(n) expected
+    Space Complexity: O(n) for partition copies
+    """
+    return weighted_quantiles(values, weights, [0.5], weight_type=weight_type)[0]
+
+
+def weighted_quantiles(
+    values: NumericData,
+    weights: NumericData,
+    probs: Sequence[float],
+    method: str = "linear",
+    weight_type: str = "frequency",
+) -> List[float]:
+    """
+    Calculate several weighted quantiles with one weighted selection.
+
+    Quantile positions are located on the cumulative weight, exactly as
+    ``quantiles`` locates them on the rank of the expanded data.
+
+    Parameters
+    ----------
+    values : Sequence[Union[int, float]] or buffer
+        A list or buffer of numeric values
+    weights : Sequence[Union[int, float]] or buffer
+        Non-negative weight of each value
+    probs : Sequence[float]
+        Probabilities in [0, 1]
+    method : str, default="linear"
+        Any method accepted by ``quantiles``
+    weight_type : str, default="frequency"
+        Meaning of the weights:
+
+        - ``"frequency"``: weights are occurrence counts, possibly
+          fractional, and their total plays the role of n, so integer
+          weights give the same result as ``quantiles`` on the expanded
+          data. The total must be at least 1.
+        - ``"reliability"``: weights are relative importance and their
+          scale is irrelevant. They are normalized to a mean of 1 over the
+          non-zero weights, so equal weights give ``quantiles`` of the
+          values.
+
+    Returns
+    -------
+    List[float]
+        One quantile per probability, in the order given. Probability 0
+        gives the smallest and probability 1 the largest value with
+        non-zero weight.
+
+    Raises
+    ------
+    ValueError
+        If the input is empty, the lengths differ, a weight is negative,
+        the weights sum to zero (or to less than 1 for frequency weights),
+        a probability is outside [0, 1], or the method or weight type is
+        unknown
+
+    Examples
+    --------
+    >>> weighted_quantiles([10, 20, 30], [1, 2, 1], [0.25, 0.5, 0.75])
+    [17.5, 20.0, 22.5]
+
+    >>> weighted_quantiles([1, 2, 3], [0.1] * 3, [0.5, 1.0], weight_type="reliability")
+    [2.0, 3.0]
+
+    Notes
+    -----
+    All needed cumulative-weight ranks are found by one multi-rank weighted
+    quickselect, which never sorts or expands the data. The last order
+    statistic, and any rank beyond it when the total weight is fractional,
+    is the largest value.
+    Time Complexity: O(n log m) expected for m distinct probabilities
+    Space Complexity: O(n) for partition copies
+    """
+    if method not in _QUANTILE_METHODS:
+        raise ValueError(f"Unknown quantile method: {method!r}")
+
+    if weight_type not in _WEIGHT_TYPES:
+        raise ValueError(f"Unknown weight type: {weight_type!r}")
+
+    for p in probs:
+        if not 0.0 <= p <= 1.0:
+            raise ValueError("Probabilities must be between 0 and 1")
+
+    values, weights = _check_pair(values, weights, "quantiles")
+    total = _total_weight(weights)
+    if 0 in weights:
+        # Zero weights would match no rank; drop them so selection need not
+        # skip them
+        kept = [i for i, w in enumerate(weights) if w]
+        values = [values[i] for i in kept]
+        weights = [weights[i] for i in kept]
+
+    if weight_type == "frequency":
+        if total < 1:
+            raise ValueError(
+                "Frequency weights must sum to at least 1; "
+                'use weight_type="reliability" for normalized weights'
+            )
+        n, scale, nudge = total, 1, 0.0
+    else:
+        # Ranks on the normalized scale (total n) map to cumulative weight
+        # k * total / n; the nudge keeps rounding in the sums from moving a
+        # rank that falls on a boundary into the preceding value
+        n = len(weights)
+        scale = total / n
+        nudge = 4 * n * sys.float_info.epsilon * total
+
+    positions = [_quantile_position(n, p, method) for p in probs]
+    top = _quantile_position(n, 1.0, method)
+    last = n - 1
+
+    wanted = set()
+    for position in positions:
+        if position != top:
+            lo, hi, _ = position
+            wanted.update(r * scale + nudge for r in (lo, hi) if r < last)
+    found = _select_weighted(values, weights, sorted(wanted)) if wanted else {}
+    largest = max(values)
+
+    result = []
+    for position in positions:
+        if position == top:
+            result.append(float(largest))
+            continue
+        lo, hi, frac = position
+        lower = largest if lo >= last else found[lo * scale + nudge]
+        upper = largest if hi >= last else found[hi * scale + nudge]
+        result.append(_interpolate(lower, upper, frac))
+    return result
+
+
+def _check_pair(
+    values: NumericData, weights: NumericData, name: str
+) -> Tuple[Sequence[Number], Sequence[Number]]:
+    """Validate parallel values and weights, returned as indexable sequences."""
+    values = as_values(values)
+    weights = as_values(weights)
+
+    if not len(values):
+        raise ValueError(f"Cannot compute weighted {name} of empty dataset")
+
+    if len(values) != len(weights):
+        raise ValueError("values and weights must have the same length")
+
+    return values, weights
+
+
+def _total_weight(weights: Sequence[Number]) -> Number:
+    """Sum of the weights, which must be non-negative with a positive total."""
+    if len(weights) and min(weights) < 0:
+        raise ValueError("Weights must be non-negative")
+
+    total = sum(weights)
+    if not total > 0:
+        raise ValueError("Weights must sum to a positive value")
+    return total
+
+
+def _weighted_moments(
+    values: NumericData, weights: NumericData, name: str
+) -> Tuple[float, float, float, float]:
+    """Return (V₁, weighted mean, Σ wᵢ(xᵢ - x̄)², V₂) in one blocked pass."""
+    values, weights = _check_pair(values, weights, name)
+
+    value_array = _backend._as_array(values, convert_lists=True)
+    weight_array = _backend._as_array(weights, convert_lists=True)
+    if value_array is not None and weight_array is not None:
+        float64 = _backend.np.float64
+        value_array = value_array.astype(float64, copy=False)
+        weight_array = weight_array.astype(float64, copy=False)
+        if weight_array.min() < 0:
+            raise ValueError("Weights must be non-negative")
+        total = float(weight_array.sum())
+        if not total > 0:
+            raise ValueError("Weights must sum to a positive value")
+        center = float(weight_array @ value_array) / total
+        deviations = value_array - center
+        return (
+            total,
+            center,
+            float(weight_array @ (deviations * deviations)),
+            float(weight_array @ weight_array),
+        )
+
+    n = len(values)
+    total = 0.0
+    center = 0.0
+    m2 = 0.0
+    squares = 0.0
+    for start in range(0, n, _BLOCK_SIZE):
+        xs = values[start : start + _BLOCK_SIZE]
+        ws = weights[start : start + _BLOCK_SIZE]
+        if min(ws) < 0:
+            raise ValueError("Weights must be non-negative")
+
+        block_total = sum(ws)
+        if not block_total:
+            continue
+        block_mean = sum(map(mul, xs, ws)) / block_total
+        deviations = [x - block_mean for x in xs]
+        block_m2 = sum(map(mul, ws, map(mul, deviations, deviations)))
+        squares += sum(map(mul, ws, ws))
+
+        if not total:
+            total, center, m2 = block_total, block_mean, block_m2
+            continue
+
+        merged = total + block_total
+        delta = block_mean - center
+        center += delta * block_total / merged
+        m2 += block_m2 + delta * delta * total * block_total / merged
+        total = merged
+
+    if not total > 0:
+        raise ValueError("Weights must sum to a positive value")
+
+    return total, center, m2, squares
+
+
+def _select_weighted(
+    values: Sequence[Number], weights: Sequence[Number], ranks: List[float]
+) -> Dict[float, Number]:
+    """
+    Return {rank: value} for cumulative-weight ranks of unsorted data.
+
+    The value at rank r is the smallest x whose cumulative weight (the
+    total weight of values <= x) exceeds r; for unit weights this is the
+    0-based order statistic. Weights must be positive. Three-way weighted
+    quickselect on copies, with the same step budget and sort fallback as
+    ``_select_ranks``.
+    """
+    found: Dict[float, Number] = {}
+    budget = 2 * len(values).bit_length()
+    # (values, weights, requested ranks within them, weight below them, budget)
+    pending = [(values, weights, ranks, 0, budget)]
+
+    while pending:
+        xs, ws, wanted, offset, budget = pending.pop()
+        n = len(xs)
+
+        if n <= _SELECT_CUTOFF or budget == 0:
+            cumulative = 0
+            wanted_iter = iter(wanted)
+            r = next(wanted_iter)
+            for x, w in sorted(zip(xs, ws)):
+                cumulative += w
+                while r - offset < cumulative:
+                    found[r] = x
+                    r = next(wanted_iter, None)
+                    if r is None:
+                        break
+                if r is None:
+                    break
+            else:
+                # Rounding left the top rank at the total weight: it belongs
+                # to the largest value
+                last = max(xs)
+                found[r] = last
+                for r in wanted_iter:
+                    found[r] = last
+            continue
+
+        pivot = _median_of_three(xs, 0, n - 1)
+        low_w = [w for x, w in zip(xs, ws) if x < pivot]
+        low_weight = sum(low_w)
+
+        if wanted[-1] - offset < low_weight:
+            lows = [x for x in xs if x < pivot]
+            pending.append((lows, low_w, wanted, offset, budget - 1))
+            continue
+
+        high_w = [w for x, w in zip(xs, ws) if x > pivot]
+        high_start = offset + sum(ws) - sum(high_w)
+
+        low_ranks = [r for r in wanted if r - offset < low_weight]
+        high_ranks = [r for r in wanted if r >= high_start]
+        for r in wanted:
+            if offset + low_weight <= r < high_start:
+                found[r] = pivot
+
+        if low_ranks:
+            lows = [x for x in xs if x < pivot]
+            pending.append((lows, low_w, low_ranks, offset, budget - 1))
+        if high_ranks:
+            highs = [x for x in xs if x > pivot]
+            pending.append((highs, high_w, high_ranks, high_start, budget - 1))
+
+    return found
@@ -0,0 +1,13 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import random
+
+import pytest
+
+
+@pytest.fixture
+def rng():
+    """Seeded generator for the tests that need large random samples."""
+    return random.Random(2024)
@@ -0,0 +1,27 @@
+"""
+Shared configuration for performance tests.
+
+Benchmarks marked ``large`` allocate very large inputs and are skipped
+unless pytest is run with ``--run-large``.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-large",
+        action="store_true",
+        default=False,
+        help="run benchmarks marked 'large' (very large inputs)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-large"):
+        return
+
+    skip_large = pytest.mark.skip(reason="needs --run-large")
+    for item in items:
+        if "large" in item.keywords:
+            item.add_marker(skip_large)
@@ -5,8 +5,73 @@ These tests verify that functions meet time complexity requirements
 and perform within acceptable time limits.
 """
 
+import array
+import csv
+import functools
+import math
+import random
+import tracemalloc
+
 import pytest
-from src.statlib.descriptive import mean, median, variance, stdev
+from src.statlib.batch import batch_describe, batch_describe_ragged
+from src.statlib.dataset import Dataset
+from src.statlib.descriptive import (
+    mean,
+    median,
+    variance,
+    stdev,
+    data_range,
+    describe,
+    quantiles,
+    mode,
+)
+from src.statlib.backend import numpy_available, use_backend
+from src.statlib.distributions import (
+    Normal,
+    normal_cdf,
+    normal_cdf_batch,
+    normal_pdf,
+    normal_pdf_batch,
+    normal_ppf,
+    normal_ppf_batch,
+    random_normal,
+)
+from src.statlib.grouped import GroupedStats, grouped_describe
+from src.statlib.multivariate import cov
+from src.statlib.orderstats import OrderStatistics
+from src.statlib.parallel import histogram, summarize
+from src.statlib.readers import describe_csv, describe_file
+from src.statlib.resampling import bootstrap
+from src.statlib.rolling import rolling_median, rolling_stdev
+from src.statlib.sketches import HeavyHitters
+from src.statlib.weighted import weighted_quantiles, weighted_variance
+
+
+@functools.lru_cache(maxsize=None)
+def _random_data(size, seed=42):
+    """Unsorted floats, so ordering steps do real work (cached, do not mutate)."""
+    rng = random.Random(seed)
+    return [rng.uniform(-1000, 1000) for _ in range(size)]
+
+
+def _sort_median(data):
+    """Median via a full sort, as median() worked before selection."""
+    ordered = sorted(data)
+    n = len(ordered)
+    if n % 2 == 1:
+        return float(ordered[n // 2])
+    return (ordered[n // 2 - 1] + ordered[n // 2]) / 2.0
+
+
+def _separate_summary(data):
+    """Summary built from the individual functions, as callers did before."""
+    return {
+        "mean": mean(data),
+        "median": median(data),
+        "variance": variance(data, sample=True),
+        "stdev": stdev(data, sample=True),
+        "range": data_range(data),
+    }
 
 
 class TestPerformance:
@@ -69,6 +134,893 @@ class TestPerformance:
         assert result > 0
 
 
+class TestSummaryPerformance:
+    """Fused describe() versus calling each function separately."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("size", [1000, 10000, 100000])
+    def test_separate_calls_performance(self, benchmark, size):
+        """Baseline: mean, median, variance, stdev and range one by one."""
+        data = _random_data(size)
+        result = benchmark(_separate_summary, data)
+        assert result["range"] > 0
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("size", [1000, 10000, 100000])
+    def test_describe_performance(self, benchmark, size):
+        """describe() computing the same statistics in one call."""
+        data = _random_data(size)
+        result = benchmark(describe, data)
+        expected = _separate_summary(data)
+        assert result["median"] == expected["median"]
+        assert result["stdev"] == expected["stdev"]
+
+
+MEDIAN_SIZES = [
+    100000,
+    1000000,
+    pytest.param(10000000, marks=pytest.mark.large),
+]
+
+
+class TestMedianSelection:
+    """Selection-based median versus sorting, on unsorted data."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("size", MEDIAN_SIZES)
+    def test_sort_median_performance(self, benchmark, size):
+        """Baseline: median from a fully sorted copy."""
+        data = _random_data(size)
+        benchmark.pedantic(_sort_median, args=(data,), rounds=5)
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("size", MEDIAN_SIZES)
+    def test_select_median_performance(self, benchmark, size):
+        """median() using quickselect on partition copies."""
+        data = _random_data(size)
+        result = benchmark.pedantic(median, args=(data,), rounds=5)
+        assert result == _sort_median(data)
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("size", MEDIAN_SIZES)
+    def test_in_place_median_performance(self, benchmark, size):
+        """median(in_place=True) reusing a scratch buffer, no extra memory."""
+        data = _random_data(size)
+        result = benchmark.pedantic(
+            median,
+            setup=lambda: ((list(data),), {"in_place": True}),
+            rounds=5,
+        )
+        assert result == _sort_median(data)
+
+
+LATENCY_PROBS = [0.5, 0.9, 0.99, 0.999]
+
+
+def _sort_quantiles(data, probs):
+    """Percentiles by sorting once per requested probability."""
+    results = []
+    for p in probs:
+        ordered = sorted(data)
+        h = (len(ordered) - 1) * p
+        lo = int(h)
+        hi = min(lo + 1, len(ordered) - 1)
+        results.append(ordered[lo] + (ordered[hi] - ordered[lo]) * (h - lo))
+    return results
+
+
+class TestQuantilePerformance:
+    """Shared multi-select versus one sort per percentile."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("size", [100000, 1000000])
+    def test_sort_per_quantile_performance(self, benchmark, size):
+        """Baseline: p50/p90/p99/p99.9 with a sort per percentile."""
+        data = _random_data(size)
+        benchmark.pedantic(_sort_quantiles, args=(data, LATENCY_PROBS), rounds=3)
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("size", [100000, 1000000])
+    def test_quantiles_performance(self, benchmark, size):
+        """quantiles() with one multi-select pass."""
+        data = _random_data(size)
+        result = benchmark.pedantic(quantiles, args=(data, LATENCY_PROBS), rounds=3)
+        expected = _sort_quantiles(data, LATENCY_PROBS)
+        assert all(abs(r - e) < 1e-9 for r, e in zip(result, expected))
+
+
+ROLLING_WINDOW = 500
+
+
+def _sliced_rolling(func, data, window):
+    """Recompute func on every window slice, as monitoring did before."""
+    return [func(data[i : i + window]) for i in range(len(data) - window + 1)]
+
+
+class TestRollingPerformance:
+    """Incremental rolling statistics versus recomputing each window."""
+
+    @pytest.mark.performance
+    def test_sliced_median_performance(self, benchmark):
+        """Baseline: median() on each window slice."""
+        data = _random_data(20000)
+        benchmark.pedantic(
+            _sliced_rolling, args=(median, data, ROLLING_WINDOW), rounds=3
+        )
+
+    @pytest.mark.performance
+    def test_rolling_median_performance(self, benchmark):
+        """rolling_median() with two heaps."""
+        data = _random_data(20000)
+        result = benchmark.pedantic(
+            lambda: list(rolling_median(data, ROLLING_WINDOW)), rounds=3
+        )
+        assert len(result) == len(data) - ROLLING_WINDOW + 1
+
+    @pytest.mark.performance
+    def test_sliced_stdev_performance(self, benchmark):
+        """Baseline: stdev() on each window slice."""
+        data = _random_data(20000)
+        benchmark.pedantic(
+            _sliced_rolling, args=(stdev, data, ROLLING_WINDOW), rounds=3
+        )
+
+    @pytest.mark.performance
+    def test_rolling_stdev_performance(self, benchmark):
+        """rolling_stdev() with sliding Welford updates."""
+        data = _random_data(20000)
+        result = benchmark.pedantic(
+            lambda: list(rolling_stdev(data, ROLLING_WINDOW)), rounds=3
+        )
+        assert len(result) == len(data) - ROLLING_WINDOW + 1
+
+
+def _peak_memory(func, *args, **kwargs):
+    """Peak bytes allocated by Python while running func."""
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture(scope="module")
+def doubles():
+    """A million unsorted float64 values in an array.array."""
+    return array.array("d", _random_data(1000000))
+
+
+class TestBufferMemory:
+    """Peak memory of pure-Python buffer inputs versus converting to a list."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("func", [mean, variance, data_range, describe])
+    def test_buffer_peak_memory(self, doubles, func):
+        """Buffers stream through without materializing boxed floats."""
+        with use_backend("python"):
+            list_peak = _peak_memory(lambda: func(doubles.tolist()))
+            buffer_peak = _peak_memory(func, doubles)
+        # A list costs ~32 bytes per value; describe() still copies for selection
+        limit = list_peak if func is describe else list_peak / 100
+        assert buffer_peak < limit
+
+    @pytest.mark.performance
+    def test_in_place_median_peak_memory(self, doubles):
+        """In-place median on a writable buffer needs no per-value storage."""
+        scratch = array.array("d", doubles)
+        with use_backend("python"):
+            list_peak = _peak_memory(lambda: median(doubles.tolist()))
+            buffer_peak = _peak_memory(median, scratch, in_place=True)
+        assert buffer_peak < list_peak / 100
+
+    @pytest.mark.performance
+    def test_mean_buffer_performance(self, benchmark, doubles):
+        """mean() directly on an array of doubles."""
+        result = benchmark(mean, doubles)
+        assert abs(result - mean(_random_data(1000000))) < 1e-9
+
+
+@pytest.mark.skipif(not numpy_available(), reason="NumPy is not installed")
+class TestBackendPerformance:
+    """Pure-Python versus NumPy backends on the same inputs."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("backend", ["python", "numpy"])
+    @pytest.mark.parametrize("size", [10000, 1000000])
+    def test_variance_backend_performance(self, benchmark, backend, size):
+        """variance() of a list on each backend."""
+        data = _random_data(size)
+        with use_backend(backend):
+            result = benchmark(variance, data)
+        assert result > 0
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("backend", ["python", "numpy"])
+    @pytest.mark.parametrize("size", [10000, 1000000])
+    def test_median_backend_performance(self, benchmark, backend, size):
+        """median() of a list on each backend."""
+        data = _random_data(size)
+        with use_backend(backend):
+            result = benchmark(median, data)
+        assert result == _sort_median(data)
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("backend", ["python", "auto"])
+    def test_describe_buffer_backend_performance(self, benchmark, doubles, backend):
+        """describe() of an array of doubles, viewed by NumPy without copying."""
+        with use_backend(backend):
+            result = benchmark(describe, doubles)
+        assert result["count"] == len(doubles)
+
+
+PARALLEL_SIZES = [
+    2000000,
+    pytest.param(100000000, marks=pytest.mark.large),
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _random_doubles(size):
+    """Unsorted float64 values in an array.array (cached, do not mutate)."""
+    rng = random.Random(7)
+    values = array.array("d", bytes(8 * size))
+    for start in range(0, size, 1 << 20):
+        stop = min(size, start + (1 << 20))
+        values[start:stop] = array.array(
+            "d", (rng.uniform(-1000, 1000) for _ in range(stop - start))
+        )
+    return values
+
+
+class TestParallelScaling:
+    """Wall time of process-pool reductions across worker counts."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("workers", [1, 2, 4, 8])
+    @pytest.mark.parametrize("size", PARALLEL_SIZES)
+    def test_summarize_scaling(self, benchmark, size, workers):
+        """summarize() of a pure-Python reduction split over worker processes."""
+        data = _random_doubles(size)
+        with use_backend("python"):
+            result = benchmark.pedantic(
+                summarize, args=(data,), kwargs={"workers": workers}, rounds=3
+            )
+        assert result["count"] == size
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("workers", [1, 2, 4, 8])
+    def test_histogram_scaling(self, benchmark, workers):
+        """histogram() with a fixed range split over worker processes."""
+        data = _random_doubles(PARALLEL_SIZES[0])
+        with use_backend("python"):
+            counts, _ = benchmark.pedantic(
+                histogram,
+                args=(data, 64),
+                kwargs={"value_range": (-1000, 1000), "workers": workers},
+                rounds=3,
+            )
+        assert sum(counts) == len(data)
+
+
+FILE_SIZES = [
+    4000000,
+    pytest.param(134217728, marks=pytest.mark.large),
+]
+
+
+@pytest.fixture(scope="module")
+def doubles_file(tmp_path_factory):
+    """Write float64 files of each FILE_SIZES length on demand."""
+    directory = tmp_path_factory.mktemp("files")
+
+    def make(size):
+        path = directory / f"doubles_{size}.bin"
+        if not path.exists():
+            with open(path, "wb") as f:
+                for start in range(0, size, 1 << 20):
+                    stop = min(size, start + (1 << 20))
+                    _random_doubles(stop - start).tofile(f)
+        return path
+
+    return make
+
+
+class TestFileReaders:
+    """Throughput and memory of memory-mapped file statistics."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("size", FILE_SIZES)
+    def test_describe_file_performance(self, benchmark, doubles_file, size):
+        """describe_file() scanning a file sequentially in chunks."""
+        path = doubles_file(size)
+        result = benchmark.pedantic(describe_file, args=(path,), rounds=3)
+        assert result["count"] == size
+
+    @pytest.mark.performance
+    def test_describe_file_peak_memory(self, doubles_file):
+        """Python allocations stay bounded by the chunk size, not the file."""
+        path = doubles_file(FILE_SIZES[0])
+        with use_backend("python"):
+            peak = _peak_memory(describe_file, path, chunk_size=65536)
+        assert peak < 1 << 20
+
+
+CSV_BYTES = [
+    16 * 2**20,
+    pytest.param(2**30, marks=pytest.mark.large),
+]
+
+
+@pytest.fixture(scope="module")
+def csv_file(tmp_path_factory):
+    """Write CSV files of about the requested number of bytes on demand."""
+    directory = tmp_path_factory.mktemp("csv")
+
+    def make(nbytes):
+        path = directory / f"measurements_{nbytes}.csv"
+        if not path.exists():
+            rng = random.Random(9)
+            with open(path, "w") as f:
+                f.write("id,sensor,value,weight\n")
+                row = 0
+                while f.tell() < nbytes:
+                    lines = []
+                    for _ in range(10000):
+                        lines.append(
+                            f"{row},s{row % 7},{rng.gauss(20, 5)!r},"
+                            f"{rng.randint(1, 100)}\n"
+                        )
+                        row += 1
+                    f.write("".join(lines))
+        return path
+
+    return make
+
+
+def _list_columns(path, columns):
+    """Parse whole columns into lists, then summarize, as callers did before."""
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        names = next(reader)
+        indices = [names.index(column) for column in columns]
+        values = {column: [] for column in columns}
+        for row in reader:
+            for column, index in zip(columns, indices):
+                values[column].append(float(row[index]))
+    return {column: (mean(v), median(v)) for column, v in values.items()}
+
+
+class TestCsvReader:
+    """Throughput of the streaming CSV column reader."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("nbytes", CSV_BYTES)
+    def test_describe_csv_performance(self, benchmark, csv_file, nbytes):
+        """describe_csv() of two numeric columns in a single scan."""
+        path = csv_file(nbytes)
+        result = benchmark.pedantic(
+            describe_csv, args=(path, ["value", "weight"]), rounds=3
+        )
+        assert abs(result["value"]["mean"] - 20) < 1
+
+    @pytest.mark.performance
+    def test_list_columns_performance(self, benchmark, csv_file):
+        """Baseline: parse columns into lists and summarize each."""
+        path = csv_file(CSV_BYTES[0])
+        result = benchmark.pedantic(
+            _list_columns, args=(path, ["value", "weight"]), rounds=3
+        )
+        assert abs(result["value"][0] - 20) < 1
+
+    @pytest.mark.performance
+    def test_describe_csv_peak_memory(self, csv_file):
+        """Memory is bounded by the block size, not the file size."""
+        path = csv_file(CSV_BYTES[0])
+        peak = _peak_memory(describe_csv, path, ["value", "weight"])
+        assert peak < _peak_memory(_list_columns, path, ["value", "weight"]) / 4
+
+
+@functools.lru_cache(maxsize=None)
+def _keyed_records(size, groups):
+    """Random (keys, values) records over the given number of groups."""
+    rng = random.Random(13)
+    keys = [rng.randrange(groups) for _ in range(size)]
+    return keys, _random_data(size)
+
+
+def _bucketed_summary(keys, values):
+    """Bucket into a dict of lists, then summarize each, as callers did before."""
+    buckets = {}
+    for key, x in zip(keys, values):
+        buckets.setdefault(key, []).append(x)
+    return {
+        key: (mean(bucket), variance(bucket) if len(bucket) > 1 else 0.0)
+        for key, bucket in buckets.items()
+    }
+
+
+class TestGroupedPerformance:
+    """Single-pass group-by statistics versus bucketing into lists."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("groups", [100, 200000])
+    def test_grouped_describe_performance(self, benchmark, groups):
+        """grouped_describe() over a million records."""
+        keys, values = _keyed_records(1000000, groups)
+        result = benchmark.pedantic(grouped_describe, args=(keys, values), rounds=3)
+        assert sum(summary["count"] for summary in result.values()) == len(keys)
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("groups", [100, 200000])
+    def test_bucketed_summary_performance(self, benchmark, groups):
+        """Baseline: dict of lists, then mean() and variance() per bucket."""
+        keys, values = _keyed_records(1000000, groups)
+        result = benchmark.pedantic(_bucketed_summary, args=(keys, values), rounds=3)
+        assert len(result) <= groups
+
+    @pytest.mark.performance
+    def test_grouped_peak_memory(self):
+        """Per-group state costs less than holding every value."""
+        keys, values = _keyed_records(1000000, 200000)
+        stats = GroupedStats()
+        grouped_peak = _peak_memory(stats.extend, keys, values)
+        bucketed_peak = _peak_memory(_bucketed_summary, keys, values)
+        assert grouped_peak < bucketed_peak / 2
+
+
+@functools.lru_cache(maxsize=None)
+def _tiny_series(count):
+    """Many random series of 5 to 50 values (cached, do not mutate)."""
+    rng = random.Random(17)
+    return [
+        [rng.uniform(-1000, 1000) for _ in range(rng.randint(5, 50))]
+        for _ in range(count)
+    ]
+
+
+def _scalar_summaries(series):
+    """mean(), variance() and stdev() called per series, as callers did before."""
+    return [(mean(data), variance(data), stdev(data)) for data in series]
+
+
+def _record_throughput(benchmark, count):
+    """Store series per second in the benchmark report, when timings exist."""
+    if benchmark.stats is not None:
+        benchmark.extra_info["series_per_second"] = count / benchmark.stats["mean"]
+
+
+class TestBatchPerformance:
+    """Throughput, in series per second, of batched versus per-call statistics."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize(
+        "count", [100000, pytest.param(1000000, marks=pytest.mark.large)]
+    )
+    def test_batch_describe_throughput(self, benchmark, count):
+        """batch_describe() over many tiny series."""
+        series = _tiny_series(count)
+        result = benchmark.pedantic(batch_describe, args=(series,), rounds=3)
+        _record_throughput(benchmark, count)
+        assert len(result["mean"]) == count
+
+    @pytest.mark.performance
+    def test_batch_describe_ragged_throughput(self, benchmark):
+        """batch_describe_ragged() over the same series in one flat buffer."""
+        series = _tiny_series(100000)
+        values = array.array("d", [x for data in series for x in data])
+        offsets = [0]
+        for data in series:
+            offsets.append(offsets[-1] + len(data))
+        result = benchmark.pedantic(
+            batch_describe_ragged, args=(values, offsets), rounds=3
+        )
+        _record_throughput(benchmark, len(series))
+        assert len(result["mean"]) == len(series)
+
+    @pytest.mark.performance
+    def test_scalar_calls_throughput(self, benchmark):
+        """Baseline: mean(), variance() and stdev() called for each series."""
+        series = _tiny_series(100000)
+        with use_backend("python"):
+            result = benchmark.pedantic(_scalar_summaries, args=(series,), rounds=3)
+        _record_throughput(benchmark, len(series))
+        assert len(result) == len(series)
+
+
+@functools.lru_cache(maxsize=None)
+def _categories(size):
+    """Discretized telemetry: heavy-tailed integer categories."""
+    rng = random.Random(19)
+    return [int(rng.paretovariate(1.0)) for _ in range(size)]
+
+
+class TestFrequencyPerformance:
+    """Exact and sketched frequency counting."""
+
+    @pytest.mark.performance
+    def test_mode_performance(self, benchmark):
+        """mode() with a single hashing pass over a million values."""
+        data = _categories(1000000)
+        assert benchmark(mode, data) == 1
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("k", [100, 1000])
+    def test_heavy_hitters_extend_performance(self, benchmark, k):
+        """HeavyHitters.extend() over a million values."""
+        data = _categories(1000000)
+
+        def run():
+            hitters = HeavyHitters(k=k)
+            hitters.extend(data)
+            return hitters
+
+        hitters = benchmark(run)
+        assert hitters.top(1)[0][0] == 1
+
+
+def _analysis_session(stats):
+    """A typical sequence of questions asked of one dataset."""
+    return (
+        stats["median"](),
+        stats["range"](),
+        stats["quantiles"]([0.25, 0.75]),
+        stats["quantiles"](LATENCY_PROBS),
+        stats["variance"](),
+        stats["median"](),
+    )
+
+
+class TestDatasetPerformance:
+    """Repeated queries against one dataset: cached views vs free functions."""
+
+    @pytest.mark.performance
+    def test_free_functions_session(self, benchmark):
+        """Baseline: every question re-selects or re-scans the list."""
+        data = _random_data(100000)
+        stats = {
+            "median": lambda: median(data),
+            "range": lambda: data_range(data),
+            "quantiles": lambda probs: quantiles(data, probs),
+            "variance": lambda: variance(data),
+        }
+        benchmark(_analysis_session, stats)
+
+    @pytest.mark.performance
+    def test_dataset_session(self, benchmark):
+        """The same questions answered from a warm Dataset's cached state."""
+        ds = Dataset(_random_data(100000))
+        stats = {
+            "median": ds.median,
+            "range": ds.data_range,
+            "quantiles": ds.quantiles,
+            "variance": ds.variance,
+        }
+        _analysis_session(stats)
+        benchmark(_analysis_session, stats)
+
+    @pytest.mark.performance
+    def test_dataset_cold_session(self, benchmark):
+        """A fresh Dataset per session, including the one-time sort."""
+        data = _random_data(100000)
+
+        def run():
+            ds = Dataset(data)
+            return _analysis_session(
+                {
+                    "median": ds.median,
+                    "range": ds.data_range,
+                    "quantiles": ds.quantiles,
+                    "variance": ds.variance,
+                }
+            )
+
+        benchmark(run)
+
+
+def _churn(size, updates, seed=18):
+    """A starting population and a sequence of (remove, add) replacements."""
+    rng = random.Random(seed)
+    population = [rng.uniform(0, 1000) for _ in range(size)]
+    replacements = [
+        (population[rng.randrange(size)], rng.uniform(0, 1000)) for _ in range(updates)
+    ]
+    return population, replacements
+
+
+class TestOrderStatisticsPerformance:
+    """Median after every update of a changing population."""
+
+    @pytest.mark.performance
+    def test_order_statistics_churn(self, benchmark):
+        """Replace one value and query the median, 1000 times, n = 10^5."""
+        population, replacements = _churn(100000, 1000)
+
+        def run():
+            stats = OrderStatistics.from_sorted(sorted(population))
+            for old, new in replacements:
+                stats.remove(old)
+                stats.add(new)
+                stats.median()
+                stats.add(old)
+                stats.remove(new)
+            return stats
+
+        benchmark(run)
+
+    @pytest.mark.performance
+    def test_median_recompute_baseline(self, benchmark):
+        """Baseline: median() of the whole list after each update (100 updates)."""
+        population, replacements = _churn(100000, 100)
+
+        def run():
+            data = list(population)
+            for old, new in replacements:
+                data[data.index(old)] = new
+                median(data)
+                data[data.index(new)] = old
+            return data
+
+        benchmark(run)
+
+
+def _naive_bootstrap(stat, data, n_resamples, seed):
+    """Baseline: copy each resample into a new list and call the statistic."""
+    rng = random.Random(seed)
+    n = len(data)
+    replicates = sorted(
+        stat([data[rng.randrange(n)] for _ in range(n)]) for _ in range(n_resamples)
+    )
+    return replicates[int(0.025 * n_resamples)], replicates[int(0.975 * n_resamples)]
+
+
+BOOTSTRAP_RESAMPLES = [
+    2000,
+    pytest.param(10000, marks=pytest.mark.large),
+]
+
+
+class TestBootstrapPerformance:
+    """Bootstrap intervals of a 1000-value sample."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("n_resamples", BOOTSTRAP_RESAMPLES)
+    @pytest.mark.parametrize("stat", [mean, variance, median], ids=lambda f: f.__name__)
+    def test_bootstrap_performance(self, benchmark, stat, n_resamples):
+        """bootstrap() with fast paths for mean and variance."""
+        data = _random_data(1000)
+        result = benchmark(bootstrap, stat, data, n_resamples, seed=1)
+        assert result["low"] < result["high"]
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("n_resamples", BOOTSTRAP_RESAMPLES)
+    @pytest.mark.parametrize("stat", [mean, variance, median], ids=lambda f: f.__name__)
+    def test_naive_bootstrap_baseline(self, benchmark, stat, n_resamples):
+        """Baseline: one list per resample, drawn value by value."""
+        data = _random_data(1000)
+        low, high = benchmark(_naive_bootstrap, stat, data, n_resamples, 1)
+        assert low < high
+
+    @pytest.mark.performance
+    def test_bootstrap_bca_performance(self, benchmark):
+        """BCa adds an O(n) jackknife for the mean."""
+        data = _random_data(1000)
+        result = benchmark(bootstrap, mean, data, 2000, method="bca", seed=1)
+        assert result["low"] < result["high"]
+
+
+def _feature_rows(rows, columns, seed=20):
+    """Rows of correlated feature columns."""
+    rng = random.Random(seed)
+    result = []
+    for _ in range(rows):
+        base = rng.gauss(0, 1)
+        result.append([base * (j % 3) + rng.gauss(j, 1) for j in range(columns)])
+    return result
+
+
+def _pairwise_cov(rows):
+    """Baseline: one covariance per column pair, each from scratch."""
+    columns = list(zip(*rows))
+    n = len(rows)
+    result = []
+    for ci in columns:
+        result.append([])
+        for cj in columns:
+            mi = sum(ci) / n
+            mj = sum(cj) / n
+            result[-1].append(
+                sum((x - mi) * (y - mj) for x, y in zip(ci, cj)) / (n - 1)
+            )
+    return result
+
+
+class TestCovariancePerformance:
+    """Covariance matrices of many columns."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("columns", [10, 50])
+    def test_cov_performance(self, benchmark, columns):
+        """Blocked co-moment accumulation over 20k rows."""
+        rows = _feature_rows(20000, columns)
+        matrix = benchmark(cov, rows)
+        assert len(matrix) == columns
+
+    @pytest.mark.performance
+    def test_cov_python_backend(self, benchmark):
+        """Pure-Python blocks: one C-level product sum per column pair."""
+        rows = _feature_rows(20000, 10)
+        with use_backend("python"):
+            matrix = benchmark(cov, rows)
+        assert len(matrix) == 10
+
+    @pytest.mark.performance
+    def test_pairwise_baseline(self, benchmark):
+        """Baseline: covariance of each column pair computed separately."""
+        rows = _feature_rows(20000, 10)
+        assert len(benchmark(_pairwise_cov, rows)) == 10
+
+    @pytest.mark.performance
+    @pytest.mark.large
+    def test_cov_many_rows(self, benchmark):
+        """10^6 rows of 100 columns from a 2-D buffer, across workers."""
+        np = pytest.importorskip("numpy")
+        data = np.random.default_rng(20).standard_normal((1000000, 100))
+        matrix = benchmark(cov, data, workers=None)
+        assert len(matrix) == 100
+
+
+def _value_counts(size, seed=16):
+    """Pre-aggregated (value, count) pairs with heavy-tailed counts."""
+    rng = random.Random(seed)
+    values = [rng.uniform(-1000, 1000) for _ in range(size)]
+    counts = [int(rng.paretovariate(1.5)) for _ in range(size)]
+    return values, counts
+
+
+class TestWeightedPerformance:
+    """Weighted statistics against expanding (value, count) pairs."""
+
+    @pytest.mark.performance
+    def test_weighted_quantiles_performance(self, benchmark):
+        """Weighted p50/p90/p99 by one weighted selection over 10^5 pairs."""
+        values, counts = _value_counts(100000)
+        result = benchmark(weighted_quantiles, values, counts, LATENCY_PROBS)
+        assert result == sorted(result)
+
+    @pytest.mark.performance
+    def test_expanded_quantiles_baseline(self, benchmark):
+        """Baseline: expand the pairs into a list, then call quantiles()."""
+        values, counts = _value_counts(100000)
+
+        def run():
+            expanded = [x for x, c in zip(values, counts) for _ in range(c)]
+            return quantiles(expanded, LATENCY_PROBS)
+
+        assert benchmark(run) == weighted_quantiles(values, counts, LATENCY_PROBS)
+
+    @pytest.mark.performance
+    def test_weighted_variance_performance(self, benchmark):
+        """Blocked one-pass weighted variance over 10^5 pairs."""
+        values, counts = _value_counts(100000)
+        assert benchmark(weighted_variance, values, counts) > 0
+
+
+class TestDistributionBatchPerformance:
+    """Batch PDF/CDF evaluation against a loop of scalar calls."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("backend", ["python", "auto"])
+    def test_pdf_batch_performance(self, benchmark, backend):
+        """normal_pdf_batch over 10^6 doubles into a reused output buffer."""
+        data = _random_doubles(1000000)
+        out = array.array("d", bytes(8 * len(data)))
+        with use_backend(backend):
+            result = benchmark(normal_pdf_batch, data, 3.0, 250.0, out)
+        assert result is out
+
+    @pytest.mark.performance
+    def test_pdf_scalar_loop_baseline(self, benchmark):
+        """Baseline: one normal_pdf call per value."""
+        data = _random_doubles(1000000)
+        result = benchmark(lambda: [normal_pdf(x, 3.0, 250.0) for x in data])
+        assert len(result) == len(data)
+
+    @pytest.mark.performance
+    def test_cdf_batch_performance(self, benchmark):
+        """normal_cdf_batch over 10^6 doubles."""
+        data = _random_doubles(1000000)
+        result = benchmark(normal_cdf_batch, data, 3.0, 250.0)
+        assert len(result) == len(data)
+
+    @pytest.mark.performance
+    def test_cdf_scalar_loop_baseline(self, benchmark):
+        """Baseline: one normal_cdf call per value."""
+        data = _random_doubles(1000000)
+        result = benchmark(lambda: [normal_cdf(x, 3.0, 250.0) for x in data])
+        assert len(result) == len(data)
+
+    @pytest.mark.performance
+    def test_log_likelihood_performance(self, benchmark):
+        """Log-likelihood of 10^6 doubles from one Normal.logpdf batch."""
+        data = _random_doubles(1000000)
+        dist = Normal(3.0, 250.0)
+        result = benchmark(lambda: sum(dist.logpdf(data)))
+        assert result < 0
+
+    @pytest.mark.performance
+    def test_log_likelihood_baseline(self, benchmark):
+        """Baseline: math.log of one normal_pdf call per value."""
+        data = _random_doubles(1000000)
+        log = math.log
+        result = benchmark(lambda: sum(log(normal_pdf(x, 3.0, 250.0)) for x in data))
+        assert result < 0
+
+
+def _bisect_ppf(p, lo=-40.0, hi=40.0):
+    """Inverse CDF by bisection on normal_cdf, as callers did before."""
+    for _ in range(60):
+        mid = (lo + hi) / 2.0
+        if normal_cdf(mid) < p:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2.0
+
+
+@functools.lru_cache(maxsize=None)
+def _uniform_doubles(size):
+    """Probabilities in (0, 1) in an array.array (cached, do not mutate)."""
+    rng = random.Random(11)
+    return array.array("d", (rng.random() or 0.5 for _ in range(size)))
+
+
+class TestPpfPerformance:
+    """Inverse normal CDF by rational approximation versus bisection."""
+
+    @pytest.mark.performance
+    def test_ppf_batch_performance(self, benchmark):
+        """normal_ppf_batch over 10^4 probabilities."""
+        probs = _uniform_doubles(10000)
+        result = benchmark(normal_ppf_batch, probs)
+        assert len(result) == len(probs)
+
+    @pytest.mark.performance
+    def test_ppf_scalar_performance(self, benchmark):
+        """One normal_ppf call per probability."""
+        probs = _uniform_doubles(10000)
+        result = benchmark(lambda: [normal_ppf(p) for p in probs])
+        assert len(result) == len(probs)
+
+    @pytest.mark.performance
+    def test_ppf_bisection_baseline(self, benchmark):
+        """Baseline: 60 bisection steps on normal_cdf per probability."""
+        probs = _uniform_doubles(10000)
+        result = benchmark(lambda: [_bisect_ppf(p) for p in probs])
+        assert result == pytest.approx(normal_ppf_batch(probs).tolist(), abs=1e-9)
+
+
+SAMPLE_SIZES = [
+    1000000,
+    pytest.param(100000000, marks=pytest.mark.large),
+]
+
+
+class TestSamplingPerformance:
+    """Throughput, in samples per second, of each normal generation method."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("method", ["box-muller", "polar", "ziggurat"])
+    @pytest.mark.parametrize("size", SAMPLE_SIZES)
+    def test_random_normal_throughput(self, benchmark, method, size):
+        """random_normal(size, method=...) on the pure-Python stream."""
+        with use_backend("python"):
+            result = benchmark(random_normal, size, 3.0, 2.0, 42, method)
+        assert len(result) == size
+        if benchmark.stats is not None:
+            benchmark.extra_info["samples_per_second"] = size / benchmark.stats["mean"]
+
+
 class TestScalability:
     """Test that performance scales appropriately with input size."""
 
@@ -0,0 +1,181 @@
+"""
+Unit tests for the optional NumPy backend.
+"""
+
+import array
+import math
+import random
+
+import pytest
+from src.statlib import backend
+from src.statlib.backend import get_backend, set_backend, use_backend
+from src.statlib.descriptive import (
+    data_range,
+    describe,
+    mean,
+    median,
+    stdev,
+    variance,
+)
+from src.statlib.distributions import normal_cdf, normal_pdf, random_normal
+
+np = pytest.importorskip("numpy")
+
+RTOL = 1e-12
+
+
+def _close(a, b):
+    """Relative comparison at the documented backend tolerance."""
+    return math.isclose(a, b, rel_tol=RTOL, abs_tol=1e-300)
+
+
+@pytest.fixture
+def values():
+    """Random values longer than the list conversion threshold."""
+    rng = random.Random(21)
+    return [rng.gauss(1000, 50) for _ in range(backend.LIST_THRESHOLD + 1)]
+
+
+class TestBackendSelection:
+    """Test cases for selecting a backend."""
+
+    def test_default_is_auto(self):
+        """The default backend dispatches automatically."""
+        assert get_backend() == "auto"
+        assert backend.numpy_available()
+
+    def test_set_backend(self):
+        """set_backend changes the active backend."""
+        try:
+            set_backend("python")
+            assert get_backend() == "python"
+        finally:
+            set_backend("auto")
+
+    def test_use_backend_restores(self):
+        """use_backend restores the previous backend, even on error."""
+        with pytest.raises(RuntimeError):
+            with use_backend("numpy"):
+                assert get_backend() == "numpy"
+                raise RuntimeError
+        assert get_backend() == "auto"
+
+    def test_unknown_backend_raises_error(self):
+        """Unknown names are rejected."""
+        with pytest.raises(ValueError, match="Unknown backend"):
+            set_backend("cuda")
+        assert get_backend() == "auto"
+
+
+class TestBackendAgreement:
+    """Both backends give the same results within tolerance."""
+
+    @pytest.mark.parametrize(
+        "func", [mean, variance, stdev, median, data_range], ids=lambda f: f.__name__
+    )
+    def test_lists_agree(self, func, values):
+        """Large lists agree between the pure-Python and NumPy paths."""
+        with use_backend("python"):
+            expected = func(values)
+        with use_backend("numpy"):
+            assert _close(func(values), expected)
+        assert _close(func(values), expected)
+
+    @pytest.mark.parametrize(
+        "func", [mean, variance, stdev, median, data_range], ids=lambda f: f.__name__
+    )
+    def test_buffers_agree(self, func, values):
+        """array.array and ndarray inputs agree with the list result."""
+        with use_backend("python"):
+            expected = func(values)
+        assert _close(func(array.array("d", values)), expected)
+        assert _close(func(np.asarray(values)), expected)
+
+    def test_small_lists_stay_python(self):
+        """Short lists are not converted in auto mode."""
+        data = [1.0, 2.0, 4.0]
+        assert backend._as_array(data, convert_lists=True) is None
+        view = memoryview(array.array("d", data))
+        assert isinstance(backend._as_array(view, convert_lists=False), np.ndarray)
+        with use_backend("python"):
+            expected = variance(data)
+        assert variance(data) == expected
+
+    def test_in_place_median_on_buffer(self, values):
+        """In-place median partitions a writable buffer with NumPy."""
+        expected = median(values)
+        scratch = array.array("d", values)
+        assert median(scratch, in_place=True) == expected
+        assert sorted(scratch) == sorted(values)
+
+    def test_describe_agrees(self, values):
+        """describe() matches the individual functions on both backends."""
+        with use_backend("python"):
+            expected = describe(values)
+        for name in ("python", "auto", "numpy"):
+            with use_backend(name):
+                summary = describe(values)
+                assert summary["variance"] == variance(values)
+                assert summary["median"] == median(values)
+            for key, value in expected.items():
+                assert _close(summary[key], value)
+
+    def test_describe_single_value(self):
+        """Sample statistics of one value are NaN on the NumPy path too."""
+        with use_backend("numpy"):
+            summary = describe([3.0])
+        assert summary["mean"] == 3.0
+        assert math.isnan(summary["variance"])
+
+    @pytest.mark.parametrize(
+        "typecode, low, high", [("b", -128, 127), ("q", -(2**63), 2**63 - 1)]
+    )
+    def test_integer_buffer_extremes(self, typecode, low, high):
+        """Ranges of integer buffers are not computed in the wrapping dtype."""
+        data = array.array(typecode, [low, 0, high])
+        expected = float(high - low)
+        assert data_range(data) == expected
+        summary = describe(data)
+        assert summary["range"] == expected
+        assert (summary["min"], summary["max"]) == (float(low), float(high))
+        with use_backend("python"):
+            assert data_range(data) == expected
+
+    def test_in_place_median_integer_buffer(self):
+        """Even-length in-place median of a small integer dtype does not wrap."""
+        with np.errstate(all="raise"):
+            result = median(memoryview(array.array("b", [100, 120])), in_place=True)
+        assert result == 110.0
+        assert type(result) is float
+        assert median(array.array("b", [127, 126, -128, 125]), in_place=True) == 125.5
+
+
+class TestDistributionBackend:
+    """Test cases for array evaluation of distribution functions."""
+
+    def test_pdf_cdf_arrays(self):
+        """Array inputs evaluate element-wise and match scalar calls."""
+        x = np.linspace(-5, 5, 101)
+        pdf = normal_pdf(x, mu=0.5, sigma=2.0)
+        cdf = normal_cdf(x, mu=0.5, sigma=2.0)
+        assert isinstance(pdf, np.ndarray)
+        assert isinstance(cdf, np.ndarray)
+        for xi, p, c in zip(x.tolist(), pdf.tolist(), cdf.tolist()):
+            assert _close(p, normal_pdf(xi, mu=0.5, sigma=2.0))
+            assert _close(c, normal_cdf(xi, mu=0.5, sigma=2.0))
+
+    def test_random_normal_default_stream_unchanged(self):
+        """Auto mode keeps the pure-Python stream for a given seed."""
+        with use_backend("python"):
+            expected = random_normal(5, seed=3)
+        assert random_normal(5, seed=3) == expected
+
+    def test_random_normal_forced_numpy(self):
+        """The forced NumPy sampler is reproducible and well-formed."""
+        with use_backend("numpy"):
+            first = random_normal(20000, mu=10.0, sigma=2.0, seed=4)
+            second = random_normal(20000, mu=10.0, sigma=2.0, seed=4)
+        assert first == second
+        assert isinstance(first, list)
+        assert abs(mean(first) - 10.0) < 0.1
+        assert abs(stdev(first) - 2.0) < 0.1
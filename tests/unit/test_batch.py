@@ -0,0 +1,138 @@
+"""
+Unit tests for batched statistics module.
+"""
+
+import math
+import random
+from array import array
+
+import pytest
+from src.statlib.backend import use_backend
+from src.statlib.batch import batch_describe, batch_describe_ragged
+from src.statlib.descriptive import describe, mean, stdev, variance
+from hypothesis import given, strategies as st
+
+
+def _same(a, b):
+    """Exact equality that treats NaN as equal to NaN."""
+    return a == b or (math.isnan(a) and math.isnan(b))
+
+
+def _assert_matches_describe(result, series):
+    """Every column entry equals describe() on the same series."""
+    assert len(result["count"]) == len(series)
+    with use_backend("python"):
+        for i, data in enumerate(series):
+            expected = describe(data)
+            for key, value in expected.items():
+                assert _same(result[key][i], value), (i, key)
+
+
+@pytest.fixture
+def small_series():
+    """Many short random series of varying length."""
+    rng = random.Random(61)
+    return [[rng.gauss(0, 100) for _ in range(rng.randint(1, 50))] for _ in range(500)]
+
+
+class TestBatchDescribe:
+    """Test cases for batch_describe."""
+
+    def test_batch_describe_simple(self):
+        """Test columns for two short series."""
+        result = batch_describe([[1, 2, 3, 4], [10, 20]])
+        assert list(result["count"]) == [4, 2]
+        assert list(result["mean"]) == [2.5, 15.0]
+        assert list(result["median"]) == [2.5, 15.0]
+        assert list(result["range"]) == [3.0, 10.0]
+
+    def test_batch_matches_describe(self, small_series):
+        """Every entry is identical to describe() on its series."""
+        _assert_matches_describe(batch_describe(small_series), small_series)
+
+    def test_batch_matches_scalar_functions(self, small_series):
+        """mean, variance and stdev columns match the scalar functions."""
+        result = batch_describe(small_series)
+        for i, data in enumerate(small_series):
+            assert result["mean"][i] == mean(data)
+            if len(data) > 1:
+                assert result["variance"][i] == variance(data)
+                assert result["pstdev"][i] == stdev(data, sample=False)
+
+    def test_batch_columns_are_typed_arrays(self):
+        """Results are compact typed arrays."""
+        result = batch_describe([(1, 2), array("d", [3.0])])
+        assert result["count"].typecode == "q"
+        assert all(result[key].typecode == "d" for key in result if key != "count")
+        assert math.isnan(result["variance"][1])
+        assert result["pvariance"][1] == 0.0
+
+    def test_batch_accepts_generators(self):
+        """Series can come from a single-pass iterable."""
+        result = batch_describe([i, i + 2] for i in range(3))
+        assert list(result["mean"]) == [1.0, 2.0, 3.0]
+
+    def test_batch_empty_input(self):
+        """No series give empty columns."""
+        result = batch_describe([])
+        assert len(result["mean"]) == 0
+        assert set(result) == set(describe([1.0]))
+
+    def test_batch_empty_series_raises_error(self):
+        """Empty series are reported with their position."""
+        with pytest.raises(ValueError, match=r"empty dataset \(series 1\)"):
+            batch_describe([[1.0], []])
+
+    @given(
+        st.lists(
+            st.lists(
+                st.floats(
+                    allow_nan=False, allow_infinity=False, min_value=-1e9, max_value=1e9
+                ),
+                min_size=1,
+                max_size=20,
+            ),
+            max_size=20,
+        )
+    )
+    def test_batch_matches_describe_property(self, series):
+        """Identical to describe() for arbitrary finite series."""
+        _assert_matches_describe(batch_describe(series), series)
+
+
+class TestBatchDescribeRagged:
+    """Test cases for the ragged offsets+values layout."""
+
+    def test_ragged_simple(self):
+        """Test columns for two series stored back to back."""
+        result = batch_describe_ragged([1, 2, 3, 4, 10, 20], [0, 4, 6])
+        assert list(result["count"]) == [4, 2]
+        assert list(result["max"]) == [4.0, 20.0]
+
+    def test_ragged_matches_nested(self, small_series):
+        """The ragged layout gives the same columns as nested lists."""
+        values = [x for data in small_series for x in data]
+        offsets = [0]
+        for data in small_series:
+            offsets.append(offsets[-1] + len(data))
+        expected = batch_describe(small_series)
+        for layout in (values, array("d", values)):
+            result = batch_describe_ragged(layout, offsets)
+            assert set(result) == set(expected)
+            for key, column in expected.items():
+                assert all(_same(a, b) for a, b in zip(result[key], column)), key
+
+    def test_ragged_no_series(self):
+        """A single zero offset describes no series."""
+        assert len(batch_describe_ragged([], [0])["count"]) == 0
+
+    def test_ragged_invalid_offsets_raise_errors(self):
+        """Offsets must cover the values exactly and strictly increase."""
+        with pytest.raises(ValueError, match="start at 0 and end at len"):
+            batch_describe_ragged([1, 2, 3], [0, 2])
+        with pytest.raises(ValueError, match="start at 0 and end at len"):
+            batch_describe_ragged([1, 2, 3], [1, 3])
+        with pytest.raises(ValueError, match="start at 0 and end at len"):
+            batch_describe_ragged([1, 2, 3], [])
+        with pytest.raises(ValueError, match=r"strictly increase \(series 1\)"):
+            batch_describe_ragged([1, 2, 3], [0, 2, 2, 3])
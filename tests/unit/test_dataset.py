@@ -0,0 +1,125 @@
+"""
+Unit tests for the cached Dataset class.
+"""
+
+import array
+import math
+import random
+
+import pytest
+from src.statlib.backend import use_backend
+from src.statlib.dataset import Dataset
+from src.statlib.descriptive import describe, quantiles, select
+from src.statlib.parallel import histogram
+from hypothesis import given, strategies as st
+
+
+@pytest.fixture
+def values():
+    """Random floats, long enough that selection partitions."""
+    rng = random.Random(17)
+    return [rng.uniform(-100, 100) for _ in range(5001)]
+
+
+class TestDataset:
+    """Test cases for Dataset queries."""
+
+    def test_matches_free_functions(self, values):
+        """Cached statistics equal the free functions on the Python backend."""
+        with use_backend("python"):
+            ds = Dataset(values)
+            assert ds.describe() == describe(values)
+            probs = [0.0, 0.1, 0.5, 0.99, 1.0]
+            for method in ("linear", "nearest", "weibull"):
+                assert ds.quantiles(probs, method) == quantiles(values, probs, method)
+            assert ds.select(17) == select(values, 17)
+
+    def test_numpy_backend_agrees(self, values):
+        """Backend dispatch changes results by rounding at most."""
+        with use_backend("python"):
+            expected = Dataset(values).describe()
+        for key, value in Dataset(values).describe().items():
+            assert math.isclose(value, expected[key], rel_tol=1e-12)
+
+    def test_order_statistics(self):
+        """Median, rank and interval counts come from the sorted view."""
+        ds = Dataset([5, 1, 4, 2, 3, 3])
+        assert ds.median() == 3.0
+        assert list(ds.sorted_values()) == [1.0, 2.0, 3.0, 3.0, 4.0, 5.0]
+        assert ds.rank(3) == 4
+        assert ds.rank(0) == 0
+        assert ds.count_between(2, 3) == 3
+        assert ds.count_between(4, 2) == 0
+
+    def test_histogram_matches_parallel(self, values):
+        """Histograms equal parallel.histogram and are cached per key."""
+        ds = Dataset(values)
+        assert ds.histogram(7) == histogram(values, bins=7, workers=1)
+        assert ds.histogram(3, (0, 30)) == histogram(
+            values, bins=3, value_range=(0, 30), workers=1
+        )
+        assert ds.cache_info()["histograms"] == (7 + 8 + 3 + 4) * 8
+
+    def test_histogram_invalid_raises_errors(self):
+        """Invalid bins and ranges are rejected."""
+        ds = Dataset([1, 2, 3])
+        with pytest.raises(ValueError, match="bins must be positive"):
+            ds.histogram(0)
+        with pytest.raises(ValueError, match="range must be increasing"):
+            ds.histogram(2, (3, 3))
+
+    def test_cache_reported_and_released(self, values):
+        """Cached views are reported in bytes and dropped by clear_cache."""
+        ds = Dataset(values)
+        assert ds.cache_info() == {}
+        ds.mean()
+        assert ds.cache_info() == {"moments": 8}
+        median = ds.median()
+        assert ds.cache_info()["sorted"] == len(values) * 8
+        ds.clear_cache()
+        assert ds.cache_info() == {}
+        assert ds.median() == median
+
+    def test_values_copied_and_read_only(self):
+        """The dataset is unaffected by changes to its source."""
+        source = array.array("d", [3.0, 1.0, 2.0])
+        ds = Dataset(source)
+        source[0] = 100.0
+        assert ds.max() == 3.0
+        assert list(ds) == [3.0, 1.0, 2.0]
+        assert ds[1] == 1.0
+        assert ds.nbytes == 24
+        with pytest.raises(TypeError):
+            ds.values[0] = 0.0
+
+    def test_invalid_queries_raise_errors(self):
+        """Empty data, bad ranks and bad probabilities are rejected."""
+        with pytest.raises(ValueError, match="empty"):
+            Dataset([])
+        ds = Dataset([1.0])
+        with pytest.raises(ValueError, match="k must be between"):
+            ds.select(1)
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            ds.quantiles([2.0])
+        with pytest.raises(ValueError, match="Unknown quantile method"):
+            ds.quantiles([0.5], method="cubic")
+        with pytest.raises(ValueError, match="at least 2"):
+            ds.variance()
+        assert math.isnan(ds.describe()["variance"])
+
+    @given(
+        st.lists(
+            st.floats(min_value=-1e6, max_value=1e6, allow_nan=False),
+            min_size=1,
+            max_size=60,
+        )
+    )
+    def test_describe_property(self, data):
+        """describe() of a Dataset equals describe() of its values."""
+        with use_backend("python"):
+            expected = describe(data)
+            result = Dataset(data).describe()
+        for key, value in expected.items():
+            assert value == result[key] or (
+                math.isnan(value) and math.isnan(result[key])
+            )
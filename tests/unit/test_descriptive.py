@@ -4,7 +4,25 @@ Following TDD - these tests are written BEFORE implementation.
 """
 
 import pytest
-from src.statlib.descriptive import mean, median, variance, stdev, data_range
+import array
+import math
+import mmap
+import random
+from src.statlib.descriptive import (
+    mean,
+    median,
+    variance,
+    stdev,
+    data_range,
+    describe,
+    select,
+    quantiles,
+    mode,
+    multimode,
+    skewness,
+    kurtosis,
+)
+from collections import Counter
 from hypothesis import given, strategies as st, assume
 
 
@@ -84,6 +102,232 @@ class TestMedian:
         assert median([1, 3]) == 2.0
 
 
+class TestMedianInPlace:
+    """Test cases for in-place median selection."""
+
+    def test_median_in_place_odd(self):
+        """In-place median of odd-length data."""
+        data = [9, 3, 7, 1, 5]
+        assert median(data, in_place=True) == 5.0
+        assert sorted(data) == [1, 3, 5, 7, 9]
+
+    def test_median_in_place_even(self):
+        """In-place median of even-length data."""
+        data = [8, 2, 6, 4]
+        assert median(data, in_place=True) == 5.0
+
+    def test_median_copy_leaves_input(self):
+        """Default median must not reorder the input."""
+        data = [5, 2, 8, 1, 9]
+        median(data)
+        assert data == [5, 2, 8, 1, 9]
+
+    def test_median_large_even_with_duplicates(self):
+        """Selection handles large inputs with many repeated values."""
+        data = [x % 17 for x in range(10000)]
+        expected = sorted(data)
+        assert median(data) == (expected[4999] + expected[5000]) / 2.0
+        assert median(list(data), in_place=True) == median(data)
+
+    @given(
+        st.lists(
+            st.floats(
+                allow_nan=False, allow_infinity=False, min_value=-1e10, max_value=1e10
+            ),
+            min_size=1,
+            max_size=300,
+        )
+    )
+    def test_median_matches_sorted_definition(self, data):
+        """Selection-based median equals the sort-based definition."""
+        ordered = sorted(data)
+        n = len(ordered)
+        if n % 2 == 1:
+            expected = float(ordered[n // 2])
+        else:
+            expected = (ordered[n // 2 - 1] + ordered[n // 2]) / 2.0
+        assert median(data) == expected
+        assert median(list(data), in_place=True) == expected
+
+
+class TestSelect:
+    """Test cases for k-th smallest selection."""
+
+    def test_select_extremes(self):
+        """Rank 0 is the minimum and rank n-1 the maximum."""
+        data = [4, -2, 9, 0, 7]
+        assert select(data, 0) == -2.0
+        assert select(data, 4) == 9.0
+
+    def test_select_middle(self):
+        """Test selecting an interior rank."""
+        assert select([9, 1, 8, 2, 7], 3) == 8.0
+
+    def test_select_in_place_partitions(self):
+        """In-place selection leaves data partitioned around rank k."""
+        data = [float(x) for x in reversed(range(5000))]
+        result = select(data, 1234, in_place=True)
+        assert result == 1234.0
+        assert data[1234] == 1234.0
+        assert max(data[:1234]) <= result <= min(data[1235:])
+
+    def test_select_random_large(self):
+        """Selection on large shuffled data with duplicates matches sorting."""
+        rng = random.Random(7)
+        data = [rng.randint(-500, 500) for _ in range(20000)]
+        expected = sorted(data)
+        for k in [0, 1, 4999, 10000, 15001, 19999]:
+            assert select(data, k) == expected[k]
+            assert select(list(data), k, in_place=True) == expected[k]
+
+    def test_select_sorted_and_reversed_input(self):
+        """Median-of-three pivots handle presorted inputs."""
+        ascending = list(range(10000))
+        descending = ascending[::-1]
+        assert select(ascending, 5000) == 5000.0
+        assert select(descending, 5000, in_place=True) == 5000.0
+
+    def test_select_all_equal(self):
+        """Selection on constant data returns the constant."""
+        assert select([3] * 1000, 500) == 3.0
+        assert select([3] * 1000, 500, in_place=True) == 3.0
+
+    def test_select_empty_raises_error(self):
+        """Test that empty list raises ValueError."""
+        with pytest.raises(ValueError, match="Cannot select from empty"):
+            select([], 0)
+
+    def test_select_out_of_range_raises_error(self):
+        """Ranks outside [0, n) are rejected."""
+        with pytest.raises(ValueError, match="k must be between 0 and 2"):
+            select([1, 2, 3], 3)
+        with pytest.raises(ValueError, match="k must be between 0 and 2"):
+            select([1, 2, 3], -1)
+
+    @given(
+        st.lists(st.integers(min_value=-50, max_value=50), min_size=1, max_size=300),
+        st.data(),
+    )
+    def test_select_matches_sorted(self, data, draw):
+        """select(data, k) equals sorted(data)[k] for every mode."""
+        k = draw.draw(st.integers(min_value=0, max_value=len(data) - 1))
+        expected = float(sorted(data)[k])
+        assert select(data, k) == expected
+        buffer = list(data)
+        assert select(buffer, k, in_place=True) == expected
+        assert sorted(buffer) == sorted(data)
+
+
+class TestQuantiles:
+    """Test cases for multi-quantile calculation."""
+
+    def test_quantiles_quartiles(self):
+        """Test quartiles of a simple list with linear interpolation."""
+        assert quantiles([1, 2, 3, 4, 5], [0.25, 0.5, 0.75]) == [2.0, 3.0, 4.0]
+
+    def test_quantiles_interpolates(self):
+        """Linear method interpolates between neighbouring values."""
+        result = quantiles([10, 20, 30, 40], [0.1, 0.9])
+        assert abs(result[0] - 13.0) < 1e-10
+        assert abs(result[1] - 37.0) < 1e-10
+
+    def test_quantiles_extremes(self):
+        """p=0 and p=1 are the minimum and maximum."""
+        data = [7, -3, 12, 5]
+        assert quantiles(data, [0.0, 1.0]) == [-3.0, 12.0]
+
+    def test_quantiles_keep_request_order(self):
+        """Results follow the order of the requested probabilities."""
+        data = list(range(101))
+        assert quantiles(data, [0.9, 0.1, 0.5]) == [90.0, 10.0, 50.0]
+
+    def test_quantiles_discrete_methods(self):
+        """Test lower, higher, nearest and midpoint methods."""
+        data = [1, 2, 3, 4]
+        assert quantiles(data, [0.5], method="lower") == [2.0]
+        assert quantiles(data, [0.5], method="higher") == [3.0]
+        assert quantiles(data, [0.5], method="midpoint") == [2.5]
+        assert quantiles(data, [0.4], method="nearest") == [2.0]
+        assert quantiles(data, [0.6], method="nearest") == [3.0]
+
+    def test_quantiles_exact_rank_not_shifted(self):
+        """Rounding in (n-1)p must not move an exact rank."""
+        data = list(range(11))
+        assert quantiles(data, [0.7], method="higher") == [7.0]
+        assert quantiles(data, [0.7], method="lower") == [7.0]
+
+    def test_quantiles_weibull_matches_statistics(self):
+        """The weibull method matches statistics.quantiles (exclusive)."""
+        import statistics
+
+        data = [1.5, 9.0, 2.25, 7.0, 4.0, 3.5, 8.25]
+        expected = statistics.quantiles(data, n=4)
+        result = quantiles(data, [0.25, 0.5, 0.75], method="weibull")
+        for r, e in zip(result, expected):
+            assert abs(r - e) < 1e-10
+
+    def test_quantiles_tail_percentiles_large(self):
+        """Latency-style percentiles on data large enough to partition."""
+        rng = random.Random(3)
+        data = [rng.expovariate(1.0) for _ in range(20000)]
+        ordered = sorted(data)
+        result = quantiles(data, [0.5, 0.9, 0.99, 0.999], method="lower")
+        expected = [ordered[int(19999 * p)] for p in [0.5, 0.9, 0.99, 0.999]]
+        assert result == expected
+
+    def test_quantiles_empty_probs(self):
+        """No probabilities gives no results."""
+        assert quantiles([1, 2, 3], []) == []
+
+    def test_quantiles_empty_raises_error(self):
+        """Test that empty list raises ValueError."""
+        with pytest.raises(ValueError, match="Cannot compute quantiles of empty"):
+            quantiles([], [0.5])
+
+    def test_quantiles_invalid_prob_raises_error(self):
+        """Probabilities must lie in [0, 1]."""
+        with pytest.raises(ValueError, match="Probabilities must be between 0"):
+            quantiles([1, 2, 3], [1.5])
+        with pytest.raises(ValueError, match="Probabilities must be between 0"):
+            quantiles([1, 2, 3], [-0.1])
+
+    def test_quantiles_unknown_method_raises_error(self):
+        """Unknown interpolation methods are rejected."""
+        with pytest.raises(ValueError, match="Unknown quantile method"):
+            quantiles([1, 2, 3], [0.5], method="cubic")
+
+    @given(
+        st.lists(
+            st.floats(
+                allow_nan=False, allow_infinity=False, min_value=-1e10, max_value=1e10
+            ),
+            min_size=1,
+            max_size=100,
+        ),
+        st.sampled_from(["linear", "midpoint", "hazen", "weibull", "median_unbiased"]),
+    )
+    def test_quantiles_half_matches_median(self, data, method):
+        """p=0.5 equals median() exactly for averaging methods."""
+        assert quantiles(data, [0.5], method=method) == [median(data)]
+
+    @given(
+        st.lists(
+            st.floats(
+                allow_nan=False, allow_infinity=False, min_value=-1e10, max_value=1e10
+            ),
+            min_size=1,
+            max_size=100,
+        ),
+        st.lists(st.floats(min_value=0.0, max_value=1.0), min_size=1, max_size=5),
+    )
+    def test_quantiles_bounded_and_monotonic(self, data, probs):
+        """Quantiles lie within the data and increase with p."""
+        probs = sorted(probs)
+        result = quantiles(data, probs)
+        assert all(min(data) <= q <= max(data) for q in result)
+        assert all(a <= b for a, b in zip(result, result[1:]))
+
+
 class TestVariance:
     """Test cases for variance calculation."""
 
@@ -337,3 +581,278 @@ class TestRangeFunction:
         """Test range with floating point numbers."""
         result = data_range([1.5, 2.7, 3.9])
         assert abs(result - 2.4) < 1e-10
+
+
+class TestMode:
+    """Test cases for mode and multimode."""
+
+    def test_mode_simple(self):
+        """Test mode of a list with one most common value."""
+        assert mode([1, 2, 2, 3, 3, 3]) == 3
+
+    def test_mode_categorical(self):
+        """Mode works on non-numeric categories and returns them unchanged."""
+        assert mode(["red", "blue", "red"]) == "red"
+        assert mode([(1, "a"), (2, "b"), (1, "a")]) == (1, "a")
+
+    def test_mode_tie_returns_first_seen(self):
+        """Ties go to the value that appears first."""
+        assert mode([3, 1, 1, 3]) == 3
+
+    def test_mode_stream_and_buffer(self):
+        """Single-pass iterables and buffers are counted directly."""
+        assert mode(x % 4 for x in range(1, 10)) == 1
+        assert mode(array.array("i", [5, 5, 1])) == 5
+
+    def test_mode_empty_raises_error(self):
+        """Test that empty input raises ValueError."""
+        with pytest.raises(ValueError, match="Cannot compute mode of empty"):
+            mode([])
+        with pytest.raises(ValueError, match="Cannot compute mode of empty"):
+            mode(iter([]))
+
+    def test_multimode_ties(self):
+        """All tied values are returned in order of first appearance."""
+        assert multimode([1, 1, 2, 2, 3]) == [1, 2]
+        assert multimode("aabbbcccd") == ["b", "c"]
+
+    def test_multimode_single_and_empty(self):
+        """One winner gives a one-element list; empty input gives []."""
+        assert multimode([4, 4, 5]) == [4]
+        assert multimode([]) == []
+
+    @given(st.lists(st.integers(min_value=-5, max_value=5), min_size=1))
+    def test_mode_is_most_common(self, data):
+        """Mode has the highest count and belongs to multimode."""
+        counts = Counter(data)
+        assert counts[mode(data)] == max(counts.values())
+        assert mode(data) == multimode(data)[0]
+        assert sorted(multimode(data)) == sorted(
+            v for v, c in counts.items() if c == max(counts.values())
+        )
+
+
+class TestShape:
+    """Test cases for skewness and kurtosis."""
+
+    def test_known_values(self):
+        """Test against hand-computed moments of a small dataset."""
+        data = [2, 4, 4, 4, 5, 5, 7, 9]
+        assert abs(skewness(data, sample=False) - 0.65625) < 1e-12
+        assert abs(kurtosis(data, sample=False, excess=False) - 2.78125) < 1e-12
+        assert abs(kurtosis(data, sample=False) - (-0.21875)) < 1e-12
+        assert abs(skewness(data) - 0.8184875533567997) < 1e-12
+        assert abs(kurtosis(data) - 0.940625) < 1e-12
+
+    def test_symmetric_data(self):
+        """Symmetric data has zero skewness."""
+        assert skewness([1, 2, 3, 4, 5]) == 0.0
+        assert abs(kurtosis([1, 2, 3, 4, 5]) - (-1.2)) < 1e-12
+
+    def test_shift_and_scale_invariant(self):
+        """Shape statistics ignore location and positive scale."""
+        rng = random.Random(5)
+        data = [rng.expovariate(1.0) for _ in range(500)]
+        moved = [1e6 + 3.0 * x for x in data]
+        assert abs(skewness(moved) - skewness(data)) < 1e-6
+        assert abs(kurtosis(moved) - kurtosis(data)) < 1e-6
+        assert skewness(data) > 1.0
+
+    def test_buffer_input(self):
+        """Buffers give the same result as lists."""
+        data = [0.5, 1.0, 4.0, 2.5, 9.0]
+        assert abs(skewness(array.array("d", data)) - skewness(data)) < 1e-12
+        assert abs(kurtosis(array.array("d", data)) - kurtosis(data)) < 1e-12
+
+    def test_empty_raises_error(self):
+        """Test that empty input raises ValueError."""
+        with pytest.raises(ValueError, match="Cannot compute skewness of empty"):
+            skewness([])
+        with pytest.raises(ValueError, match="Cannot compute kurtosis of empty"):
+            kurtosis([])
+
+    def test_too_few_values_raises_error(self):
+        """Sample estimates need 3 (skewness) or 4 (kurtosis) values."""
+        with pytest.raises(ValueError, match="at least 3"):
+            skewness([1, 2])
+        with pytest.raises(ValueError, match="at least 4"):
+            kurtosis([1, 2, 3])
+        assert skewness([1, 2], sample=False) == 0.0
+
+    def test_constant_raises_error(self):
+        """Shape is undefined when all values are equal."""
+        with pytest.raises(ValueError, match="constant data"):
+            skewness([3, 3, 3, 3])
+        with pytest.raises(ValueError, match="constant data"):
+            kurtosis([3, 3, 3, 3])
+
+    @given(
+        st.lists(
+            st.floats(min_value=-1e3, max_value=1e3, allow_nan=False),
+            min_size=4,
+            max_size=50,
+        )
+    )
+    def test_shape_bounds_property(self, data):
+        """Population kurtosis is at least squared skewness plus one."""
+        assume(variance(data, sample=False) > 1e-6)
+        g1 = skewness(data, sample=False)
+        b2 = kurtosis(data, sample=False, excess=False)
+        assert b2 >= g1 * g1 + 1 - 1e-9
+        assert abs(skewness([-x for x in data], sample=False) + g1) < 1e-9
+
+
+class TestDescribe:
+    """Test cases for the fused statistical summary."""
+
+    def test_describe_keys(self):
+        """Summary should expose every statistic."""
+        summary = describe([1, 2, 3])
+        assert set(summary) == {
+            "count",
+            "mean",
+            "variance",
+            "pvariance",
+            "stdev",
+            "pstdev",
+            "min",
+            "max",
+            "range",
+            "median",
+        }
+
+    def test_describe_known_values(self):
+        """Test summary of a dataset with known statistics."""
+        summary = describe([2, 4, 4, 4, 5, 5, 7, 9])
+        assert summary["count"] == 8
+        assert summary["mean"] == 5.0
+        assert summary["median"] == 4.5
+        assert summary["min"] == 2.0
+        assert summary["max"] == 9.0
+        assert summary["range"] == 7.0
+        assert abs(summary["pvariance"] - 4.0) < 1e-10
+        assert abs(summary["pstdev"] - 2.0) < 1e-10
+
+    def test_describe_matches_individual_functions(self):
+        """Summary should be identical to the per-function results."""
+        data = [3.5, -1.25, 8.0, 2.0, 2.0, 10.75, -4.5]
+        summary = describe(data)
+        assert summary["mean"] == mean(data)
+        assert summary["median"] == median(data)
+        assert summary["variance"] == variance(data, sample=True)
+        assert summary["pvariance"] == variance(data, sample=False)
+        assert summary["stdev"] == stdev(data, sample=True)
+        assert summary["pstdev"] == stdev(data, sample=False)
+        assert summary["range"] == data_range(data)
+
+    def test_describe_single_value(self):
+        """Sample statistics are undefined for a single value."""
+        summary = describe([42])
+        assert summary["mean"] == 42.0
+        assert summary["median"] == 42.0
+        assert summary["pvariance"] == 0.0
+        assert summary["range"] == 0.0
+        assert math.isnan(summary["variance"])
+        assert math.isnan(summary["stdev"])
+
+    def test_describe_does_not_modify_input(self):
+        """Input data should be left untouched."""
+        data = [5, 1, 4, 2, 3]
+        describe(data)
+        assert data == [5, 1, 4, 2, 3]
+
+    def test_describe_empty_raises_error(self):
+        """Test that empty list raises ValueError."""
+        with pytest.raises(ValueError, match="Cannot compute summary of empty"):
+            describe([])
+
+    @given(
+        st.lists(
+            st.floats(
+                allow_nan=False, allow_infinity=False, min_value=-1e10, max_value=1e10
+            ),
+            min_size=2,
+            max_size=100,
+        )
+    )
+    def test_describe_consistent_property(self, data):
+        """Summary should agree with the individual functions on any data."""
+        summary = describe(data)
+        assert summary["mean"] == mean(data)
+        assert summary["median"] == median(data)
+        assert summary["variance"] == variance(data, sample=True)
+        assert summary["range"] == data_range(data)
+
+
+class TestBufferInputs:
+    """Descriptive functions accept buffer-protocol objects directly."""
+
+    DATA = [2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0]
+
+    def _check(self, buffer):
+        assert mean(buffer) == mean(self.DATA)
+        assert median(buffer) == median(self.DATA)
+        assert variance(buffer) == variance(self.DATA)
+        assert stdev(buffer, sample=False) == stdev(self.DATA, sample=False)
+        assert data_range(buffer) == data_range(self.DATA)
+        assert quantiles(buffer, [0.25, 0.75]) == quantiles(self.DATA, [0.25, 0.75])
+        assert select(buffer, 2) == select(self.DATA, 2)
+        assert describe(buffer) == describe(self.DATA)
+
+    def test_array_of_doubles(self):
+        """array.array('d') inputs."""
+        self._check(array.array("d", self.DATA))
+
+    def test_array_of_ints(self):
+        """Integer arrays are read with their own typecode."""
+        self._check(array.array("q", [int(x) for x in self.DATA]))
+
+    def test_memoryview(self):
+        """memoryview inputs, including multi-dimensional views."""
+        self._check(memoryview(array.array("d", self.DATA)))
+        grid = memoryview(array.array("d", self.DATA)).cast("B").cast("d", [2, 4])
+        self._check(grid)
+
+    def test_raw_bytes(self):
+        """bytes and bytearray are read as native float64 values."""
+        raw = array.array("d", self.DATA).tobytes()
+        self._check(raw)
+        self._check(bytearray(raw))
+
+    def test_mmap(self):
+        """Anonymous memory maps are read as native float64 values."""
+        raw = array.array("d", self.DATA).tobytes()
+        with mmap.mmap(-1, len(raw)) as mapped:
+            mapped.write(raw)
+            self._check(mapped)
+
+    def test_in_place_median_reorders_buffer(self):
+        """In-place selection works on writable buffers."""
+        values = array.array("d", [9.0, 1.0, 8.0, 2.0, 7.0])
+        assert median(values, in_place=True) == 7.0
+        assert sorted(values) == [1.0, 2.0, 7.0, 8.0, 9.0]
+        raw = bytearray(array.array("d", [3.0, 1.0, 2.0]).tobytes())
+        assert median(raw, in_place=True) == 2.0
+
+    def test_empty_buffer_raises_error(self):
+        """Empty buffers behave like empty lists."""
+        with pytest.raises(ValueError, match="Cannot compute mean of empty"):
+            mean(array.array("d"))
+        with pytest.raises(ValueError, match="Cannot compute median of empty"):
+            median(b"")
+
+    def test_partial_double_raises_error(self):
+        """Raw bytes must hold a whole number of float64 values."""
+        with pytest.raises(ValueError, match="whole float64 values"):
+            mean(b"\x00" * 12)
+
+    def test_non_numeric_format_raises_error(self):
+        """Buffers of non-numeric formats are rejected."""
+        with pytest.raises(TypeError, match="Unsupported buffer format"):
+            mean(memoryview(b"abcd").cast("c"))
+
+    def test_non_contiguous_raises_error(self):
+        """Strided views are rejected rather than silently copied."""
+        strided = memoryview(array.array("d", self.DATA))[::2]
+        with pytest.raises(ValueError, match="C-contiguous"):
+            mean(strided)
@@ -4,9 +4,24 @@ Following TDD - these tests are written BEFORE implementation.
 """
 
 import pytest
+import array
 import math
-from src.statlib.distributions import normal_pdf, normal_cdf, random_normal
+import pickle
+import random
+from statistics import NormalDist
+from src.statlib.backend import numpy_available, use_backend
+from src.statlib.distributions import (
+    Normal,
+    normal_pdf,
+    normal_cdf,
+    normal_cdf_batch,
+    normal_pdf_batch,
+    normal_ppf,
+    normal_ppf_batch,
+    random_normal,
+)
 from src.statlib.descriptive import mean, stdev
+from hypothesis import given, strategies as st
 
 
 class TestNormalPDF:
@@ -124,6 +139,276 @@ class TestNormalCDF:
             normal_cdf(0, mu=0, sigma=0)
 
 
+class TestNormalBatch:
+    """Test cases for batch PDF and CDF evaluation."""
+
+    POINTS = [-3.5, -1, -0.25, 0, 0.5, 1, 2.75, 8]
+
+    @pytest.mark.parametrize("mu, sigma", [(0, 1), (2.5, 0.5), (-1, 3)])
+    def test_batch_matches_scalar(self, mu, sigma):
+        """Batch results equal the scalar functions point by point."""
+        with use_backend("python"):
+            pdf = normal_pdf_batch(self.POINTS, mu, sigma)
+            cdf = normal_cdf_batch(self.POINTS, mu, sigma)
+
+        assert isinstance(pdf, array.array) and pdf.typecode == "d"
+        assert pdf.tolist() == [normal_pdf(x, mu, sigma) for x in self.POINTS]
+        assert cdf.tolist() == [normal_cdf(x, mu, sigma) for x in self.POINTS]
+
+    def test_batch_buffer_inputs(self):
+        """array.array, memoryview and raw bytes inputs are accepted."""
+        doubles = array.array("d", self.POINTS)
+        expected = [normal_cdf(x) for x in self.POINTS]
+
+        for data in (doubles, memoryview(doubles), doubles.tobytes()):
+            assert normal_cdf_batch(data).tolist() == expected
+            assert normal_pdf_batch(data).tolist() == pytest.approx(
+                [normal_pdf(x) for x in self.POINTS]
+            )
+
+        assert normal_pdf_batch(array.array("i", [0, 1])).tolist() == pytest.approx(
+            [normal_pdf(0), normal_pdf(1)]
+        )
+
+    def test_batch_out_buffer(self):
+        """out= is filled and returned, including in place over the input."""
+        out = array.array("d", bytes(8 * len(self.POINTS)))
+        assert normal_cdf_batch(self.POINTS, out=out) is out
+        assert out.tolist() == [normal_cdf(x) for x in self.POINTS]
+
+        values = array.array("d", self.POINTS)
+        assert normal_pdf_batch(values, out=values) is values
+        assert values.tolist() == pytest.approx([normal_pdf(x) for x in self.POINTS])
+
+    def test_batch_empty(self):
+        """Empty inputs give empty results."""
+        assert len(normal_pdf_batch([])) == 0
+        assert len(normal_cdf_batch(array.array("d"))) == 0
+
+    def test_batch_errors(self):
+        """Invalid sigma and unusable out buffers are rejected."""
+        with pytest.raises(ValueError, match="Sigma must be positive"):
+            normal_pdf_batch([0.0], sigma=0)
+        with pytest.raises(ValueError, match="Sigma must be positive"):
+            normal_cdf_batch([0.0], sigma=-1)
+
+        with pytest.raises(ValueError, match="must hold 2 values"):
+            normal_pdf_batch([0.0, 1.0], out=array.array("d", [0.0]))
+        with pytest.raises(ValueError, match="writable"):
+            normal_cdf_batch([0.0], out=b"\x00" * 8)
+        with pytest.raises(TypeError, match="float64"):
+            normal_pdf_batch([0.0], out=array.array("f", [0.0]))
+        with pytest.raises(TypeError, match="float64"):
+            normal_cdf_batch([0.0], out=[0.0])
+
+    @pytest.mark.skipif(not numpy_available(), reason="NumPy not installed")
+    def test_batch_numpy_backend(self):
+        """The NumPy path agrees with pure Python and fills ndarray outputs."""
+        import numpy as np
+
+        data = array.array("d", [i / 100.0 - 50.0 for i in range(10000)])
+        with use_backend("python"):
+            expected = normal_pdf_batch(data, 1.0, 2.0)
+
+        with use_backend("numpy"):
+            result = normal_pdf_batch(data, 1.0, 2.0)
+            out = np.empty(len(data))
+            assert normal_pdf_batch(data, 1.0, 2.0, out=out) is out
+
+        assert result.tolist() == pytest.approx(expected.tolist(), rel=1e-12)
+        assert out.tolist() == pytest.approx(expected.tolist(), rel=1e-12)
+
+    @given(
+        st.lists(st.floats(min_value=-1e6, max_value=1e6), max_size=50),
+        st.floats(min_value=-100, max_value=100),
+        st.floats(min_value=0.01, max_value=100),
+    )
+    def test_batch_cdf_property(self, points, mu, sigma):
+        """Batch CDF equals a loop of scalar calls."""
+        expected = [normal_cdf(x, mu, sigma) for x in points]
+        assert normal_cdf_batch(points, mu, sigma).tolist() == expected
+
+
+class TestNormalPPF:
+    """Test cases for the inverse normal CDF."""
+
+    def test_ppf_critical_values(self):
+        """Known critical values of the standard normal."""
+        assert normal_ppf(0.5) == 0.0
+        assert normal_ppf(0.975) == pytest.approx(1.959963984540054, rel=1e-15)
+        assert normal_ppf(0.995) == pytest.approx(2.5758293035489004, rel=1e-15)
+        assert normal_ppf(0.025) == pytest.approx(-normal_ppf(0.975), rel=1e-15)
+        assert normal_ppf(0.0) == -math.inf
+        assert normal_ppf(1.0) == math.inf
+
+    @pytest.mark.parametrize("mu, sigma", [(0, 1), (10, 2), (-3, 0.001)])
+    def test_ppf_round_trip(self, mu, sigma):
+        """normal_cdf(normal_ppf(p)) recovers p across the whole range."""
+        probs = [1e-12, 1e-6, 0.001, 0.02, 0.2, 0.5, 0.7, 0.9, 0.99, 1 - 1e-9]
+        for p in probs:
+            x = normal_ppf(p, mu, sigma)
+            assert normal_cdf(x, mu, sigma) == pytest.approx(p, rel=1e-9)
+
+    def test_ppf_inverts_cdf(self):
+        """normal_ppf(normal_cdf(x)) recovers x."""
+        for x in [-5.0, -3.0, -1.0, -0.1, 0.3, 1.0, 2.5, 5.0]:
+            assert normal_ppf(normal_cdf(x)) == pytest.approx(x, rel=1e-9)
+
+    def test_ppf_matches_statistics(self):
+        """Results agree with statistics.NormalDist.inv_cdf."""
+        reference = NormalDist(1.5, 4.0)
+        for i in range(1, 1000):
+            p = i / 1000
+            assert normal_ppf(p, 1.5, 4.0) == pytest.approx(
+                reference.inv_cdf(p), rel=1e-14, abs=1e-14
+            )
+
+    def test_ppf_batch(self):
+        """The batch form equals scalar calls and accepts buffers and out=."""
+        probs = [0.0, 0.001, 0.25, 0.5, 0.9, 1.0]
+        expected = [normal_ppf(p, 2.0, 3.0) for p in probs]
+        assert normal_ppf_batch(probs, 2.0, 3.0).tolist() == expected
+
+        values = array.array("d", probs)
+        assert normal_ppf_batch(values, 2.0, 3.0, out=values) is values
+        assert values.tolist() == expected
+        assert len(normal_ppf_batch([])) == 0
+
+    def test_ppf_errors(self):
+        """Invalid sigma and probabilities are rejected."""
+        with pytest.raises(ValueError, match="Sigma must be positive"):
+            normal_ppf(0.5, sigma=0)
+        with pytest.raises(ValueError, match="Sigma must be positive"):
+            normal_ppf_batch([0.5], sigma=-1)
+        for bad in (-0.1, 1.1, float("nan")):
+            with pytest.raises(ValueError, match="between 0 and 1"):
+                normal_ppf(bad)
+            with pytest.raises(ValueError, match="between 0 and 1"):
+                normal_ppf_batch([0.5, bad])
+
+    @pytest.mark.skipif(not numpy_available(), reason="NumPy not installed")
+    def test_ppf_numpy_array(self):
+        """NumPy arrays are evaluated element-wise, as normal_cdf does."""
+        import numpy as np
+
+        probs = np.array([0.1, 0.5, 0.9])
+        result = normal_ppf(probs, 1.0, 2.0)
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [normal_ppf(p, 1.0, 2.0) for p in probs.tolist()]
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            normal_ppf(np.array([0.5, 2.0]))
+
+    @given(st.floats(min_value=-5, max_value=5))
+    def test_ppf_round_trip_property(self, x):
+        """normal_ppf inverts normal_cdf where the CDF keeps its precision."""
+        assert normal_ppf(normal_cdf(x)) == pytest.approx(x, rel=1e-8, abs=1e-9)
+
+
+class TestNormalDistribution:
+    """Test cases for the frozen Normal distribution object."""
+
+    def test_normal_matches_free_functions(self):
+        """pdf and cdf agree with normal_pdf and normal_cdf."""
+        dist = Normal(2.0, 0.5)
+        for x in [-1.0, 1.5, 2.0, 2.25, 4.0]:
+            assert dist.pdf(x) == normal_pdf(x, 2.0, 0.5)
+            assert dist.cdf(x) == pytest.approx(normal_cdf(x, 2.0, 0.5), abs=1e-15)
+            assert dist.sf(x) == pytest.approx(1 - dist.cdf(x), abs=1e-15)
+            assert dist.logpdf(x) == pytest.approx(math.log(dist.pdf(x)))
+            assert dist.logcdf(x) == pytest.approx(math.log(dist.cdf(x)))
+
+    def test_normal_tails(self):
+        """Log-densities stay finite and the tails keep relative precision."""
+        dist = Normal()
+        assert dist.pdf(40) == 0.0
+        assert dist.logpdf(40) == pytest.approx(-800 - 0.5 * math.log(2 * math.pi))
+        assert normal_cdf(-10) == 0.0
+        assert dist.cdf(-10) == pytest.approx(7.61985302416e-24, rel=1e-10)
+        assert dist.sf(10) == dist.cdf(-10)
+        assert dist.logcdf(-10) == pytest.approx(math.log(dist.cdf(-10)))
+        assert dist.logcdf(10) == pytest.approx(-dist.cdf(-10), rel=1e-12)
+
+        # Beyond where the CDF underflows: log Φ(z) ~ -z²/2 - log(-z) - log √(2π)
+        for z in [-40.0, -100.0, -1e4]:
+            asymptotic = -z * z / 2 - math.log(-z) - 0.5 * math.log(2 * math.pi)
+            assert dist.logcdf(z) == pytest.approx(asymptotic, rel=1e-6)
+        assert dist.logcdf(-30.000001) == pytest.approx(dist.logcdf(-29.999999))
+
+    def test_normal_ppf(self):
+        """ppf inverts the CDF, agreeing with statistics.NormalDist."""
+        dist = Normal(3.0, 2.0)
+        reference = NormalDist(3.0, 2.0)
+        for p in [1e-300, 1e-10, 0.01, 0.3, 0.5, 0.8, 0.999, 1 - 1e-12]:
+            assert dist.ppf(p) == pytest.approx(reference.inv_cdf(p), rel=1e-14)
+        assert dist.ppf(0.0) == -math.inf
+        assert dist.ppf(1.0) == math.inf
+        assert dist.ppf([0.5, 0.975]).tolist() == [dist.ppf(0.5), dist.ppf(0.975)]
+
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            dist.ppf(1.5)
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            dist.ppf([0.5, float("nan")])
+
+    def test_normal_batch(self):
+        """Every method accepts sequences and buffers, and fills out=."""
+        dist = Normal(-1.0, 3.0)
+        points = [-7.0, -1.0, 0.5, 4.0]
+        doubles = array.array("d", points)
+        for method in (dist.pdf, dist.logpdf, dist.cdf, dist.logcdf, dist.sf):
+            expected = [method(x) for x in points]
+            assert method(points).tolist() == pytest.approx(expected, rel=1e-14)
+            out = array.array("d", bytes(8 * len(points)))
+            assert method(memoryview(doubles), out=out) is out
+            assert out.tolist() == pytest.approx(expected, rel=1e-14)
+
+    @pytest.mark.skipif(not numpy_available(), reason="NumPy not installed")
+    def test_normal_logpdf_numpy(self):
+        """The NumPy logpdf path agrees with pure Python."""
+        dist = Normal(0.5, 1.5)
+        points = [i / 10.0 for i in range(-5000, 5000)]
+        with use_backend("python"):
+            expected = dist.logpdf(points).tolist()
+        with use_backend("numpy"):
+            assert dist.logpdf(points).tolist() == pytest.approx(expected)
+
+    def test_normal_frozen(self):
+        """Instances are immutable, hashable, comparable and picklable."""
+        dist = Normal(1, 2)
+        assert (dist.mu, dist.sigma, dist.variance) == (1.0, 2.0, 4.0)
+        assert dist == Normal(1.0, 2.0) and dist != Normal(1.0, 3.0)
+        assert hash(dist) == hash(Normal(1.0, 2.0))
+        assert pickle.loads(pickle.dumps(dist)) == dist
+        assert repr(dist) == "Normal(mu=1.0, sigma=2.0)"
+        with pytest.raises(AttributeError):
+            dist.mu = 5.0
+        with pytest.raises(AttributeError):
+            dist.extra = 1
+
+    def test_normal_invalid_parameters(self):
+        """Non-positive sigma and non-finite parameters are rejected."""
+        with pytest.raises(ValueError, match="Sigma must be positive"):
+            Normal(0, 0)
+        with pytest.raises(ValueError, match="finite"):
+            Normal(float("inf"), 1)
+        with pytest.raises(ValueError, match="finite"):
+            Normal(0, float("nan"))
+
+    def test_normal_sample(self):
+        """sample draws the same values as random_normal."""
+        dist = Normal(5, 2)
+        assert dist.sample(10, seed=3) == random_normal(10, 5, 2, seed=3)
+
+    @given(
+        st.floats(min_value=-1e3, max_value=1e3),
+        st.floats(min_value=0.01, max_value=100),
+        st.floats(min_value=1e-12, max_value=1 - 1e-12),
+    )
+    def test_normal_ppf_round_trip_property(self, mu, sigma, p):
+        """cdf(ppf(p)) recovers p."""
+        dist = Normal(mu, sigma)
+        assert dist.cdf(dist.ppf(p)) == pytest.approx(p, rel=1e-9, abs=1e-15)
+
+
 class TestRandomNormal:
     """Test cases for random normal sample generation."""
 
@@ -186,3 +471,126 @@ class TestRandomNormal:
         # Should approximate N(0, 1)
         assert abs(sample_mean - 0) < 0.1
         assert abs(sample_stdev - 1) < 0.1
+
+    @pytest.mark.parametrize("n", [1, 2, 7, 1000])
+    def test_random_normal_default_stream_unchanged(self, n):
+        """The default Box-Muller output for a seed matches the original loop."""
+        random.seed(42)
+        expected = []
+        for _ in range((n + 1) // 2):
+            u1 = random.random()
+            u2 = random.random()
+            z0 = math.sqrt(-2.0 * math.log(u1)) * math.cos(2.0 * math.pi * u2)
+            z1 = math.sqrt(-2.0 * math.log(u1)) * math.sin(2.0 * math.pi * u2)
+            expected.extend([z0 * 2.0 + 3.0, z1 * 2.0 + 3.0])
+
+        assert random_normal(n, 3.0, 2.0, seed=42) == expected[:n]
+        assert random_normal(n, 3.0, 2.0, seed=42, method="box-muller") == expected[:n]
+
+
+class TestRandomNormalMethods:
+    """Test cases for the selectable generation methods."""
+
+    METHODS = ["box-muller", "polar", "ziggurat"]
+
+    @pytest.mark.parametrize("method", METHODS)
+    @pytest.mark.parametrize("n", [1, 2, 3, 1001])
+    def test_method_length_and_reproducibility(self, method, n):
+        """Each method returns n floats, reproducibly per seed."""
+        sample = random_normal(n, seed=9, method=method)
+        assert len(sample) == n
+        assert all(isinstance(x, float) for x in sample)
+        assert random_normal(n, seed=9, method=method) == sample
+
+    def test_methods_give_different_streams(self):
+        """The same seed gives a different stream for each method."""
+        samples = [random_normal(50, seed=1, method=m) for m in self.METHODS]
+        assert samples[0] != samples[1] != samples[2] != samples[0]
+
+    @pytest.mark.parametrize("method", METHODS)
+    def test_method_distribution(self, method):
+        """Moments and tail frequencies match N(mu, sigma²)."""
+        sample = random_normal(200000, mu=5, sigma=2, seed=3, method=method)
+        assert abs(mean(sample) - 5) < 0.02
+        assert abs(stdev(sample) - 2) < 0.02
+
+        standardized = [(x - 5) / 2 for x in sample]
+        for z in [0.5, 1.0, 2.0, 3.0]:
+            share = sum(1 for x in standardized if abs(x) > z) / len(sample)
+            expected = 2 * (1 - normal_cdf(z))
+            assert share == pytest.approx(expected, rel=0.1, abs=0.002)
+
+    def test_ziggurat_tail(self):
+        """The ziggurat samples beyond its base layer edge R = 3.44."""
+        sample = random_normal(400000, seed=8, method="ziggurat")
+        beyond = sum(1 for x in sample if abs(x) > 3.6)
+        expected = len(sample) * 2 * Normal().sf(3.6)
+        assert beyond == pytest.approx(expected, rel=0.2)
+        assert any(x > 3.6 for x in sample) and any(x < -3.6 for x in sample)
+
+    def test_unknown_method_raises_error(self):
+        """Unknown method names are rejected."""
+        with pytest.raises(ValueError, match="Unknown generation method"):
+            random_normal(10, method="inverse")
+
+    def test_normal_sample_method(self):
+        """Normal.sample forwards the method."""
+        dist = Normal(1.0, 0.5)
+        assert dist.sample(20, seed=4, method="polar") == random_normal(
+            20, 1.0, 0.5, seed=4, method="polar"
+        )
+
+
+class TestRandomNormalGenerators:
+    """Test cases for sampling from caller-owned generators."""
+
+    @pytest.mark.parametrize("method", ["box-muller", "polar", "ziggurat"])
+    def test_rng_matches_seed(self, method):
+        """A Random(seed) generator gives the same values as seed=."""
+        rng = random.Random(42)
+        assert random_normal(25, 1.0, 2.0, rng=rng, method=method) == random_normal(
+            25, 1.0, 2.0, seed=42, method=method
+        )
+
+    def test_rng_advances(self):
+        """Successive calls continue the generator's stream."""
+        rng = random.Random(6)
+        first = random_normal(10, rng=rng)
+        second = random_normal(10, rng=rng)
+        assert first + second == random_normal(20, seed=6)
+
+    def test_seeded_call_leaves_global_state(self):
+        """Seeded sampling neither reads nor changes the global generator."""
+        random.seed(123)
+        state = random.getstate()
+        first = random_normal(10, seed=5)
+        assert random.getstate() == state
+
+        random.random()
+        assert random_normal(10, seed=5) == first
+
+    def test_unseeded_uses_global(self):
+        """Without seed or rng, the global generator is used as before."""
+        random.seed(77)
+        first = random_normal(5)
+        random.seed(77)
+        assert random_normal(5) == first
+
+    def test_seed_and_rng_raises_error(self):
+        """seed and rng are mutually exclusive."""
+        with pytest.raises(ValueError, match="either seed or rng"):
+            random_normal(5, seed=1, rng=random.Random(1))
+
+    def test_normal_sample_rng(self):
+        """Normal.sample forwards rng."""
+        assert Normal(2, 3).sample(8, rng=random.Random(1)) == random_normal(
+            8, 2, 3, seed=1
+        )
+
+    @pytest.mark.skipif(not numpy_available(), reason="NumPy not installed")
+    def test_rng_numpy_backend(self):
+        """With NumPy forced, rng seeds NumPy's generator reproducibly."""
+        with use_backend("numpy"):
+            first = random_normal(10, rng=random.Random(3))
+            assert random_normal(10, rng=random.Random(3)) == first
+            assert len(first) == 10
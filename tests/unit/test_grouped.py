@@ -0,0 +1,206 @@
+"""
+Unit tests for grouped statistics module.
+"""
+
+import math
+import tracemalloc
+
+import pytest
+from src.statlib.descriptive import describe, kurtosis, median, skewness
+from src.statlib.grouped import GroupedStats, grouped_describe
+from hypothesis import given, strategies as st
+
+
+def _buckets(keys, values):
+    """Values grouped into lists by key, the approach being replaced."""
+    buckets = {}
+    for key, x in zip(keys, values):
+        buckets.setdefault(key, []).append(x)
+    return buckets
+
+
+def _close(a, b):
+    """Relative comparison that treats NaN as equal to NaN."""
+    return (math.isnan(a) and math.isnan(b)) or math.isclose(a, b, rel_tol=1e-9)
+
+
+class TestGroupedDescribe:
+    """Test cases for grouped_describe."""
+
+    def test_grouped_describe_simple(self):
+        """Test summaries of two small groups."""
+        summary = grouped_describe(["x", "y", "x"], [1.0, 5.0, 3.0])
+        assert list(summary) == ["x", "y"]
+        assert summary["x"]["mean"] == 2.0
+        assert summary["x"]["variance"] == 2.0
+        assert summary["y"]["count"] == 1
+        assert math.isnan(summary["y"]["variance"])
+
+    def test_grouped_describe_matches_describe(self):
+        """Every group agrees with describe() on its bucket."""
+        keys = ["a", "b", "a", "c", "a", "b", "a", "d", "b", "a"]
+        values = [2.5, 10.0, 4.0, -1.0, 3.5, 12.5, 6.0, 7.0, 9.0, 1.0]
+        summary = grouped_describe(iter(keys), iter(values))
+        for key, bucket in _buckets(keys, values).items():
+            expected = describe(bucket)
+            for stat, value in summary[key].items():
+                assert _close(value, expected[stat]), stat
+
+    def test_grouped_describe_with_median(self, rng):
+        """Sketches add a median per group, between the middle values."""
+        keys = [f"host{int(rng.paretovariate(1.2)) % 40}" for _ in range(5000)]
+        values = [rng.gauss(100, 20) for _ in keys]
+        summary = grouped_describe(keys, values, sketch_k=200)
+        for key, bucket in _buckets(keys, values).items():
+            ordered = sorted(bucket)
+            n = len(ordered)
+            estimate = summary[key]["median"]
+            if n > 200:
+                assert abs(estimate - median(bucket)) < 5
+            elif n % 2 == 1:
+                assert estimate == median(bucket)
+            else:
+                assert ordered[n // 2 - 1] <= estimate <= ordered[n // 2]
+
+    def test_grouped_describe_length_mismatch_raises_error(self):
+        """Keys and values must pair up."""
+        with pytest.raises(ValueError, match="same length"):
+            grouped_describe(["a", "b"], [1.0])
+        with pytest.raises(ValueError, match="same length"):
+            grouped_describe(["a"], [1.0, 2.0])
+
+    def test_grouped_describe_empty(self):
+        """No records give no groups."""
+        assert grouped_describe([], []) == {}
+
+
+class TestGroupedStats:
+    """Test cases for the streaming group-by accumulator."""
+
+    def test_push_matches_extend(self):
+        """Single records and bulk records give the same state."""
+        keys = ["x", "y", "x", "z", "y", "x", "x", "y"]
+        values = [1.5, -2.0, 3.25, 8.0, 0.5, 1e6, -7.0, 4.0]
+        pushed = GroupedStats()
+        for key, x in zip(keys, values):
+            pushed.push(key, x)
+        extended = GroupedStats()
+        extended.extend(keys, values)
+        expected = extended.describe()
+        for key, summary in pushed.describe().items():
+            for stat, value in summary.items():
+                assert _close(value, expected[key][stat])
+
+    def test_group_returns_running_stats(self):
+        """group() exposes one group as an independent RunningStats."""
+        stats = GroupedStats()
+        stats.extend(["a", "b", "a", "b"], [1, 10, 3, 30])
+        group = stats.group("a")
+        assert group.mean() == 2.0
+        assert group.variance(sample=False) == 1.0
+        group.push(100)
+        assert stats.count("a") == 2
+        assert "a" in stats and "c" not in stats
+        assert stats.keys() == ["a", "b"]
+        assert len(stats) == 2
+
+    def test_group_shape(self):
+        """Per-group skewness and kurtosis match the batch functions."""
+        keys = ["a", "b"] * 8 + ["c"]
+        values = [1, 40, 2, 38, 2, 41, 3, 45, 5, 39, 8, 60, 13, 37, 21, 42, 7]
+        pushed = GroupedStats()
+        for key, x in zip(keys[:7], values[:7]):
+            pushed.push(key, x)
+        rest = GroupedStats()
+        rest.extend(keys[7:], values[7:])
+        pushed.merge(rest)
+        for key, group in _buckets(keys, values).items():
+            if len(group) < 4:
+                continue
+            stats = pushed.group(key)
+            assert math.isclose(stats.skewness(), skewness(group), abs_tol=1e-9)
+            assert math.isclose(stats.kurtosis(), kurtosis(group), abs_tol=1e-9)
+
+    def test_unknown_group_raises_error(self):
+        """Queries for groups without values raise KeyError."""
+        stats = GroupedStats()
+        with pytest.raises(KeyError):
+            stats.group("missing")
+        with pytest.raises(KeyError):
+            stats.count("missing")
+
+    def test_merge_shards(self):
+        """Merged shard accumulators match one accumulator over all records."""
+        keys = ["a", "b", "a", "c", "b", "a", "c", "a", "b", "d"]
+        values = [3.0, 1e3, 5.0, -2.5, 998.0, 4.0, 0.5, 7.5, 1001.0, 6.0]
+        whole = GroupedStats()
+        whole.extend(keys, values)
+        combined = GroupedStats()
+        for start in range(0, len(keys), 3):
+            shard = GroupedStats()
+            shard.extend(keys[start : start + 3], values[start : start + 3])
+            combined.merge(shard)
+        expected = whole.describe()
+        assert set(combined.keys()) == set(expected)
+        for key, summary in combined.describe().items():
+            for stat, value in summary.items():
+                assert _close(value, expected[key][stat])
+
+    def test_merge_sketches(self):
+        """Sketches are merged per group."""
+        left = GroupedStats(sketch_k=64, seed=1)
+        right = GroupedStats(sketch_k=64, seed=2)
+        left.extend(["a"] * 3, [1, 2, 3])
+        right.extend(["a", "b"], [4, 5])
+        left.merge(right)
+        assert left.sketch("a").count == 4
+        assert left.sketch("b").quantile(0.5) == 5.0
+        assert right.sketch("a").count == 1
+
+    def test_sketch_memory_per_group(self):
+        """Sketches share one generator, so an idle group stays small."""
+        keys = [f"k{i}" for i in range(5000)]
+        tracemalloc.start()
+        try:
+            stats = GroupedStats(sketch_k=200, seed=3)
+            stats.extend(keys, [1.0] * len(keys))
+            used, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert used / len(keys) < 1024
+        assert stats.sketch("k0")._rng is stats.sketch("k1")._rng
+
+    def test_merge_invalid_raises_errors(self):
+        """Only compatible GroupedStats can be merged."""
+        with pytest.raises(TypeError, match="Can only merge with another"):
+            GroupedStats().merge({"a": 1})
+        with pytest.raises(ValueError, match="different sketch_k"):
+            GroupedStats(sketch_k=64).merge(GroupedStats())
+
+    def test_sketch_requires_sketch_k(self):
+        """Quantiles are only available when sketches are kept."""
+        stats = GroupedStats()
+        stats.push("a", 1.0)
+        with pytest.raises(ValueError, match="sketch_k"):
+            stats.sketch("a")
+        with pytest.raises(ValueError, match="k must be at least 8"):
+            GroupedStats(sketch_k=4)
+
+    @given(
+        st.lists(
+            st.tuples(
+                st.integers(min_value=0, max_value=5),
+                st.integers(min_value=-1000, max_value=1000),
+            ),
+            min_size=1,
+            max_size=60,
+        )
+    )
+    def test_min_max_exact(self, pairs):
+        """Per-group extremes are exact."""
+        keys, values = zip(*pairs)
+        summary = grouped_describe(keys, values)
+        for key, bucket in _buckets(keys, values).items():
+            assert summary[key]["min"] == min(bucket)
+            assert summary[key]["max"] == max(bucket)
+            assert summary[key]["count"] == len(bucket)
@@ -0,0 +1,210 @@
+"""
+Unit tests for multivariate statistics module.
+"""
+
+import array
+import math
+
+import pytest
+from src.statlib.backend import use_backend
+from src.statlib.descriptive import mean, variance
+from src.statlib.multivariate import CovarianceStats, corr, cov
+from hypothesis import given, strategies as st
+
+
+def _close(a, b, tol=1e-9):
+    """Relative comparison that treats NaN as equal to NaN."""
+    return (math.isnan(a) and math.isnan(b)) or math.isclose(
+        a, b, rel_tol=tol, abs_tol=tol
+    )
+
+
+def _matrix_close(a, b, tol=1e-9):
+    """Element-wise comparison of two matrices."""
+    return len(a) == len(b) and all(
+        _close(x, y, tol) for row_a, row_b in zip(a, b) for x, y in zip(row_a, row_b)
+    )
+
+
+def _naive_cov(rows, sample=True):
+    """Covariance from its definition, the reference for the tests."""
+    n = len(rows)
+    columns = list(zip(*rows))
+    means = [sum(c) / n for c in columns]
+    divisor = n - 1 if sample else n
+    return [
+        [
+            sum((x - mi) * (y - mj) for x, y in zip(ci, cj)) / divisor
+            for cj, mj in zip(columns, means)
+        ]
+        for ci, mi in zip(columns, means)
+    ]
+
+
+class TestCovariance:
+    """Test cases for cov and CovarianceStats."""
+
+    def test_simple_matrix(self):
+        """Test a small hand-computed covariance matrix."""
+        assert cov([[1, 2], [2, 4], [3, 7]]) == [[1.0, 2.5], [2.5, 19 / 3]]
+        assert cov([[1, 2], [3, 6]], sample=False) == [[1.0, 2.0], [2.0, 4.0]]
+
+    @pytest.mark.parametrize("backend", ["python", "auto"])
+    def test_matches_definition(self, rng, backend):
+        """Blocked accumulation matches the definition and variance()."""
+        # Correlated columns with a large offset, more rows than one block
+        rows = [
+            [1e6 + a, 2 * a + rng.gauss(0, 0.5), rng.uniform(-3, 3)]
+            for a in [rng.gauss(0, 1) for _ in range(9000)]
+        ]
+        with use_backend(backend):
+            result = cov(rows)
+        assert _matrix_close(result, _naive_cov(rows))
+        for j in range(3):
+            column = [row[j] for row in rows]
+            assert math.isclose(result[j][j], variance(column), rel_tol=1e-10)
+
+    def test_push_extend_merge_agree(self, rng):
+        """Single rows, blocks and merged shards give the same state."""
+        # Correlated columns with a large offset, more rows than one block
+        rows = [
+            [1e6 + a, 2 * a + rng.gauss(0, 0.5), rng.uniform(-3, 3)]
+            for a in [rng.gauss(0, 1) for _ in range(9000)]
+        ]
+        pushed = CovarianceStats()
+        for row in rows[:500]:
+            pushed.push(row)
+        shard = CovarianceStats(dimension=3)
+        shard.extend(iter(rows[500:]))
+        pushed.merge(shard)
+        assert pushed.count == len(rows)
+        assert _matrix_close(pushed.covariance(), _naive_cov(rows))
+        expected_means = [mean([row[j] for row in rows]) for j in range(3)]
+        assert all(map(math.isclose, pushed.mean(), expected_means))
+
+    def test_buffer_input(self):
+        """A 2-D buffer gives the same result as rows."""
+        rows = [
+            [1e6 + 0.5, 1.2, -2.0],
+            [1e6 - 1.3, -2.9, 0.7],
+            [1e6 + 2.1, 4.0, 2.5],
+            [1e6 + 0.2, 0.1, -1.1],
+            [1e6 - 0.8, -1.4, 1.9],
+            [1e6 + 1.6, 3.5, -0.4],
+        ]
+        flat = array.array("d", [x for row in rows for x in row])
+        view = memoryview(flat).cast("B").cast("d", [len(rows), 3])
+        assert _matrix_close(cov(view), cov(rows))
+        with pytest.raises(ValueError, match="must be 2-D"):
+            cov(flat)
+
+    def test_workers_agree(self):
+        """Parallel ingestion matches the in-process result."""
+        rows = [
+            [1e6 + 0.5, 1.2, -2.0],
+            [1e6 - 1.3, -2.9, 0.7],
+            [1e6 + 2.1, 4.0, 2.5],
+            [1e6 + 0.2, 0.1, -1.1],
+            [1e6 - 0.8, -1.4, 1.9],
+            [1e6 + 1.6, 3.5, -0.4],
+        ]
+        assert _matrix_close(cov(rows, workers=2), cov(rows))
+        assert _matrix_close(corr(rows, workers=2), corr(rows))
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_generator_input(self, workers):
+        """Rows may come from a generator, as for CovarianceStats.extend."""
+        rows = [[1, 2], [2, 4], [3, 7]]
+        assert cov((row for row in rows), workers=workers) == cov(rows)
+        assert corr(iter(rows), workers=workers) == corr(rows)
+        with pytest.raises(ValueError, match="Cannot compute covariance of empty"):
+            cov(iter([]), workers=workers)
+
+    def test_invalid_rows_raise_errors(self):
+        """Empty data and ragged rows are rejected."""
+        with pytest.raises(ValueError, match="Cannot compute covariance of empty"):
+            cov([])
+        with pytest.raises(ValueError, match="All rows must have 2 values"):
+            cov([[1, 2], [3]])
+        for workers in (1, 2):
+            with pytest.raises(ValueError, match="All rows must have 2 values"):
+                cov([[1, 2], [3], [4, 5, 6]], workers=workers)
+        stats = CovarianceStats()
+        stats.push([1, 2])
+        with pytest.raises(ValueError, match="expected 2"):
+            stats.push([1, 2, 3])
+        with pytest.raises(ValueError, match="at least 2 rows"):
+            stats.covariance()
+        with pytest.raises(ValueError, match="Dimension must be positive"):
+            CovarianceStats(0)
+
+    def test_merge_errors(self):
+        """Only compatible accumulators can be merged."""
+        stats = CovarianceStats()
+        stats.push([1, 2])
+        with pytest.raises(TypeError, match="Can only merge with another"):
+            stats.merge([[1, 2]])
+        other = CovarianceStats()
+        other.push([1, 2, 3])
+        with pytest.raises(ValueError, match="expected 2"):
+            stats.merge(other)
+        stats.merge(CovarianceStats())
+        assert stats.count == 1
+
+
+class TestCorrelation:
+    """Test cases for corr."""
+
+    def test_perfect_correlation(self):
+        """Linear relationships give correlations of plus or minus one."""
+        result = corr([[1, 3, 2], [2, 2, 4], [3, 1, 6]])
+        assert result[0][0] == 1.0
+        assert math.isclose(result[0][1], -1.0)
+        assert math.isclose(result[0][2], 1.0)
+
+    def test_constant_column_is_nan(self):
+        """Correlation with a constant column is undefined."""
+        result = corr([[1, 5], [2, 5], [3, 5]])
+        assert result[0][0] == 1.0
+        assert math.isnan(result[0][1]) and math.isnan(result[1][1])
+
+    def test_nan_input_is_nan(self):
+        """NaN in a column propagates instead of being clamped to 1."""
+        result = corr([[1, 2], [math.nan, 3], [3, 5]])
+        assert math.isnan(result[0][0]) and math.isnan(result[0][1])
+        assert math.isnan(result[1][0])
+        assert result[1][1] == 1.0
+
+    def test_matches_covariance(self):
+        """Correlation is covariance scaled by the standard deviations."""
+        rows = [
+            [1e6 + 0.5, 1.2, -2.0],
+            [1e6 - 1.3, -2.9, 0.7],
+            [1e6 + 2.1, 4.0, 2.5],
+            [1e6 + 0.2, 0.1, -1.1],
+            [1e6 - 0.8, -1.4, 1.9],
+            [1e6 + 1.6, 3.5, -0.4],
+        ]
+        c = cov(rows)
+        r = corr(rows)
+        expected = c[0][1] / math.sqrt(c[0][0] * c[1][1])
+        assert math.isclose(r[0][1], expected, rel_tol=1e-9)
+        assert r[0][1] > 0.9
+
+    @given(
+        st.lists(
+            st.tuples(
+                st.floats(min_value=-1e3, max_value=1e3, allow_nan=False),
+                st.floats(min_value=-1e3, max_value=1e3, allow_nan=False),
+            ),
+            min_size=2,
+            max_size=40,
+        )
+    )
+    def test_bounded_and_symmetric_property(self, pairs):
+        """Correlations lie in [-1, 1] and the matrix is symmetric."""
+        result = corr(pairs)
+        assert _close(result[0][1], result[1][0])
+        for row in result:
+            for r in row:
+                assert math.isnan(r) or -1.0 <= r <= 1.0
@@ -0,0 +1,136 @@
+"""
+Unit tests for the order-statistics container.
+"""
+
+import array
+import math
+import random
+
+import pytest
+from src.statlib.backend import use_backend
+from src.statlib.descriptive import median, quantiles, select, variance
+from src.statlib.orderstats import OrderStatistics
+from hypothesis import given, strategies as st
+
+
+class TestOrderStatistics:
+    """Test cases for OrderStatistics."""
+
+    def test_add_remove_median(self):
+        """Median follows inserts and removals."""
+        stats = OrderStatistics([5, 1, 4])
+        stats.add(2)
+        assert stats.median() == 3.0
+        stats.remove(5)
+        assert stats.median() == 2.0
+        assert list(stats) == [1, 2, 4]
+        assert len(stats) == stats.count == 3
+        assert 4 in stats and 5 not in stats
+
+    def test_rank_and_select(self):
+        """rank counts values <= x and select is 0-based."""
+        stats = OrderStatistics([3, 1, 3, 2])
+        assert stats.rank(0) == 0
+        assert stats.rank(3) == 4
+        assert stats.rank(2.5) == 2
+        assert [stats.select(k) for k in range(4)] == [1.0, 2.0, 3.0, 3.0]
+        assert stats.min() == 1.0 and stats.max() == 3.0
+
+    def test_random_updates_match_free_functions(self):
+        """Many blocks of random inserts and deletes stay consistent."""
+        rng = random.Random(18)
+        stats = OrderStatistics()
+        population = []
+        for step in range(20000):
+            if population and rng.random() < 0.4:
+                x = population.pop(rng.randrange(len(population)))
+                stats.remove(x)
+            else:
+                x = rng.choice([rng.randint(0, 30), rng.gauss(0, 100)])
+                population.append(x)
+                stats.add(x)
+            if step % 1999 == 0:
+                with use_backend("python"):
+                    assert stats.median() == median(population)
+                    probs = [0.01, 0.5, 0.99]
+                    assert stats.quantiles(probs) == quantiles(population, probs)
+                    k = len(population) // 3
+                    assert stats.select(k) == select(population, k)
+                    if len(population) > 1:
+                        assert math.isclose(
+                            stats.variance(), variance(population), rel_tol=1e-9
+                        )
+        assert list(stats) == sorted(population)
+
+    def test_moments_after_deletions(self):
+        """Mean and variance stay exact as the population shrinks and refills."""
+        data = [1e6 + x for x in range(3000)]
+        stats = OrderStatistics(data)
+        for x in data[:2990]:
+            stats.remove(x)
+        rest = data[2990:]
+        assert math.isclose(stats.mean(), sum(rest) / len(rest))
+        assert math.isclose(stats.variance(), variance(rest), rel_tol=1e-9)
+        for x in rest:
+            stats.remove(x)
+        assert len(stats) == 0
+        stats.add(4.0)
+        assert stats.mean() == 4.0
+
+    def test_from_sorted_buffer(self):
+        """Bulk loading from a sorted buffer skips the sort."""
+        values = array.array("d", range(2000))
+        stats = OrderStatistics.from_sorted(values)
+        assert stats.median() == 999.5
+        assert stats.mean() == 999.5
+        with pytest.raises(ValueError, match="must be sorted"):
+            OrderStatistics.from_sorted([1, 3, 2])
+
+    def test_update_bulk_and_small(self):
+        """Large and small batches are both merged in order."""
+        stats = OrderStatistics(range(100))
+        stats.update(range(100, 1100))
+        stats.update([0.5, 1.5])
+        assert len(stats) == 1102
+        assert stats.select(1) == 0.5
+        assert stats.max() == 1099.0
+
+    def test_errors(self):
+        """Missing values, empty queries and NaN are rejected."""
+        stats = OrderStatistics()
+        with pytest.raises(ValueError, match="Cannot compute median of empty"):
+            stats.median()
+        with pytest.raises(ValueError, match="Cannot compute mean of empty"):
+            stats.mean()
+        with pytest.raises(ValueError, match="not found"):
+            stats.remove(1)
+        with pytest.raises(ValueError, match="NaN"):
+            stats.add(math.nan)
+        with pytest.raises(ValueError, match="NaN"):
+            OrderStatistics([1.0, math.nan])
+        stats.add(1)
+        with pytest.raises(ValueError, match="k must be between"):
+            stats.select(1)
+        with pytest.raises(ValueError, match="at least 2"):
+            stats.variance()
+        with pytest.raises(ValueError, match="Unknown quantile method"):
+            stats.quantiles([0.5], method="cubic")
+
+    @given(
+        st.lists(
+            st.floats(min_value=-1e6, max_value=1e6, allow_nan=False),
+            min_size=1,
+            max_size=60,
+        ),
+        st.data(),
+    )
+    def test_matches_sorted_list_property(self, data, draw):
+        """After removing a subset, queries match the remaining values."""
+        stats = OrderStatistics(data)
+        remaining = list(data)
+        for _ in range(draw.draw(st.integers(0, len(data) - 1))):
+            x = remaining.pop(draw.draw(st.integers(0, len(remaining) - 1)))
+            stats.remove(x)
+        with use_backend("python"):
+            assert stats.median() == median(remaining)
+        assert list(stats) == sorted(remaining)
@@ -0,0 +1,130 @@
+"""
+Unit tests for multi-process reductions module.
+"""
+
+import array
+import math
+import random
+
+import pytest
+from src.statlib import parallel
+from src.statlib.backend import use_backend
+from src.statlib.descriptive import describe
+from src.statlib.parallel import histogram, summarize
+
+
+@pytest.fixture(scope="module")
+def values():
+    """Random values spread over several chunks."""
+    rng = random.Random(31)
+    return [rng.gauss(1e6, 25) for _ in range(50001)]
+
+
+class TestSummarize:
+    """Test cases for parallel summary statistics."""
+
+    def test_summarize_simple(self):
+        """Test summary of a short list in worker processes."""
+        summary = summarize([2, 4, 4, 4, 5, 5, 7, 9], workers=2)
+        assert summary["count"] == 8
+        assert summary["mean"] == 5.0
+        assert summary["pstdev"] == 2.0
+        assert summary["range"] == 7.0
+
+    @pytest.mark.parametrize("workers", [1, 2, 3, 8])
+    def test_summarize_matches_describe(self, values, workers):
+        """Merged chunk moments agree with describe() for any worker count."""
+        expected = describe(values)
+        summary = summarize(values, workers=workers)
+        assert set(summary) == set(expected) - {"median"}
+        for key, value in summary.items():
+            assert math.isclose(value, expected[key], rel_tol=1e-9)
+
+    def test_summarize_buffer_pure_python(self, values):
+        """Buffers are summarized without NumPy when the backend is python."""
+        expected = describe(values)
+        with use_backend("python"):
+            summary = summarize(array.array("d", values), workers=2)
+        assert math.isclose(summary["variance"], expected["variance"], rel_tol=1e-9)
+        assert summary["min"] == expected["min"]
+
+    def test_summarize_more_workers_than_values(self):
+        """Workers beyond the number of values are not used."""
+        summary = summarize([1.0, 3.0], workers=8)
+        assert summary["mean"] == 2.0
+        assert summary["variance"] == 2.0
+
+    def test_default_workers_capped_by_size(self, monkeypatch):
+        """Without a worker count, small inputs stay in this process."""
+        monkeypatch.setattr(parallel.os, "cpu_count", lambda: 8)
+        assert parallel._check_workers(None) == 8
+        assert parallel._check_workers(None, 1000) == 1
+        assert parallel._check_workers(None, 3 * parallel._MIN_CHUNK) == 3
+        assert parallel._check_workers(None, 100 * parallel._MIN_CHUNK) == 8
+        assert parallel._check_workers(4, 1000) == 4
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("worker pool started")
+
+        monkeypatch.setattr(parallel, "ProcessPoolExecutor", no_pool)
+        assert summarize([2, 4, 4, 4, 5, 5, 7, 9])["pstdev"] == 2.0
+        assert histogram([1, 2, 2, 3, 4], bins=3)[0] == [1, 2, 2]
+
+    def test_summarize_single_value(self):
+        """Sample statistics of one value are NaN, as in describe()."""
+        summary = summarize([3.0], workers=2)
+        assert summary["pvariance"] == 0.0
+        assert math.isnan(summary["variance"])
+
+    def test_summarize_empty_raises_error(self):
+        """Test that empty input raises ValueError."""
+        with pytest.raises(ValueError, match="Cannot compute summary of empty"):
+            summarize([], workers=2)
+
+    def test_summarize_invalid_workers_raises_error(self):
+        """Worker count must be positive."""
+        with pytest.raises(ValueError, match="workers must be positive"):
+            summarize([1.0], workers=0)
+
+
+class TestHistogram:
+    """Test cases for parallel histograms."""
+
+    def test_histogram_simple(self):
+        """Test bin counts and edges of a short list."""
+        assert histogram([1, 2, 2, 3, 4], bins=3, workers=2) == (
+            [1, 2, 2],
+            [1.0, 2.0, 3.0, 4.0],
+        )
+
+    @pytest.mark.parametrize("backend", ["python", "auto"])
+    def test_histogram_independent_of_workers(self, values, backend):
+        """Merged counts are identical for every worker count."""
+        with use_backend(backend):
+            expected = histogram(values, bins=16, workers=1)
+            for workers in (2, 5):
+                assert histogram(values, bins=16, workers=workers) == expected
+        assert sum(expected[0]) == len(values)
+
+    def test_histogram_explicit_range(self):
+        """Values outside the range are ignored; the upper edge is included."""
+        counts, edges = histogram(
+            [-1, 0, 0.5, 1, 2], bins=2, value_range=(0, 1), workers=2
+        )
+        assert counts == [1, 2]
+        assert edges == [0.0, 0.5, 1.0]
+
+    def test_histogram_constant_data(self):
+        """All-equal values fall in the first bin."""
+        counts, edges = histogram([7.0] * 10, bins=4, workers=1)
+        assert counts == [10, 0, 0, 0]
+        assert edges[0] == 7.0
+
+    def test_histogram_invalid_arguments_raise_errors(self):
+        """Bins, range and input are validated."""
+        with pytest.raises(ValueError, match="Cannot compute histogram of empty"):
+            histogram([], workers=1)
+        with pytest.raises(ValueError, match="bins must be positive"):
+            histogram([1.0], bins=0, workers=1)
+        with pytest.raises(ValueError, match="range must be increasing"):
+            histogram([1.0], value_range=(1, 1), workers=1)
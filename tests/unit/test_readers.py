@@ -0,0 +1,237 @@
+"""
+Unit tests for file readers module.
+"""
+
+import math
+import random
+from array import array
+
+import pytest
+from src.statlib.backend import use_backend
+from src.statlib.descriptive import describe, quantiles
+from src.statlib.readers import (
+    csv_stats,
+    describe_csv,
+    describe_file,
+    file_sketch,
+    file_stats,
+)
+
+
+def _write(path, typecode, values):
+    """Write values as packed native numbers (little-endian on test hosts)."""
+    with open(path, "wb") as f:
+        array(typecode, values).tofile(f)
+    return path
+
+
+@pytest.fixture
+def doubles_file(tmp_path):
+    """A file of random float64 values spanning many chunks."""
+    rng = random.Random(41)
+    values = [rng.gauss(50, 10) for _ in range(20001)]
+    return _write(tmp_path / "doubles.bin", "d", values), values
+
+
+class TestDescribeFile:
+    """Test cases for summaries of binary files."""
+
+    def test_describe_file_simple(self, tmp_path):
+        """Test summary of a short float64 file."""
+        path = _write(tmp_path / "small.bin", "d", [2, 4, 4, 4, 5, 5, 7, 9])
+        summary = describe_file(path)
+        assert summary["count"] == 8
+        assert summary["mean"] == 5.0
+        assert summary["pstdev"] == 2.0
+        assert summary["range"] == 7.0
+
+    @pytest.mark.parametrize("backend", ["python", "auto"])
+    @pytest.mark.parametrize("chunk_size", [1, 1000, 1 << 20])
+    def test_describe_file_matches_describe(self, doubles_file, backend, chunk_size):
+        """Results agree with describe() for any chunk size."""
+        path, values = doubles_file
+        expected = describe(values)
+        with use_backend(backend):
+            summary = describe_file(str(path), chunk_size=chunk_size)
+        assert set(summary) == set(expected) - {"median"}
+        for key, value in summary.items():
+            assert math.isclose(value, expected[key], rel_tol=1e-9)
+
+    @pytest.mark.parametrize(
+        "dtype, typecode", [("int64", "q"), ("int32", "i"), ("float32", "f")]
+    )
+    def test_describe_file_dtypes(self, tmp_path, dtype, typecode):
+        """Integer and single-precision files are read with their width."""
+        path = _write(tmp_path / "values.bin", typecode, range(-5, 11))
+        summary = describe_file(path, dtype=dtype)
+        assert summary["count"] == 16
+        assert summary["mean"] == 2.5
+        assert summary["min"] == -5.0
+        assert summary["max"] == 10.0
+
+    def test_describe_file_empty_raises_error(self, tmp_path):
+        """Test that an empty file raises ValueError."""
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        with pytest.raises(ValueError, match="Cannot compute summary of empty"):
+            describe_file(path)
+
+    def test_partial_value_raises_error(self, tmp_path):
+        """Files must hold whole values of the dtype."""
+        path = tmp_path / "odd.bin"
+        path.write_bytes(b"\x00" * 12)
+        with pytest.raises(ValueError, match="not a whole number of float64"):
+            describe_file(path)
+        assert describe_file(path, dtype="int32")["count"] == 3
+
+    def test_invalid_arguments_raise_errors(self, tmp_path):
+        """Unknown dtypes and chunk sizes are rejected."""
+        path = _write(tmp_path / "small.bin", "d", [1.0])
+        with pytest.raises(ValueError, match="Unknown dtype"):
+            describe_file(path, dtype="complex128")
+        with pytest.raises(ValueError, match="Chunk size must be positive"):
+            describe_file(path, chunk_size=0)
+
+
+class TestFileAccumulators:
+    """Test cases for streaming accumulators built from files."""
+
+    def test_file_stats_merge_across_files(self, tmp_path):
+        """Accumulators of separate files merge into the combined summary."""
+        left = _write(tmp_path / "left.bin", "d", [1, 2])
+        right = _write(tmp_path / "right.bin", "d", [3, 4, 5])
+        stats = file_stats(left)
+        stats.merge(file_stats(right))
+        assert stats.count == 5
+        assert stats.variance(sample=False) == 2.0
+
+    def test_file_stats_empty_file(self, tmp_path):
+        """An empty file gives an empty accumulator."""
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        assert file_stats(path).count == 0
+
+    def test_file_sketch_quantiles(self, doubles_file):
+        """The sketch tracks exact quantiles of the file's values."""
+        path, values = doubles_file
+        sketch = file_sketch(path, seed=1, chunk_size=4096)
+        assert sketch.count == len(values)
+        assert sketch.min() == min(values)
+        for estimate, truth in zip(
+            sketch.quantiles([0.1, 0.5, 0.9]), quantiles(values, [0.1, 0.5, 0.9])
+        ):
+            assert abs(estimate - truth) < 1.0
+
+
+def _write_csv(path, text, encoding="utf-8"):
+    """Write CSV text to a file."""
+    path.write_text(text, encoding=encoding)
+    return path
+
+
+class TestDescribeCsv:
+    """Test cases for streaming CSV column summaries."""
+
+    def test_describe_csv_simple(self, tmp_path):
+        """Test summary of a named column."""
+        path = _write_csv(tmp_path / "s.csv", "name,score\na,2\nb,4\nc,9\n")
+        summary = describe_csv(path, columns=["score"])
+        assert list(summary) == ["score"]
+        assert summary["score"]["mean"] == 5.0
+        assert summary["score"]["count"] == 3
+        assert summary["score"]["invalid"] == 0
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 8192])
+    def test_describe_csv_matches_describe(self, tmp_path, chunk_size):
+        """Every column agrees with describe() for any block size."""
+        rng = random.Random(43)
+        rows = [(rng.gauss(0, 1), rng.randint(-50, 50)) for _ in range(1001)]
+        text = "x,y\n" + "".join(f"{x!r},{y}\n" for x, y in rows)
+        path = _write_csv(tmp_path / "xy.csv", text)
+        summary = describe_csv(path, chunk_size=chunk_size)
+        for column, values in zip(["x", "y"], zip(*rows)):
+            expected = describe(list(values))
+            for key in ("mean", "variance", "min", "max"):
+                assert math.isclose(
+                    summary[column][key], expected[key], rel_tol=1e-9, abs_tol=1e-12
+                )
+
+    def test_describe_csv_index_columns_without_header(self, tmp_path):
+        """Columns are selected by index when there is no header."""
+        path = _write_csv(tmp_path / "n.csv", "1;10\n2;20\n3;30\n")
+        summary = describe_csv(path, columns=[1], delimiter=";", header=False)
+        assert summary[1]["mean"] == 20.0
+        assert describe_csv(path, delimiter=";", header=False)[0]["max"] == 3.0
+
+    def test_describe_csv_skip_invalid_cells(self, tmp_path):
+        """Empty, missing and non-numeric cells are skipped and counted."""
+        path = _write_csv(tmp_path / "bad.csv", "a,b\n1,x\n,2\n3\n5,4\n")
+        summary = describe_csv(path)
+        assert summary["a"]["count"] == 3
+        assert summary["a"]["mean"] == 3.0
+        assert summary["a"]["invalid"] == 1
+        assert summary["b"]["count"] == 2
+        assert summary["b"]["invalid"] == 2
+
+    def test_describe_csv_nan_invalid_cells(self, tmp_path):
+        """on_error='nan' counts invalid cells as NaN."""
+        path = _write_csv(tmp_path / "bad.csv", "a\n1\nx\n3\n")
+        summary = describe_csv(path, on_error="nan")
+        assert summary["a"]["count"] == 3
+        assert summary["a"]["invalid"] == 1
+        assert math.isnan(summary["a"]["mean"])
+
+    def test_describe_csv_raise_invalid_cells(self, tmp_path):
+        """on_error='raise' reports the column and data row."""
+        path = _write_csv(tmp_path / "bad.csv", "a\n1\n2\nx\n")
+        with pytest.raises(ValueError, match="column 'a' on row 3"):
+            describe_csv(path, on_error="raise", chunk_size=2)
+
+    @pytest.mark.parametrize("cell", ["nan", "NaN", "inf", "-Infinity"])
+    def test_describe_csv_non_finite_cells_are_invalid(self, tmp_path, cell):
+        """Cells that parse to NaN or infinity follow on_error."""
+        path = _write_csv(tmp_path / "nf.csv", f"a\n1\n{cell}\n3\n")
+        summary = describe_csv(path)["a"]
+        assert summary["count"] == 2
+        assert summary["mean"] == 2.0
+        assert summary["invalid"] == 1
+        with pytest.raises(ValueError, match="column 'a' on row 2"):
+            describe_csv(path, on_error="raise")
+
+    def test_describe_csv_encoding(self, tmp_path):
+        """Files are read as UTF-8 unless another encoding is given."""
+        text = "größe\n1\n3\n"
+        path = _write_csv(tmp_path / "utf8.csv", text)
+        assert describe_csv(path)["größe"]["mean"] == 2.0
+        path = _write_csv(tmp_path / "latin1.csv", text, encoding="latin-1")
+        summary = describe_csv(path, encoding="latin-1")
+        assert summary["größe"]["mean"] == 2.0
+
+    def test_describe_csv_column_without_values(self, tmp_path):
+        """A column with no valid values has NaN statistics."""
+        path = _write_csv(tmp_path / "names.csv", "name\nann\nbob\n")
+        summary = describe_csv(path)["name"]
+        assert summary["count"] == 0
+        assert summary["invalid"] == 2
+        assert math.isnan(summary["mean"])
+
+    def test_csv_stats_returns_accumulators(self, tmp_path):
+        """Per-column accumulators can be merged across files."""
+        left = _write_csv(tmp_path / "l.csv", "v\n1\n2\n")
+        right = _write_csv(tmp_path / "r.csv", "v\n3\n4\n5\n")
+        stats, invalid = csv_stats(left)["v"]
+        stats.merge(csv_stats(right)["v"][0])
+        assert invalid == 0
+        assert stats.variance(sample=False) == 2.0
+
+    def test_describe_csv_invalid_arguments_raise_errors(self, tmp_path):
+        """Unknown columns and options are rejected."""
+        path = _write_csv(tmp_path / "s.csv", "a\n1\n")
+        with pytest.raises(ValueError, match="Column not found in header"):
+            describe_csv(path, columns=["b"])
+        with pytest.raises(ValueError, match="Column names require a header"):
+            describe_csv(path, columns=["a"], header=False)
+        with pytest.raises(ValueError, match="Unknown on_error option"):
+            describe_csv(path, on_error="ignore")
+        with pytest.raises(ValueError, match="Chunk size must be positive"):
+            describe_csv(path, chunk_size=0)
@@ -0,0 +1,115 @@
+"""
+Unit tests for bootstrap resampling module.
+"""
+
+import pytest
+from src.statlib.backend import use_backend
+from src.statlib.descriptive import mean, median, stdev, variance
+from src.statlib.resampling import bootstrap
+
+
+def _trimmed_mean(values):
+    """A module-level statistic without a fast path (picklable for workers)."""
+    ordered = sorted(values)
+    cut = len(ordered) // 10
+    return mean(ordered[cut : len(ordered) - cut])
+
+
+# A right-skewed sample, where BCa and percentile intervals differ
+SKEWED = [
+    0.27, 0.79, 0.46, 0.93, 0.98, 0.07, 0.01, 1.82, 0.3, 0.27,
+    5.44, 0.64, 1.81, 0.65, 1.02, 0.16, 1.01, 2.03, 0.74, 1.35,
+    1.11, 0.07, 1.42, 0.89, 0.36, 0.03, 2.01, 0.64, 1.27, 2.11,
+]  # fmt: skip
+
+
+class TestBootstrap:
+    """Test cases for bootstrap confidence intervals."""
+
+    @pytest.mark.parametrize("stat", ["mean", "variance", "stdev", "median"])
+    @pytest.mark.parametrize("method", ["percentile", "bca"])
+    def test_interval_contains_estimate(self, stat, method):
+        """The interval brackets the statistic of the data."""
+        result = bootstrap(stat, SKEWED, n_resamples=2000, method=method, seed=1)
+        assert result["low"] < result["statistic"] < result["high"]
+        assert result["standard_error"] > 0
+
+    def test_statistic_of_data(self):
+        """The reported statistic is the statistic of the whole sample."""
+        assert bootstrap(median, SKEWED, 100, seed=1)["statistic"] == median(SKEWED)
+        assert bootstrap(stdev, SKEWED, 100, seed=1)["statistic"] == stdev(SKEWED)
+
+    def test_standard_error_of_mean(self):
+        """Bootstrap standard error of the mean is close to s / sqrt(n)."""
+        result = bootstrap(mean, SKEWED, n_resamples=5000, seed=2)
+        expected = (variance(SKEWED, sample=False) / len(SKEWED)) ** 0.5
+        assert abs(result["standard_error"] - expected) < 0.05 * expected
+
+    def test_fast_path_matches_generic(self):
+        """Variance fast path draws the same resamples as a generic statistic."""
+        fast = bootstrap(variance, SKEWED, 1500, seed=3)
+        generic = bootstrap(lambda v: variance(v), SKEWED, 1500, seed=3)
+        for key, value in fast.items():
+            assert abs(value - generic[key]) < 1e-9 * abs(value)
+        fast = bootstrap("mean", SKEWED, 1500, seed=3)
+        generic = bootstrap(lambda v: sum(v) / len(v), SKEWED, 1500, seed=3)
+        assert fast == generic
+
+    def test_bca_shifts_skewed_interval(self):
+        """BCa moves the interval of a right-skewed statistic upwards."""
+        percentile = bootstrap("variance", SKEWED, 4000, seed=4)
+        bca = bootstrap("variance", SKEWED, 4000, method="bca", seed=4)
+        assert bca["low"] > percentile["low"]
+        assert bca["high"] > percentile["high"]
+
+    def test_wider_ci_is_wider(self):
+        """A higher confidence level gives a wider interval."""
+        narrow = bootstrap("mean", SKEWED, 2000, ci=0.8, seed=5)
+        wide = bootstrap("mean", SKEWED, 2000, ci=0.99, seed=5)
+        assert wide["low"] < narrow["low"] < narrow["high"] < wide["high"]
+
+    def test_seed_reproducible(self):
+        """The same seed gives the same interval."""
+        first = bootstrap(_trimmed_mean, SKEWED, 1200, seed=6)
+        assert bootstrap(_trimmed_mean, SKEWED, 1200, seed=6) == first
+        assert bootstrap(_trimmed_mean, SKEWED, 1200, seed=7) != first
+
+    def test_workers_do_not_change_result(self):
+        """Per-chunk seeds make the result independent of the worker count."""
+        single = bootstrap(_trimmed_mean, SKEWED, 2500, method="bca", seed=8)
+        pooled = bootstrap(_trimmed_mean, SKEWED, 2500, method="bca", seed=8, workers=2)
+        assert pooled == single
+
+    def test_numpy_backend(self):
+        """The forced NumPy stream is reproducible and agrees statistically."""
+        pytest.importorskip("numpy")
+        expected = bootstrap("mean", SKEWED, 4000, seed=9)
+        with use_backend("numpy"):
+            first = bootstrap("mean", SKEWED, 4000, seed=9)
+            assert bootstrap("mean", SKEWED, 4000, seed=9) == first
+            generic = bootstrap(_trimmed_mean, SKEWED, 200, seed=9)
+        assert abs(first["low"] - expected["low"]) < 0.05
+        assert abs(first["high"] - expected["high"]) < 0.05
+        assert generic["low"] < generic["statistic"] < generic["high"]
+
+    def test_constant_data(self):
+        """Constant data gives a degenerate interval, also with BCa."""
+        result = bootstrap("mean", [3.0] * 10, 200, method="bca", seed=1)
+        assert result["low"] == result["high"] == 3.0
+
+    def test_invalid_arguments_raise_errors(self):
+        """Invalid inputs are rejected."""
+        with pytest.raises(ValueError, match="Cannot bootstrap empty"):
+            bootstrap("mean", [])
+        with pytest.raises(ValueError, match="resamples must be positive"):
+            bootstrap("mean", [1, 2], n_resamples=0)
+        with pytest.raises(ValueError, match="Confidence level"):
+            bootstrap("mean", [1, 2], ci=1.0)
+        with pytest.raises(ValueError, match="Unknown interval method"):
+            bootstrap("mean", [1, 2], method="abc")
+        with pytest.raises(ValueError, match="Unknown statistic"):
+            bootstrap("mode", [1, 2])
+        with pytest.raises(ValueError, match="workers must be positive"):
+            bootstrap("mean", [1, 2], workers=0)
+        with pytest.raises(ValueError, match="at least 2"):
+            bootstrap("variance", [1.0])
@@ -0,0 +1,140 @@
+"""
+Unit tests for independent random streams.
+"""
+
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from src.statlib.descriptive import mean
+from src.statlib.distributions import random_normal
+from src.statlib.rng import SeedSequence, spawn_generators
+from hypothesis import given, strategies as st
+
+
+def _worker_sample(sequence):
+    """Draw a chunk from a sequence's own generator (module-level for pickling)."""
+    return random_normal(1000, rng=sequence.generator(), method="ziggurat")
+
+
+class TestSeedSequence:
+    """Test cases for SeedSequence."""
+
+    def test_reproducible_children(self):
+        """Children depend only on the entropy and their spawn key."""
+        first = [s.generator().random() for s in SeedSequence(5).spawn(4)]
+        second = [s.generator().random() for s in SeedSequence(5).spawn(4)]
+        assert first == second
+        assert len(set(first)) == 4
+
+    def test_child_independent_of_sibling_count(self):
+        """Child i has the same stream however many siblings are spawned."""
+        few = SeedSequence(11).spawn(2)
+        many = SeedSequence(11).spawn(50)
+        for a, b in zip(few, many):
+            assert a.generator().random() == b.generator().random()
+
+    def test_spawn_continues_numbering(self):
+        """Successive spawn calls give new children, not repeats."""
+        root = SeedSequence(3)
+        keys = [s.spawn_key for s in root.spawn(2) + root.spawn(3)]
+        assert keys == [(0,), (1,), (2,), (3,), (4,)]
+
+    def test_nested_spawn(self):
+        """Grandchildren extend their parent's key and differ from it."""
+        child = SeedSequence(3).spawn(1)[0]
+        grandchild = child.spawn(1)[0]
+        assert grandchild.spawn_key == (0, 0)
+        assert grandchild.seed() != child.seed()
+        assert child.seed() != SeedSequence(3).seed()
+
+    def test_different_entropy(self):
+        """Different roots give different children."""
+        assert SeedSequence(1).spawn(1)[0].seed() != SeedSequence(2).spawn(1)[0].seed()
+
+    def test_fresh_entropy(self):
+        """Without entropy, fresh OS entropy is drawn and can be reused."""
+        root = SeedSequence()
+        assert root.entropy != SeedSequence().entropy
+        again = SeedSequence(root.entropy)
+        assert again.spawn(1)[0].seed() == root.spawn(1)[0].seed()
+
+    def test_generator_is_fresh(self):
+        """Each generator() call starts the same stream from the beginning."""
+        sequence = SeedSequence(9)
+        a = sequence.generator()
+        b = sequence.generator()
+        assert a is not b
+        assert [a.random() for _ in range(5)] == [b.random() for _ in range(5)]
+
+    def test_picklable(self):
+        """Sequences survive pickling with their stream."""
+        sequence = SeedSequence(21).spawn(3)[1]
+        restored = pickle.loads(pickle.dumps(sequence))
+        assert restored.spawn_key == (1,)
+        assert restored.seed() == sequence.seed()
+        assert repr(restored) == "SeedSequence(entropy=21, spawn_key=(1,))"
+
+    def test_invalid_arguments(self):
+        """Negative entropy, keys or counts are rejected."""
+        with pytest.raises(ValueError, match="Entropy must be non-negative"):
+            SeedSequence(-1)
+        with pytest.raises(ValueError, match="Spawn key"):
+            SeedSequence(1, spawn_key=(0, -2))
+        with pytest.raises(ValueError, match="non-negative"):
+            SeedSequence(1).spawn(-1)
+
+    @given(st.integers(min_value=0, max_value=2**200), st.integers(0, 20))
+    def test_seed_property(self, entropy, index):
+        """Seeds are 256-bit integers determined by entropy and key."""
+        seed = SeedSequence(entropy, (index,)).seed()
+        assert 0 <= seed < 2**256
+        assert seed == SeedSequence(entropy).spawn(index + 1)[index].seed()
+
+
+class TestSpawnGenerators:
+    """Test cases for spawn_generators and parallel sampling."""
+
+    def test_spawn_generators(self):
+        """spawn_generators matches spawning a SeedSequence."""
+        rngs = spawn_generators(8, 3)
+        expected = [s.generator() for s in SeedSequence(8).spawn(3)]
+        assert all(isinstance(r, random.Random) for r in rngs)
+        assert [r.random() for r in rngs] == [r.random() for r in expected]
+        assert spawn_generators(8, 0) == []
+
+    def test_streams_uncorrelated(self):
+        """Sibling streams are not correlated."""
+        a, b = spawn_generators(0, 2)
+        xs = [a.random() - 0.5 for _ in range(50000)]
+        ys = [b.random() - 0.5 for _ in range(50000)]
+        correlation = (
+            sum(x * y for x, y in zip(xs, ys))
+            / (sum(x * x for x in xs) * sum(y * y for y in ys)) ** 0.5
+        )
+        assert abs(correlation) < 0.02
+
+    def test_thread_pool_order_independent(self):
+        """Thread-pool sampling is reproducible whatever the scheduling."""
+        serial = [
+            random_normal(1000, rng=r, method="ziggurat")
+            for r in spawn_generators(13, 8)
+        ]
+        for workers in (1, 4, 8):
+            sequences = SeedSequence(13).spawn(8)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # Submit in reverse so workers start in a different order
+                futures = {
+                    s.spawn_key: pool.submit(_worker_sample, s) for s in sequences[::-1]
+                }
+                results = [futures[s.spawn_key].result() for s in sequences]
+            assert results == serial
+
+    def test_process_pool(self):
+        """Sequences can be sent to worker processes."""
+        sequences = SeedSequence(17).spawn(2)
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(_worker_sample, sequences))
+        assert results == [_worker_sample(s) for s in sequences]
+        assert abs(mean(results[0] + results[1])) < 0.1
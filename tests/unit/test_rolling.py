@@ -0,0 +1,194 @@
+"""
+Unit tests for rolling (sliding-window) statistics module.
+"""
+
+import pytest
+from src.statlib.descriptive import mean, median, variance, stdev
+from src.statlib.rolling import (
+    rolling_mean,
+    rolling_variance,
+    rolling_stdev,
+    rolling_min,
+    rolling_max,
+    rolling_median,
+)
+from hypothesis import given, strategies as st
+
+
+def _windows(data, window):
+    """Every full window of the data, as lists."""
+    return [data[i : i + window] for i in range(len(data) - window + 1)]
+
+
+class TestRollingMean:
+    """Test cases for rolling mean."""
+
+    def test_rolling_mean_simple(self):
+        """Test rolling mean of a short list."""
+        assert list(rolling_mean([1, 2, 3, 4, 5], window=3)) == [2.0, 3.0, 4.0]
+
+    def test_rolling_mean_matches_batch(self):
+        """Every window matches mean() on the same slice."""
+        data = [12.5, -3.0, 88.1, 0.25, -47.6, 3.3, 19.0, -0.5, 61.2, -99.9, 7.0, 42.0]
+        expected = [mean(w) for w in _windows(data, 5)]
+        result = list(rolling_mean(data, 5))
+        assert len(result) == len(expected)
+        for r, e in zip(result, expected):
+            assert abs(r - e) < 1e-9
+
+    def test_rolling_mean_no_drift(self):
+        """Long streams with large offsets do not drift."""
+        data = [1e9 + (i % 3) for i in range(20000)]
+        result = list(rolling_mean(data, 3))
+        assert result[-1] == mean(data[-3:])
+
+    def test_rolling_mean_short_input(self):
+        """Inputs shorter than the window yield nothing."""
+        assert list(rolling_mean([1, 2], window=3)) == []
+        assert list(rolling_mean([], window=3)) == []
+
+    def test_rolling_mean_is_lazy(self):
+        """Results are produced from a generator without materializing it."""
+        stream = (float(x) for x in range(10**9))
+        result = rolling_mean(stream, 2)
+        assert next(result) == 0.5
+        assert next(result) == 1.5
+
+    def test_rolling_mean_invalid_window_raises_error(self):
+        """Window must be positive, checked on call."""
+        with pytest.raises(ValueError, match="Window size must be positive"):
+            rolling_mean([1, 2, 3], window=0)
+
+
+class TestRollingVariance:
+    """Test cases for rolling variance and standard deviation."""
+
+    def test_rolling_variance_simple(self):
+        """Test rolling sample variance."""
+        assert list(rolling_variance([1, 2, 3, 4, 5, 6], window=5)) == [2.5, 2.5]
+
+    def test_rolling_variance_matches_batch(self):
+        """Every window matches variance() for both variants."""
+        data = [52.1, 38.4, 61.0, 49.9, 50.2, 71.3, 44.8, 29.5, 55.0, 47.7, 63.6, 40.1]
+        for sample in (True, False):
+            expected = [variance(w, sample=sample) for w in _windows(data, 4)]
+            result = list(rolling_variance(data, 4, sample=sample))
+            assert len(result) == len(expected)
+            for r, e in zip(result, expected):
+                assert abs(r - e) < 1e-8
+
+    def test_rolling_variance_constant_windows(self):
+        """Constant windows have zero variance, never negative."""
+        data = [0.1] * 50 + [5.0] * 50
+        result = list(rolling_variance(data, 5))
+        assert all(v >= 0.0 for v in result)
+        assert result[-1] == 0.0
+
+    def test_rolling_stdev_matches_batch(self):
+        """Rolling stdev matches stdev() on each window."""
+        data = [2, 4, 4, 4, 5, 5, 7, 9, 1, 3]
+        expected = [stdev(w, sample=False) for w in _windows(data, 4)]
+        result = list(rolling_stdev(data, 4, sample=False))
+        for r, e in zip(result, expected):
+            assert abs(r - e) < 1e-10
+
+    def test_rolling_variance_sample_window_one_raises_error(self):
+        """Sample variance needs windows of at least 2 values."""
+        with pytest.raises(ValueError, match="Sample variance requires at least 2"):
+            rolling_variance([1, 2, 3], window=1)
+        assert list(rolling_variance([1, 2, 3], window=1, sample=False)) == [
+            0.0,
+            0.0,
+            0.0,
+        ]
+
+    def test_rolling_stdev_invalid_window_raises_error(self):
+        """Window must be positive."""
+        with pytest.raises(ValueError, match="Window size must be positive"):
+            rolling_stdev([1, 2, 3], window=-1)
+
+
+class TestRollingExtremes:
+    """Test cases for rolling minimum and maximum."""
+
+    def test_rolling_min_simple(self):
+        """Test rolling minimum."""
+        assert list(rolling_min([4, 2, 5, 1, 3], window=2)) == [2.0, 2.0, 1.0, 1.0]
+
+    def test_rolling_max_simple(self):
+        """Test rolling maximum."""
+        assert list(rolling_max([4, 2, 5, 1, 3], window=2)) == [4.0, 5.0, 5.0, 3.0]
+
+    def test_rolling_extremes_with_duplicates(self):
+        """Repeated values are handled correctly."""
+        data = [3, 3, 1, 1, 3, 3]
+        assert list(rolling_min(data, 3)) == [1.0, 1.0, 1.0, 1.0]
+        assert list(rolling_max(data, 3)) == [3.0, 3.0, 3.0, 3.0]
+
+    def test_rolling_extremes_window_one(self):
+        """A window of one returns each value."""
+        assert list(rolling_min([5, 1, 4], 1)) == [5.0, 1.0, 4.0]
+
+    def test_rolling_extremes_invalid_window_raises_error(self):
+        """Window must be positive."""
+        with pytest.raises(ValueError, match="Window size must be positive"):
+            rolling_min([1], window=0)
+        with pytest.raises(ValueError, match="Window size must be positive"):
+            rolling_max([1], window=0)
+
+
+class TestRollingMedian:
+    """Test cases for rolling median."""
+
+    def test_rolling_median_simple(self):
+        """Test rolling median with an odd window."""
+        assert list(rolling_median([5, 1, 4, 2, 3], window=3)) == [4.0, 2.0, 3.0]
+
+    def test_rolling_median_even_window(self):
+        """Even windows average the two middle values."""
+        assert list(rolling_median([1, 3, 2, 6, 4], window=2)) == [
+            2.0,
+            2.5,
+            4.0,
+            5.0,
+        ]
+
+    def test_rolling_median_monotonic_stream(self):
+        """Increasing streams keep heap memory bounded and stay correct."""
+        data = list(range(5000))
+        result = list(rolling_median(data, 11))
+        assert result == [median(w) for w in _windows(data, 11)]
+
+    def test_rolling_median_invalid_window_raises_error(self):
+        """Window must be positive."""
+        with pytest.raises(ValueError, match="Window size must be positive"):
+            rolling_median([1, 2], window=0)
+
+
+class TestRollingProperties:
+    """Property-based checks against the batch functions."""
+
+    @given(
+        st.lists(st.integers(min_value=-20, max_value=20), min_size=1, max_size=80),
+        st.integers(min_value=1, max_value=12),
+    )
+    def test_rolling_median_matches_batch(self, data, window):
+        """Rolling median equals median() on every window, duplicates included."""
+        expected = [median(w) for w in _windows(data, window)]
+        assert list(rolling_median(data, window)) == expected
+
+    @given(
+        st.lists(
+            st.floats(
+                allow_nan=False, allow_infinity=False, min_value=-1e6, max_value=1e6
+            ),
+            min_size=1,
+            max_size=80,
+        ),
+        st.integers(min_value=1, max_value=12),
+    )
+    def test_rolling_extremes_match_batch(self, data, window):
+        """Rolling min and max equal min() and max() on every window."""
+        windows = _windows(data, window)
+        assert list(rolling_min(data, window)) == [float(min(w)) for w in windows]
+        assert list(rolling_max(data, window)) == [float(max(w)) for w in windows]
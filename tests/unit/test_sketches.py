@@ -0,0 +1,287 @@
+"""
+Unit tests for approximate streaming sketches module.
+"""
+
+import bisect
+import random
+from collections import Counter
+
+import pytest
+from src.statlib.descriptive import median, quantiles
+from src.statlib.sketches import HeavyHitters, QuantileSketch
+
+
+def _rank_error(sorted_data, value, p):
+    """Normalized distance between the rank of value and p."""
+    return abs(bisect.bisect_right(sorted_data, value) / len(sorted_data) - p)
+
+
+class TestQuantileSketch:
+    """Test cases for the KLL quantile sketch."""
+
+    def test_small_stream_is_exact(self):
+        """Streams that fit the sketch are answered from all values."""
+        sketch = QuantileSketch(seed=1)
+        sketch.extend([5, 1, 4, 2, 3])
+        assert sketch.retained == 5
+        assert sketch.quantiles([0.0, 0.5, 1.0]) == [1.0, 3.0, 5.0]
+
+    def test_median_close_to_exact(self, rng):
+        """Sketch median is within the rank error of median()."""
+        data = [rng.gauss(100, 15) for _ in range(50000)]
+        sketch = QuantileSketch(k=200, seed=2)
+        sketch.extend(data)
+        ordered = sorted(data)
+        estimate = sketch.quantile(0.5)
+        assert _rank_error(ordered, estimate, 0.5) < 0.01
+        assert abs(estimate - median(data)) < 1.0
+
+    def test_quantiles_close_to_exact(self, rng):
+        """Tail quantiles stay within the documented rank error."""
+        data = [rng.expovariate(0.5) for _ in range(50000)]
+        sketch = QuantileSketch(k=200, seed=3)
+        for x in data:
+            sketch.add(x)
+        ordered = sorted(data)
+        probs = [0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+        for p, estimate in zip(probs, sketch.quantiles(probs)):
+            assert _rank_error(ordered, estimate, p) < 0.01
+
+    def test_larger_k_is_more_accurate(self, rng):
+        """Accuracy improves with k at the cost of retained values."""
+        data = [rng.random() for _ in range(100000)]
+        ordered = sorted(data)
+        probs = [i / 20 for i in range(1, 20)]
+        errors = {}
+        sizes = {}
+        for k in (50, 800):
+            sketch = QuantileSketch(k=k, seed=4)
+            sketch.extend(data)
+            errors[k] = max(
+                _rank_error(ordered, q, p)
+                for p, q in zip(probs, sketch.quantiles(probs))
+            )
+            sizes[k] = sketch.retained
+        assert errors[800] < errors[50]
+        assert errors[800] < 0.003
+        assert sizes[50] < sizes[800] < 4 * 800
+
+    def test_memory_is_bounded(self):
+        """Retained values stay bounded as the stream grows."""
+        sketch = QuantileSketch(k=100, seed=5)
+        sketch.extend(range(200000))
+        assert sketch.count == 200000
+        assert sketch.retained < 3 * 100 + 50
+
+    def test_cdf_and_rank(self):
+        """cdf() estimates the fraction of values <= x."""
+        sketch = QuantileSketch(k=200, seed=6)
+        sketch.extend(range(100000))
+        assert abs(sketch.cdf(25000) - 0.25) < 0.01
+        assert abs(sketch.cdf(90000) - 0.90) < 0.01
+        assert sketch.cdf(-1) == 0.0
+        assert sketch.cdf(10**9) == 1.0
+        assert sketch.rank(99999) == 100000
+
+    def test_min_max_exact(self):
+        """Extremes are tracked exactly."""
+        sketch = QuantileSketch(seed=7)
+        sketch.extend([3.5, -2.0, 10.25] * 10000)
+        assert sketch.min() == -2.0
+        assert sketch.max() == 10.25
+        assert sketch.quantiles([0.0, 1.0]) == [-2.0, 10.25]
+
+    def test_merge_matches_exact_quantiles(self, rng):
+        """Merged shard sketches approximate quantiles of the union."""
+        shards = [[rng.uniform(0, 1000) for _ in range(20000)] for _ in range(4)]
+        combined = QuantileSketch(k=200, seed=8)
+        for i, shard in enumerate(shards):
+            part = QuantileSketch(k=200, seed=100 + i)
+            part.extend(shard)
+            combined.merge(part)
+        data = [x for shard in shards for x in shard]
+        ordered = sorted(data)
+        assert combined.count == len(data)
+        exact = quantiles(data, [0.05, 0.5, 0.95])
+        for p, estimate, truth in zip(
+            [0.05, 0.5, 0.95], combined.quantiles([0.05, 0.5, 0.95]), exact
+        ):
+            assert _rank_error(ordered, estimate, p) < 0.01
+            assert abs(estimate - truth) < 15
+
+    def test_merge_leaves_other_unchanged(self):
+        """merge() must not modify its argument."""
+        left = QuantileSketch(seed=1)
+        right = QuantileSketch(seed=2)
+        right.extend(range(1000))
+        before = right.to_bytes()
+        left.merge(right)
+        assert right.to_bytes() == before
+
+    def test_merge_different_k_raises_error(self):
+        """Sketches with different accuracy cannot be merged."""
+        with pytest.raises(ValueError, match="different k"):
+            QuantileSketch(k=100).merge(QuantileSketch(k=200))
+
+    def test_merge_wrong_type_raises_error(self):
+        """Only QuantileSketch instances can be merged."""
+        with pytest.raises(TypeError, match="Can only merge with another"):
+            QuantileSketch().merge([1, 2, 3])
+
+    def test_serialization_round_trip(self):
+        """from_bytes(to_bytes()) reproduces every query."""
+        sketch = QuantileSketch(k=64, seed=9)
+        sketch.extend((i * 7919) % 30011 for i in range(30000))
+        blob = sketch.to_bytes()
+        restored = QuantileSketch.from_bytes(blob)
+        probs = [0.01, 0.5, 0.99]
+        assert restored.k == 64
+        assert restored.count == sketch.count
+        assert restored.retained == sketch.retained
+        assert restored.quantiles(probs) == sketch.quantiles(probs)
+        assert restored.min() == sketch.min()
+        assert len(blob) < 8 * sketch.retained + 200
+
+    def test_serialized_sketches_merge_centrally(self):
+        """Per-host sketches can be shipped as bytes and combined."""
+        hosts = [range(i * 10000, (i + 1) * 10000) for i in range(3)]
+        blobs = []
+        for i, values in enumerate(hosts):
+            sketch = QuantileSketch(seed=i)
+            sketch.extend(values)
+            blobs.append(sketch.to_bytes())
+        central = QuantileSketch.from_bytes(blobs[0])
+        for blob in blobs[1:]:
+            central.merge(QuantileSketch.from_bytes(blob))
+        assert central.count == 30000
+        assert abs(central.quantile(0.5) - 15000) < 300
+
+    def test_empty_serialization_round_trip(self):
+        """An empty sketch serializes and stays empty."""
+        restored = QuantileSketch.from_bytes(QuantileSketch().to_bytes())
+        assert restored.count == 0
+        restored.add(1.0)
+        assert restored.quantile(0.5) == 1.0
+
+    def test_from_bytes_rejects_garbage(self):
+        """Corrupt input raises ValueError."""
+        blob = QuantileSketch().to_bytes()
+        with pytest.raises(ValueError, match="Not a serialized QuantileSketch"):
+            QuantileSketch.from_bytes(b"XXXX" + blob[4:])
+        with pytest.raises(ValueError, match="Truncated"):
+            QuantileSketch.from_bytes(blob[:10])
+        with pytest.raises(ValueError, match="trailing"):
+            QuantileSketch.from_bytes(blob + b"\x00")
+
+    def test_empty_raises_errors(self):
+        """Queries on an empty sketch raise ValueError."""
+        sketch = QuantileSketch()
+        with pytest.raises(ValueError, match="Cannot compute quantiles of empty"):
+            sketch.quantile(0.5)
+        with pytest.raises(ValueError, match="Cannot compute cdf of empty"):
+            sketch.cdf(0.0)
+        with pytest.raises(ValueError, match="Cannot compute minimum of empty"):
+            sketch.min()
+        with pytest.raises(ValueError, match="Cannot compute maximum of empty"):
+            sketch.max()
+
+    def test_shared_rng(self):
+        """A caller-owned generator replaces the seed and is advanced."""
+        generator = random.Random(7)
+        sketch = QuantileSketch(k=16, rng=generator)
+        sketch.extend(range(1000))
+        seeded = QuantileSketch(k=16, seed=7)
+        seeded.extend(range(1000))
+        assert sketch.quantiles([0.25, 0.5]) == seeded.quantiles([0.25, 0.5])
+        assert generator.getstate() != random.Random(7).getstate()
+
+    def test_invalid_arguments_raise_errors(self):
+        """k and probabilities are validated."""
+        with pytest.raises(ValueError, match="k must be at least 8"):
+            QuantileSketch(k=4)
+        with pytest.raises(ValueError, match="either seed or rng"):
+            QuantileSketch(seed=1, rng=random.Random(1))
+        sketch = QuantileSketch()
+        sketch.add(1.0)
+        with pytest.raises(ValueError, match="Probabilities must be between 0"):
+            sketch.quantile(1.5)
+
+
+class TestHeavyHitters:
+    """Test cases for the Misra-Gries heavy-hitters sketch."""
+
+    def test_small_stream_is_exact(self):
+        """With room for every item, counts are exact."""
+        hitters = HeavyHitters(k=10)
+        hitters.extend("abracadabra")
+        assert hitters.top() == [("a", 5), ("b", 2), ("r", 2), ("c", 1), ("d", 1)]
+        assert hitters.error_bound == 0
+        assert hitters.count == 11
+
+    def test_estimates_within_error_bound(self, rng):
+        """Estimates never exceed true counts and are off by at most n/(k+1)."""
+        data = [int(rng.paretovariate(1.0)) for _ in range(100000)]
+        hitters = HeavyHitters(k=50)
+        hitters.extend(data)
+        truth = Counter(data)
+        assert hitters.error_bound <= len(data) / 51
+        for item in truth:
+            estimate = hitters.estimate(item)
+            assert truth[item] - hitters.error_bound <= estimate <= truth[item]
+
+    def test_frequent_items_always_tracked(self, rng):
+        """Items above n/(k+1) occurrences are always among the top items."""
+        data = [int(rng.paretovariate(1.0)) for _ in range(100000)]
+        hitters = HeavyHitters(k=20)
+        for x in data:
+            hitters.add(x)
+        tracked = {item for item, _ in hitters.top()}
+        threshold = len(data) / 21
+        assert {x for x, c in Counter(data).items() if c > threshold} <= tracked
+        assert len(tracked) <= 20
+        assert hitters.top(3)[0][0] == 1
+
+    def test_add_matches_extend_guarantees(self):
+        """Weighted add() respects the same bounds as extend()."""
+        hitters = HeavyHitters(k=2)
+        hitters.add("x", 10)
+        hitters.add("y", 3)
+        hitters.add("z", 1)
+        assert hitters.count == 14
+        assert hitters.estimate("x") >= 10 - hitters.error_bound
+        assert hitters.top(1) == [("x", hitters.estimate("x"))]
+
+    def test_merge_matches_combined_stream(self, rng):
+        """Merged shard sketches keep the error bound of the whole stream."""
+        shards = [[int(rng.paretovariate(1.0)) for _ in range(30000)] for _ in range(4)]
+        combined = HeavyHitters(k=40)
+        for shard in shards:
+            part = HeavyHitters(k=40)
+            part.extend(shard)
+            combined.merge(part)
+        data = [x for shard in shards for x in shard]
+        truth = Counter(data)
+        assert combined.count == len(data)
+        assert combined.error_bound <= len(data) / 41
+        for item, estimate in combined.top():
+            assert truth[item] - combined.error_bound <= estimate <= truth[item]
+
+    def test_merge_leaves_other_unchanged(self):
+        """merge() must not modify its argument."""
+        left, right = HeavyHitters(k=3), HeavyHitters(k=3)
+        right.extend("aaabbc")
+        before = right.top()
+        left.merge(right)
+        assert right.top() == before
+        assert left.top() == before
+
+    def test_invalid_arguments_raise_errors(self):
+        """k, counts and merge partners are validated."""
+        with pytest.raises(ValueError, match="k must be positive"):
+            HeavyHitters(k=0)
+        with pytest.raises(ValueError, match="count must be positive"):
+            HeavyHitters().add("a", 0)
+        with pytest.raises(ValueError, match="different k"):
+            HeavyHitters(k=2).merge(HeavyHitters(k=3))
+        with pytest.raises(TypeError, match="Can only merge with another"):
+            HeavyHitters().merge(Counter("abc"))
@@ -0,0 +1,190 @@
+"""
+Unit tests for streaming statistics module.
+"""
+
+import pytest
+from src.statlib.descriptive import (
+    mean,
+    variance,
+    stdev,
+    data_range,
+    skewness,
+    kurtosis,
+)
+from src.statlib.streaming import RunningStats
+from hypothesis import given, strategies as st
+
+
+class TestRunningStats:
+    """Test cases for the RunningStats accumulator."""
+
+    def test_push_mean_and_variance(self):
+        """Pushing values one at a time gives the batch statistics."""
+        stats = RunningStats()
+        for x in [1, 2, 3, 4, 5]:
+            stats.push(x)
+        assert stats.count == 5
+        assert stats.mean() == 3.0
+        assert abs(stats.variance(sample=True) - 2.5) < 1e-10
+        assert abs(stats.variance(sample=False) - 2.0) < 1e-10
+
+    def test_extend_matches_push(self):
+        """extend() and push() should agree."""
+        data = [2.5, -1.0, 7.25, 3.0, 3.0, 9.5]
+        pushed = RunningStats()
+        for x in data:
+            pushed.push(x)
+        extended = RunningStats()
+        extended.extend(data)
+        assert abs(pushed.mean() - extended.mean()) < 1e-12
+        assert abs(pushed.variance() - extended.variance()) < 1e-12
+
+    def test_extend_accepts_generator(self):
+        """extend() should consume single-pass iterables."""
+        stats = RunningStats()
+        stats.extend(x for x in range(10000))
+        assert stats.count == 10000
+        assert stats.mean() == 4999.5
+        assert abs(stats.variance() - variance(list(range(10000)))) < 1e-6
+
+    def test_constructor_data(self):
+        """Initial data passed to the constructor is accumulated."""
+        stats = RunningStats([1, 2, 3, 4])
+        assert len(stats) == 4
+        assert stats.mean() == 2.5
+
+    def test_min_max_range(self):
+        """Test running minimum, maximum and range."""
+        stats = RunningStats([-5, -2, 0, 3, 10])
+        stats.push(-7)
+        assert stats.min() == -7.0
+        assert stats.max() == 10.0
+        assert stats.data_range() == 17.0
+
+    def test_stdev_is_sqrt_variance(self):
+        """Standard deviation should be the square root of variance."""
+        stats = RunningStats([2, 4, 4, 4, 5, 5, 7, 9])
+        assert abs(stats.stdev(sample=False) - 2.0) < 1e-10
+        assert abs(stats.stdev() - stats.variance() ** 0.5) < 1e-12
+
+    def test_single_value(self):
+        """Population variance of one value is zero, sample is an error."""
+        stats = RunningStats([42])
+        assert stats.variance(sample=False) == 0.0
+        assert stats.data_range() == 0.0
+        with pytest.raises(ValueError, match="Sample variance requires at least 2"):
+            stats.variance(sample=True)
+
+    def test_empty_raises_errors(self):
+        """Queries on an empty accumulator raise like the batch functions."""
+        stats = RunningStats()
+        with pytest.raises(ValueError, match="Cannot compute mean of empty"):
+            stats.mean()
+        with pytest.raises(ValueError, match="Cannot compute variance of empty"):
+            stats.variance()
+        with pytest.raises(
+            ValueError, match="Cannot compute standard deviation of empty"
+        ):
+            stats.stdev()
+        with pytest.raises(ValueError, match="Cannot compute minimum of empty"):
+            stats.min()
+        with pytest.raises(ValueError, match="Cannot compute maximum of empty"):
+            stats.max()
+        with pytest.raises(ValueError, match="Cannot compute range of empty"):
+            stats.data_range()
+
+    def test_merge_shards(self):
+        """Merging shard accumulators matches accumulating everything."""
+        data = [float(x) for x in range(-50, 150, 3)]
+        whole = RunningStats(data)
+        shards = [RunningStats(data[i : i + 7]) for i in range(0, len(data), 7)]
+        combined = RunningStats()
+        for shard in shards:
+            combined.merge(shard)
+        assert combined.count == whole.count
+        assert abs(combined.mean() - whole.mean()) < 1e-10
+        assert abs(combined.variance() - whole.variance()) < 1e-9
+        assert combined.min() == whole.min()
+        assert combined.max() == whole.max()
+
+    def test_shape_push_extend_merge(self):
+        """Skewness and kurtosis agree however values are accumulated."""
+        data = [1e4 + x**1.5 for x in range(200)]
+        pushed = RunningStats()
+        for x in data:
+            pushed.push(x)
+        extended = RunningStats(data)
+        merged = RunningStats(data[:37])
+        merged.merge(RunningStats(data[37:150]))
+        merged.merge(RunningStats(data[150:]))
+        for stats in (pushed, extended, merged):
+            assert abs(stats.skewness() - skewness(data)) < 1e-8
+            assert abs(stats.kurtosis() - kurtosis(data)) < 1e-8
+            assert (
+                abs(stats.kurtosis(sample=False) - kurtosis(data, sample=False)) < 1e-8
+            )
+
+    def test_shape_errors(self):
+        """Shape statistics need enough distinct values."""
+        with pytest.raises(ValueError, match="Cannot compute skewness of empty"):
+            RunningStats().skewness()
+        with pytest.raises(ValueError, match="at least 4"):
+            RunningStats([1, 2, 3]).kurtosis()
+        with pytest.raises(ValueError, match="constant data"):
+            RunningStats([2, 2, 2]).skewness()
+
+    def test_merge_empty(self):
+        """Merging with an empty accumulator is a no-op either way."""
+        stats = RunningStats([1, 2, 3])
+        stats.merge(RunningStats())
+        assert stats.count == 3
+        empty = RunningStats()
+        empty.merge(stats)
+        assert empty.mean() == 2.0
+        assert empty.min() == 1.0
+
+    def test_merge_leaves_other_unchanged(self):
+        """merge() must not modify its argument."""
+        left = RunningStats([1, 2])
+        right = RunningStats([10, 20])
+        left.merge(right)
+        assert right.count == 2
+        assert right.mean() == 15.0
+
+    def test_merge_wrong_type_raises_error(self):
+        """Only RunningStats instances can be merged."""
+        with pytest.raises(TypeError, match="Can only merge with another"):
+            RunningStats().merge([1, 2, 3])
+
+    def test_large_offset_stability(self):
+        """Variance stays accurate when values share a huge offset."""
+        data = [1e9 + x for x in [4, 7, 13, 16]]
+        stats = RunningStats()
+        for x in data:
+            stats.push(x)
+        assert abs(stats.variance() - 30.0) < 1e-6
+
+    @given(
+        st.lists(
+            st.floats(
+                allow_nan=False, allow_infinity=False, min_value=-1e6, max_value=1e6
+            ),
+            min_size=2,
+            max_size=100,
+        ),
+        st.integers(min_value=0, max_value=100),
+    )
+    def test_matches_batch_functions(self, data, split):
+        """Pushed, extended and merged results agree with descriptive."""
+        split = min(split, len(data))
+        left = RunningStats(data[:split])
+        right = RunningStats()
+        for x in data[split:]:
+            right.push(x)
+        left.merge(right)
+
+        tolerance = 1e-9 * max(1.0, max(abs(x) for x in data)) ** 2
+        assert abs(left.mean() - mean(data)) < 1e-9 * max(1.0, abs(mean(data)))
+        assert abs(left.variance() - variance(data)) < tolerance
+        assert abs(left.stdev(sample=False) - stdev(data, sample=False)) < 1e-6
+        assert left.data_range() == data_range(data)
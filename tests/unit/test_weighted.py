@@ -0,0 +1,235 @@
+"""
+Unit tests for weighted statistics module.
+"""
+
+import array
+import math
+import random
+
+import pytest
+from src.statlib.backend import use_backend
+from src.statlib.descriptive import mean, median, quantiles, stdev, variance
+from src.statlib.weighted import (
+    weighted_mean,
+    weighted_median,
+    weighted_quantiles,
+    weighted_stdev,
+    weighted_variance,
+)
+from hypothesis import given, strategies as st
+
+METHODS = [
+    "linear",
+    "lower",
+    "higher",
+    "nearest",
+    "midpoint",
+    "hazen",
+    "weibull",
+    "median_unbiased",
+]
+
+
+def _expand(values, weights):
+    """Repeat each value ``weight`` times, the approach being replaced."""
+    return [x for x, w in zip(values, weights) for _ in range(w)]
+
+
+@pytest.fixture
+def counts():
+    """Random pre-aggregated (value, count) pairs, long enough to partition."""
+    rng = random.Random(16)
+    values = [rng.gauss(50, 10) for _ in range(6000)]
+    weights = [rng.choice([0, 1, 1, 2, 5, 40]) for _ in values]
+    return values, weights
+
+
+class TestWeightedMoments:
+    """Test cases for weighted mean, variance and standard deviation."""
+
+    def test_simple_values(self):
+        """Test small hand-computed examples."""
+        assert weighted_mean([1, 2, 3], [3, 1, 0]) == 1.25
+        assert abs(weighted_variance([1, 2, 3], [1, 2, 1]) - 2 / 3) < 1e-12
+        assert abs(weighted_variance([1, 2, 3], [1, 2, 1], sample=False) - 0.5) < 1e-12
+        assert weighted_stdev([2, 4, 5, 7, 9], [1, 3, 2, 1, 1], sample=False) == 2.0
+
+    def test_matches_expanded_data(self, counts):
+        """Frequency weights give the statistics of the repeated data."""
+        values, weights = counts
+        expanded = _expand(values, weights)
+        assert math.isclose(weighted_mean(values, weights), mean(expanded))
+        for sample in (True, False):
+            assert math.isclose(
+                weighted_variance(values, weights, sample=sample),
+                variance(expanded, sample=sample),
+                rel_tol=1e-10,
+            )
+            assert math.isclose(
+                weighted_stdev(values, weights, sample=sample),
+                stdev(expanded, sample=sample),
+                rel_tol=1e-10,
+            )
+
+    def test_reliability_weights(self):
+        """Reliability weights ignore scale and reduce to variance for equal weights."""
+        data = [1.0, 4.0, 2.5, 8.0]
+        assert math.isclose(
+            weighted_variance(data, [3, 3, 3, 3], weight_type="reliability"),
+            variance(data),
+        )
+        unequal = weighted_variance(data, [1, 2, 3, 4], weight_type="reliability")
+        scaled = weighted_variance(
+            data, [0.1, 0.2, 0.3, 0.4], weight_type="reliability"
+        )
+        assert math.isclose(unequal, scaled)
+        assert (
+            abs(
+                weighted_variance([1, 2, 3], [1, 2, 1], weight_type="reliability") - 0.8
+            )
+            < 1e-12
+        )
+
+    def test_buffers_and_backends_agree(self, counts):
+        """Buffer inputs and both backends give the same moments."""
+        values, weights = counts
+        with use_backend("python"):
+            expected = weighted_variance(values, weights)
+        buffers = (array.array("d", values), array.array("q", weights))
+        assert math.isclose(weighted_variance(*buffers), expected, rel_tol=1e-12)
+        assert math.isclose(weighted_variance(values, weights), expected, rel_tol=1e-12)
+
+    def test_large_offset_stability(self):
+        """Variance stays accurate when values share a huge offset."""
+        values = [1e9 + x for x in [4, 7, 13, 16]]
+        assert math.isclose(weighted_variance(values, [1, 2, 2, 1]), 21.6)
+
+    def test_invalid_inputs_raise_errors(self):
+        """Empty, mismatched, negative and zero-total inputs are rejected."""
+        with pytest.raises(ValueError, match="Cannot compute weighted mean of empty"):
+            weighted_mean([], [])
+        with pytest.raises(ValueError, match="same length"):
+            weighted_mean([1, 2], [1])
+        with pytest.raises(ValueError, match="non-negative"):
+            weighted_variance([1, 2], [1, -1])
+        with pytest.raises(ValueError, match="positive"):
+            weighted_mean([1, 2], [0, 0])
+        with pytest.raises(ValueError, match="Unknown weight type"):
+            weighted_variance([1, 2], [1, 1], weight_type="analytic")
+
+    def test_too_little_weight_raises_error(self):
+        """Sample variance needs more than one unit or point of weight."""
+        with pytest.raises(ValueError, match="total weight above 1"):
+            weighted_variance([1, 2], [0.5, 0.5])
+        with pytest.raises(ValueError, match="at least 2"):
+            weighted_variance([1, 2], [0, 7], weight_type="reliability")
+        assert weighted_variance([1, 2], [0.5, 0.5], sample=False) == 0.25
+
+
+class TestWeightedQuantiles:
+    """Test cases for weighted median and quantiles."""
+
+    def test_weighted_median(self):
+        """Test weighted median with dominant and balanced weights."""
+        assert weighted_median([1, 2, 3, 4], [1, 1, 1, 5]) == 4.0
+        assert weighted_median([1, 2, 3, 4], [1, 1, 1, 1]) == 2.5
+        assert weighted_median([3, 1, 2], [0, 2, 1]) == 1.0
+
+    @pytest.mark.parametrize("method", METHODS)
+    def test_matches_expanded_data(self, counts, method):
+        """Integer weights give the quantiles of the repeated data."""
+        values, weights = counts
+        probs = [0.0, 0.01, 0.25, 0.5, 0.9, 0.999, 1.0]
+        expected = quantiles(_expand(values, weights), probs, method=method)
+        assert weighted_quantiles(values, weights, probs, method=method) == expected
+
+    def test_median_matches_expanded_data(self, counts):
+        """weighted_median equals median of the repeated data exactly."""
+        values, weights = counts
+        assert weighted_median(values, weights) == median(_expand(values, weights))
+
+    def test_fractional_weights(self):
+        """Fractional weights are located on the cumulative weight."""
+        values = [5.0, 1.0, 3.0]
+        weights = [2.5, 1.0, 1.5]
+        assert weighted_quantiles(values, weights, [0.0, 0.5, 1.0]) == [1.0, 3.0, 5.0]
+        assert weighted_quantiles(values, weights, [0.125]) == [2.0]
+
+    def test_fractional_top_is_largest(self):
+        """p=1 gives the largest value even when its weight is below 1."""
+        values = [1.0, 2.0, 3.0]
+        weights = [1.5, 1.0, 0.5]
+        assert weighted_quantiles(values, weights, [0.0, 1.0]) == [1.0, 3.0]
+        assert weighted_quantiles([1, 2, 3], [1.2, 1.1, 0.2], [1.0]) == [3.0]
+
+    @pytest.mark.parametrize("factor", [1e-6, 0.1, 3.0, 1e6])
+    def test_reliability_scale_invariant(self, factor):
+        """Reliability weights give the same quantiles at any scale."""
+        values = [4.0, 1.0, 3.0, 2.0, 5.0]
+        weights = [0.2, 0.3, 0.1, 0.15, 0.25]
+        probs = [0.0, 0.1, 0.5, 0.75, 0.9, 1.0]
+        expected = weighted_quantiles(values, weights, probs, weight_type="reliability")
+        scaled = [w * factor for w in weights]
+        result = weighted_quantiles(values, scaled, probs, weight_type="reliability")
+        assert result == pytest.approx(expected, rel=1e-12)
+        assert (result[0], result[-1]) == (1.0, 5.0)
+
+        assert weighted_median(
+            [1, 2, 3], [0.2, 0.3, 0.5], weight_type="reliability"
+        ) == weighted_median([1, 2, 3], [2, 3, 5], weight_type="reliability")
+
+    def test_reliability_equal_weights(self):
+        """Equal reliability weights give the unweighted quantiles."""
+        values = [7.0, 1.0, 4.0, 2.0, 9.0, 3.0]
+        probs = [0.0, 0.2, 0.5, 0.8, 1.0]
+        result = weighted_quantiles(
+            values, [0.1] * len(values), probs, weight_type="reliability"
+        )
+        assert result == pytest.approx(quantiles(values, probs), rel=1e-12)
+        assert weighted_quantiles(
+            [1, 2, 3], [0.1] * 3, [0.5, 0.9, 1.0], weight_type="reliability"
+        ) == pytest.approx([2.0, 2.8, 3.0])
+
+    def test_frequency_weights_below_one_raise_error(self):
+        """Frequency weights totalling less than one observation are rejected."""
+        with pytest.raises(ValueError, match="reliability"):
+            weighted_quantiles([1, 2, 3], [0.1] * 3, [0.5])
+        with pytest.raises(ValueError, match="Unknown weight type"):
+            weighted_median([1, 2], [1, 1], weight_type="analytic")
+
+    def test_input_not_modified(self, counts):
+        """Selection works on copies."""
+        values, weights = counts
+        before = (list(values), list(weights))
+        weighted_quantiles(array.array("d", values), weights, [0.5, 0.9])
+        assert (values, weights) == before
+
+    def test_invalid_inputs_raise_errors(self):
+        """Test that invalid probabilities, methods and weights are rejected."""
+        with pytest.raises(ValueError, match="Cannot compute weighted quantiles"):
+            weighted_quantiles([], [], [0.5])
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            weighted_quantiles([1], [1], [1.5])
+        with pytest.raises(ValueError, match="Unknown quantile method"):
+            weighted_quantiles([1], [1], [0.5], method="cubic")
+        with pytest.raises(ValueError, match="non-negative"):
+            weighted_median([1, 2], [2, -1])
+
+    @given(
+        st.lists(
+            st.tuples(
+                st.floats(min_value=-1e6, max_value=1e6, allow_nan=False),
+                st.integers(min_value=0, max_value=5),
+            ),
+            min_size=1,
+            max_size=40,
+        ).filter(lambda pairs: any(w for _, w in pairs)),
+        st.lists(st.floats(min_value=0, max_value=1), min_size=1, max_size=5),
+    )
+    def test_expansion_property(self, pairs, probs):
+        """Weighted quantiles equal quantiles of the expanded data."""
+        values = [x for x, _ in pairs]
+        weights = [w for _, w in pairs]
+        expanded = _expand(values, weights)
+        assert weighted_quantiles(values, weights, probs) == quantiles(expanded, probs)
+        assert weighted_median(values, weights) == median(expanded)